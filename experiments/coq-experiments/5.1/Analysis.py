@@ -11,9 +11,10 @@ def analyze(results: str, images: str):
         os.makedirs(images)
 
     # Generate task bucket charts used in Figure 3.
+    figures = []
     for workload in ['BST', 'RBT', 'STLC']:
-        times = partial(stacked_barchart_times, case=workload, df=df)
-        times(
+        spec = partial(stacked_barchart_spec, case=workload, df=df)
+        figures.append(spec(
             strategies=[
                 'TypeBasedGenerator', 'TypeBasedFuzzer', 'SpecificationBasedGenerator',
                 'BespokeGenerator'
@@ -22,12 +23,11 @@ def analyze(results: str, images: str):
             limits=[0.1, 1, 10, 60],
             limit_type='time',
             image_path=images,
-            show=False,
-        )
+        ))
 
     for workload in ['IFC']:
-        times = partial(stacked_barchart_times, case=workload, df=df)
-        times(
+        spec = partial(stacked_barchart_spec, case=workload, df=df)
+        figures.append(spec(
             strategies=[
                 'TypeBasedGenerator', 'TypeBasedFuzzer', 'VariationalFuzzer',
                 'BespokeGenerator'
@@ -36,8 +36,8 @@ def analyze(results: str, images: str):
             limits=[0.1, 1, 10, 60],
             limit_type='time',
             image_path=images,
-            show=False,
-        )
+        ))
+    render_figures(figures)
 
 
 if __name__ == "__main__":
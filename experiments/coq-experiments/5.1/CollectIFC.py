@@ -9,15 +9,15 @@ from benchtool.Coq import Coq
 from benchtool.Types import TrialConfig, ReplaceLevel
 
 
-def collect(results: str):
-    tool = Coq(results=results, replace_level=ReplaceLevel.SKIP)
+def collect(results: str, jobs: int = 1):
+    tool = Coq(results=results, replace_level=ReplaceLevel.SKIP, jobs=jobs)
+
+    todo = []
 
     for workload in tool.all_workloads():
         if workload.name != 'IFC':
             continue
 
-        tool._preprocess(workload)
-
         for variant in tool.all_variants(workload):
 
             if variant.name == 'base':
@@ -26,8 +26,6 @@ def collect(results: str):
             if variant.name in ['OpBRet_8', 'OpBRet_9', 'OpWrite_8', 'OpWrite_9']:
                 continue
 
-            run_trial = None
-
             for strategy in tool.all_strategies(workload):
                 if strategy.name not in [
                         'TypeBasedGenerator',
@@ -45,22 +43,22 @@ def collect(results: str):
                 if f'{file}.json' in finished:
                     continue
 
-                if not run_trial:
-                    run_trial = tool.apply_variant(workload, variant, no_base=True)
-
                 cfg = TrialConfig(workload=workload,
                                   strategy=strategy.name,
                                   property=property,
                                   trials=10,
                                   timeout=60,
                                   short_circuit=True)
-                run_trial(cfg)
+                todo.append((workload, variant, cfg))
+
+    tool.run_all(todo, no_base=True)
 
 
 if __name__ == '__main__':
     p = argparse.ArgumentParser()
     p.add_argument('--data', help='path to folder for JSON data')
+    p.add_argument('--jobs', type=int, default=1, help='number of parallel build jobs')
     args = p.parse_args()
 
     results_path = f'{os.getcwd()}/{args.data}'
-    collect(results_path)
+    collect(results_path, args.jobs)
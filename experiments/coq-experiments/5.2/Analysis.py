@@ -20,16 +20,17 @@ def analyze(results: str, original: str, images: str):
         os.makedirs(images)
 
     # Generate task bucket charts used in Figure 5.
+    figures = []
     for workload in workloads:
-        times = partial(stacked_barchart_times, case=workload, df=df)
-        times(
+        spec = partial(stacked_barchart_spec, case=workload, df=df)
+        figures.append(spec(
             strategies=['Original TypeBasedFuzzer', 'Tuned TypeBasedFuzzer'],
             colors=['#DC5F00', '#DC5F00'],
             limits=[0.1, 1, 10, 60],
             limit_type='time',
             image_path=images,
-            show=False,
-        )
+        ))
+    render_figures(figures)
 
 
 if __name__ == "__main__":
@@ -13,16 +13,17 @@ def analyze(results: str, images: str):
         os.makedirs(images)
 
     # Generate task bucket charts used in Figure 1.
+    figures = []
     for workload in ['BST', 'RBT', 'STLC', 'FSUB']:
-        times = partial(stacked_barchart_times, case=workload, df=df)
-        times(
+        spec = partial(stacked_barchart_spec, case=workload, df=df)
+        figures.append(spec(
             strategies=['Quick', 'Lean', 'Small', 'Correct'],
             colors=['#000000', '#D61C4E', '#6D0E56', '#243763'],
             limits=[0.1, 1, 10, 60],
             limit_type='time',
             image_path=images,
-            show=False,
-        )
+        ))
+    render_figures(figures)
 
     # Compute solve rates.
     dfa = overall_solved(df, 'all').reset_index()
@@ -11,6 +11,8 @@ from benchtool.Tasks import tasks
 def collect(results: str):
     tool = Haskell(results, replace_level=ReplaceLevel.SKIP)
 
+    todo = []
+
     for workload in tool.all_workloads():
         if workload.name not in ['BST', 'RBT', 'STLC', 'FSUB']:
             continue
@@ -20,8 +22,6 @@ def collect(results: str):
                 # Don't run on base (non-buggy) implementation.
                 continue
 
-            run_trial = None
-
             for strategy in tool.all_strategies(workload):
                 if strategy.name not in ['Correct', 'Quick', 'Lean', 'Small']:
                     continue
@@ -47,9 +47,6 @@ def collect(results: str):
                     if f'{file}.json' in finished:
                         continue
 
-                    if not run_trial:
-                        run_trial = tool.apply_variant(workload, variant)
-
                     cfg = TrialConfig(workload=workload,
                                       strategy=strategy.name,
                                       property=property,
@@ -57,7 +54,9 @@ def collect(results: str):
                                       timeout=timeout,
                                       short_circuit=True)
 
-                    run_trial(cfg)
+                    todo.append((workload, variant, cfg))
+
+    tool.run_all(todo)
 
 
 if __name__ == '__main__':
@@ -2,7 +2,7 @@ import argparse
 import os
 
 from benchtool.Haskell import Haskell
-from benchtool.Types import ReplaceLevel, TrialConfig
+from benchtool.Types import ReplaceLevel, SweepPoint, TrialConfig
 from benchtool.Tasks import tasks
 from Tasks import special
 
@@ -12,6 +12,8 @@ from Tasks import special
 def collect(results: str):
     tool = Haskell(results, replace_level=ReplaceLevel.SKIP)
 
+    todo = []
+
     for workload in tool.all_workloads():
         if workload.name != 'BST':
             continue
@@ -20,8 +22,6 @@ def collect(results: str):
             if variant.name == 'base':
                 continue
 
-            run_trial = None
-
             for strategy in tool.all_strategies(workload):
                 if strategy.name != 'Size':
                     continue
@@ -36,28 +36,27 @@ def collect(results: str):
                     task = f'{workload.name},{variant.name},{property}'
                     trials = 100 if task in special else 10
 
-                    for size in range(3, 31, 3):
-                        # Vary size of tree from 3 to 30 nodes, at increments of 3.
-                        os.environ['BSTSIZE'] = str(size)
+                    file = f'{workload.name},{strategy.name},{variant.name},{property}'
 
-                        file = f'{size:02},{workload.name},{strategy.name},{variant.name},{property}'
+                    # Don't compile tasks that are already completed.
+                    finished = set(os.listdir(results))
+                    if f'{file}.json' in finished:
+                        continue
 
-                        # Don't compile tasks that are already completed.
-                        finished = set(os.listdir(results))
-                        if f'{file}.json' in finished:
-                            continue
+                    # Vary size of tree from 3 to 30 nodes, at increments of 3.
+                    # Each runner process goes through every size.
+                    sweep = [SweepPoint(label=f'{strategy.name}{size:02}', size=size) for size in range(3, 31, 3)]
 
-                        if not run_trial:
-                            run_trial = tool.apply_variant(workload, variant)
+                    cfg = TrialConfig(workload=workload,
+                                      strategy=strategy.name,
+                                      property=property,
+                                      trials=trials,
+                                      timeout=65,
+                                      file=file,
+                                      sweep=sweep)
+                    todo.append((workload, variant, cfg))
 
-                        cfg = TrialConfig(workload=workload,
-                                          strategy=strategy.name,
-                                          property=property,
-                                          label=f'{strategy.name}{size:02}',
-                                          trials=trials,
-                                          timeout=65,
-                                          file=file)
-                        run_trial(cfg)
+    tool.run_all(todo)
 
 
 if __name__ == '__main__':
@@ -11,6 +11,8 @@ from benchtool.Tasks import tasks
 def collect(results: str):
     tool = Haskell(results, replace_level=ReplaceLevel.SKIP)
 
+    todo = []
+
     for workload in tool.all_workloads():
         if workload.name not in ['BST', 'RBT']:
             continue
@@ -19,8 +21,6 @@ def collect(results: str):
             if variant.name == 'base':
                 continue
 
-            run_trial = None
-
             for strategy in tool.all_strategies(workload):
                 if strategy.name != 'SmallRev':
                     continue
@@ -40,9 +40,6 @@ def collect(results: str):
                     if f'{file}.json' in finished:
                         continue
 
-                    if not run_trial:
-                        run_trial = tool.apply_variant(workload, variant)
-
                     cfg = TrialConfig(workload=workload,
                                       strategy=strategy.name,
                                       property=property,
@@ -50,7 +47,9 @@ def collect(results: str):
                                       timeout=65,
                                       short_circuit=True)
 
-                    run_trial(cfg)
+                    todo.append((workload, variant, cfg))
+
+    tool.run_all(todo)
 
 
 if __name__ == '__main__':
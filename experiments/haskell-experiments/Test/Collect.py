@@ -10,6 +10,8 @@ from benchtool.Tasks import tasks
 def collect(results: str):
     tool = Haskell(results, replace_level=ReplaceLevel.SKIP)
 
+    todo = []
+
     for workload in tool.all_workloads():
         if workload.name not in ['LuParser']:
             continue
@@ -24,8 +26,6 @@ def collect(results: str):
                     if strategy.name not in ['Random', 'Hybrid', "Correct"]:
                         continue
 
-                    run_trial = None
-
                     # Don't run on non-buggy tasks
                     for property in tool.all_properties(workload):
                         if property.split('_')[2] not in tasks[workload.name][variant.name]:
@@ -37,9 +37,6 @@ def collect(results: str):
                         if f'{file}.json' in finished:
                             continue
 
-                        if not run_trial:
-                            run_trial = tool.apply_variant(workload, variant)
-
                         cfg = TrialConfig(workload=workload,
                                           strategy=strategy.name,
                                           property=property,
@@ -47,7 +44,9 @@ def collect(results: str):
                                           timeout=5,
                                           short_circuit=True)
 
-                        run_trial(cfg)
+                        todo.append((workload, variant, cfg))
+
+    tool.run_all(todo)
 
 
 if __name__ == '__main__':
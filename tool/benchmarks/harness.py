@@ -0,0 +1,88 @@
+'''
+Times each phase of the harness on synthetic workloads (see `benchtool.Synthetic`),
+to catch regressions in orchestration overhead on any Linux machine:
+copying the workloads, parsing variants, applying variants, and running
+trials (spawning runners and writing results).
+
+    python3 tool/benchmarks/harness.py [--mutants=1000] [--trials=100000] [--output=timings.json]
+'''
+
+import argparse
+import json
+import math
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+
+from benchtool.Synthetic import Synthetic, make_workload
+from benchtool.Types import LogLevel, TrialConfig
+
+STRATEGIES = {'Finds': (0, True), 'Misses': (0, False)}
+
+
+@contextmanager
+def phase(timings: dict[str, dict], name: str, count: int):
+    start = time.perf_counter()
+    yield
+    elapsed = time.perf_counter() - start
+    timings[name] = {'seconds': elapsed, 'count': count, 'per_item_ms': 1000 * elapsed / max(1, count)}
+    print(f'{name:<16} {elapsed:10.3f}s {count:>8} x {timings[name]["per_item_ms"]:10.3f}ms')
+
+
+def run(mutants: int, trials: int, properties: int) -> dict[str, dict]:
+    timings = {}
+    os.chdir(tempfile.mkdtemp(prefix='harness'))
+    make_workload('workloads/Synthetic/W', mutants, STRATEGIES, properties)
+
+    with phase(timings, 'copy', 1):
+        tool = Synthetic(os.path.abspath('results'), log_level=LogLevel.ERROR)
+    workload = tool.all_workloads()[0]
+
+    with phase(timings, 'parse variants', 1):
+        variants = [v for v in tool.all_variants(workload) if v.name != 'base']
+
+    strategies = tool.all_strategies(workload)
+    props = tool.all_properties(workload)
+    tasks = len(strategies) * len(props)
+    # Spread the trials over as many mutants as needed.
+    per_task = max(1, math.ceil(trials / (len(variants) * tasks)))
+    used = variants[:max(1, math.ceil(trials / (per_task * tasks)))]
+
+    with phase(timings, 'apply variants', len(variants)):
+        for variant in variants:
+            tool.apply_variant(workload, variant)
+
+    with phase(timings, 'trials', len(used) * tasks * per_task):
+        for variant in used:
+            # Trials run on the variant applied last, so this includes applying it again.
+            run_trial = tool.apply_variant(workload, variant)
+            for strategy in strategies:
+                for prop in props:
+                    run_trial(TrialConfig(workload=workload,
+                                          strategy=strategy.name,
+                                          property=prop,
+                                          trials=per_task))
+
+    files = [e.path for e in os.scandir(tool.results) if e.name.endswith('.json')]
+    with phase(timings, 'load results', len(files)):
+        for file in files:
+            with open(file) as f:
+                json.load(f)
+
+    return timings
+
+
+if __name__ == '__main__':
+    p = argparse.ArgumentParser(description='Time each phase of the harness.')
+    p.add_argument('--mutants', type=int, default=1000)
+    p.add_argument('--trials', type=int, default=100000)
+    p.add_argument('--properties', type=int, default=5)
+    p.add_argument('--output', help='path to write the timings to, as JSON')
+    args = p.parse_args()
+
+    output = os.path.abspath(args.output) if args.output else None
+    timings = run(args.mutants, args.trials, args.properties)
+    if output:
+        with open(output, 'w') as f:
+            json.dump(timings, f, indent=2)
@@ -0,0 +1,91 @@
+'''
+Times importing each module of `benchtool` in a fresh interpreter, and checks
+that the orchestration core only imports the standard library.
+
+    python3 tool/benchmarks/imports.py [--repeat=5] [--output=imports.json]
+
+Exits with an error if a core module imports a third-party package.
+'''
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+
+CORE = [
+    'benchtool.Types',
+    'benchtool.Util',
+    'benchtool.Mutant',
+    'benchtool.BenchTool',
+    'benchtool.Haskell',
+    'benchtool.Coq',
+    'benchtool.Synthetic',
+    'benchtool.Corpus',
+    'benchtool.Scheduler',
+    'benchtool.Preflight',
+    'benchtool.Distributed',
+    'benchtool.Throughput',
+    'benchtool.Telemetry',
+]
+ANALYSIS = ['benchtool.Analysis', 'benchtool.Plot']
+
+# Prints the top-level packages outside the standard library imported by the module
+# (ignoring those imported at startup, e.g. by `.pth` files).
+THIRD_PARTY = '''
+import sys
+before = set(sys.modules)
+import {module}
+print(' '.join(sorted({{m.split('.')[0] for m in set(sys.modules) - before}}
+                      - set(sys.stdlib_module_names) - {{'benchtool', '__mp_main__'}})))
+'''
+
+
+def wall_time(code: str) -> float:
+    start = time.perf_counter()
+    subprocess.run([sys.executable, '-c', code], check=True, capture_output=True)
+    return time.perf_counter() - start
+
+
+def measure(module: str, repeat: int, baseline: float) -> dict:
+    times = [wall_time(f'import {module}') - baseline for _ in range(repeat)]
+    process = subprocess.run([sys.executable, '-c', THIRD_PARTY.format(module=module)],
+                             check=True,
+                             capture_output=True,
+                             text=True)
+    return {'ms': 1000 * statistics.median(times), 'third_party': process.stdout.split()}
+
+
+if __name__ == '__main__':
+    p = argparse.ArgumentParser(description='Time importing each module of benchtool.')
+    p.add_argument('--repeat', type=int, default=5)
+    p.add_argument('--output', help='path to write the timings to, as JSON')
+    args = p.parse_args()
+
+    baseline = statistics.median(wall_time('pass') for _ in range(args.repeat))
+    print(f'{"interpreter startup":<24} {1000 * baseline:8.1f}ms')
+
+    timings = {}
+    problems = []
+    for module in CORE + ANALYSIS:
+        try:
+            timings[module] = measure(module, args.repeat, baseline)
+        except subprocess.CalledProcessError as e:
+            # e.g. the analysis dependencies are not installed.
+            print(f'{module:<24} failed: {e.stderr.decode().strip().splitlines()[-1]}')
+            if module in CORE:
+                problems.append(module)
+            continue
+        third_party = timings[module]['third_party']
+        print(f'{module:<24} {timings[module]["ms"]:8.1f}ms  {" ".join(third_party)}')
+        if module in CORE and third_party:
+            problems.append(module)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({'startup_ms': 1000 * baseline, 'modules': timings}, f, indent=2)
+
+    if problems:
+        print(f'Core modules that fail to import or import third-party packages: {", ".join(problems)}')
+        sys.exit(1)
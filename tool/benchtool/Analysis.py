@@ -2,10 +2,10 @@ import itertools
 import numpy as np
 import os
 import pandas as pd
-import plotly.express as px
-import scipy.stats as sc
 from benchtool.Util import scandir_filter
-from typing import Literal, Optional
+from typing import Iterator, Literal, Optional
+
+KEYS = ['workload', 'strategy', 'task']
 
 
 def parse_results(results: str) -> pd.DataFrame:
@@ -13,7 +13,28 @@ def parse_results(results: str) -> pd.DataFrame:
     entries = [e for e in entries if e.path.endswith('.json')]
 
     df = pd.concat([pd.read_json(e.path, orient='records', typ='frame') for e in entries])
+    return _add_columns(df)
+
+
+def iter_results(results: str, chunk_files: int = 256) -> Iterator[pd.DataFrame]:
+    '''
+    Same rows as `parse_results`, read `chunk_files` results files at a time,
+    with categorical `workload`, `strategy`, `mutant`, `property` and `task`.
+    '''
+    entries = scandir_filter(results, os.path.isfile)
+    entries = sorted(e.path for e in entries if e.path.endswith('.json'))
 
+    for i in range(0, len(entries), chunk_files):
+        df = pd.concat([
+            pd.read_json(path, orient='records', typ='frame') for path in entries[i:i + chunk_files]
+        ])
+        if df.empty:
+            continue
+        df = _add_columns(df)
+        yield df.astype({key: 'category' for key in KEYS + ['mutant', 'property']})
+
+
+def _add_columns(df: pd.DataFrame) -> pd.DataFrame:
     df['inputs'] = df.apply(lambda x: x['passed'] + (1 if x['foundbug'] else 0), axis=1)
     df = df.drop(['passed'], axis=1)
 
@@ -21,6 +42,157 @@ def parse_results(results: str) -> pd.DataFrame:
     return df
 
 
+def parse_throughput(results: str) -> pd.DataFrame:
+    '''
+    Reads the records of `Throughput.throughput` stored in `results`,
+    one row per trial, oldest first.
+    '''
+    path = os.path.join(results, 'throughput')
+    entries = [e for e in scandir_filter(path, os.path.isfile) if e.path.endswith('.json')]
+
+    df = pd.concat([pd.read_json(e.path, orient='records', typ='frame') for e in entries])
+    df['date'] = pd.to_datetime(df['date'])
+    return df.sort_values('date').reset_index(drop=True)
+
+
+def final_budget(df: pd.DataFrame) -> pd.DataFrame:
+    '''
+    Keeps, for each strategy and task, only the trials run with the largest
+    timeout (e.g. the last round of `Scheduler.successive_halving`).
+    Trials that did not find the bug are censored at their `time`.
+    '''
+    if 'timeout' not in df.columns:
+        return df
+
+    # Results without a timeout ran until they finished.
+    timeout = df['timeout'].fillna(np.inf)
+    budget = timeout.groupby([df['strategy'], df['task']]).transform('max')
+    return df[timeout == budget]
+
+
+def survival_data(df: pd.DataFrame, col: str = 'time') -> pd.DataFrame:
+    '''
+    Adds the columns `duration` and `event` (whether the trial found the bug).
+    Trials that did not find the bug (timeouts, cancelled races, exhausted
+    strategies) are right-censored at their `duration`.
+
+    Runners killed at the timeout are censored there. Runners stopped by their
+    CPU limit ran for less, so they are censored at their `walltime`, and dropped
+    if it was not recorded.
+    '''
+    df = df.copy()
+    df['event'] = df['foundbug'].fillna(False).astype(bool)
+
+    cpu_limited = (df['cpu_limited'].fillna(False).astype(bool)
+                   if 'cpu_limited' in df.columns else pd.Series(False, index=df.index))
+    duration = df[col].astype(float)
+    duration = duration.mask(cpu_limited, df['walltime'] if 'walltime' in df.columns else np.nan)
+    if 'timeout' in df.columns:
+        # Runners killed by the watchdog may not record a time.
+        duration = duration.fillna(df['timeout'].mask(cpu_limited))
+    df['duration'] = duration.astype(float)
+
+    return df[df['duration'].notna()]
+
+
+def kaplan_meier(df: pd.DataFrame,
+                 by: list[str] = ['workload', 'strategy', 'task'],
+                 col: str = 'time') -> pd.DataFrame:
+    '''
+    Kaplan-Meier estimate of the probability that each group (by default,
+    each strategy on each task) has not found the bug yet, at every time
+    at which one of its trials ended.
+    '''
+    df = survival_data(df, col)
+
+    km = df.groupby(by + ['duration'], as_index=False).agg(events=('event', 'sum'),
+                                                            ended=('event', 'size'))
+    km = km.sort_values(by + ['duration'])
+
+    # Trials still running at some time are those that end at or after it.
+    km['at_risk'] = km.iloc[::-1].groupby(by)['ended'].cumsum()
+    km['survival'] = 1 - km['events'] / km['at_risk']
+    km['survival'] = km.groupby(by)['survival'].cumprod()
+
+    km = km.rename(columns={'duration': 'time'})
+    return km[by + ['time', 'at_risk', 'events', 'survival']].reset_index(drop=True)
+
+
+def restricted_mean_time(df: pd.DataFrame,
+                         tau: Optional[float] = None,
+                         by: list[str] = ['workload', 'strategy', 'task'],
+                         col: str = 'time') -> pd.DataFrame:
+    '''
+    Restricted mean time to failure of each group, i.e. the area under its
+    Kaplan-Meier curve up to `tau`. A strategy that never finds the bug gets
+    `tau`, so tasks that some strategies failed are not discarded.
+
+    If `tau` is not given, use for each task the longest time that every
+    strategy was observed for, so that no curve is extrapolated.
+    '''
+    km = kaplan_meier(df, by, col)
+
+    if tau is None:
+        task = [c for c in by if c != 'strategy']
+        longest = km.groupby(by)['time'].transform('max')
+        km['tau'] = longest.groupby([km[c] for c in task]).transform('min') if task else longest.min()
+    else:
+        km['tau'] = tau
+
+    # The curve is 1 before the first time, then a step function.
+    start = km['time'].clip(upper=km['tau'])
+    end = km.groupby(by)['time'].shift(-1).fillna(np.inf).clip(upper=km['tau'])
+    km['area'] = km['survival'] * (end - start)
+    km['first'] = start
+
+    rmt = km.groupby(by, as_index=False).agg(area=('area', 'sum'),
+                                             first=('first', 'min'),
+                                             tau=('tau', 'first'))
+    rmt['rmst'] = rmt['area'] + rmt['first']
+    return rmt[by + ['rmst', 'tau']]
+
+
+def value_stats(df: pd.DataFrame, by: list[str] = ['workload', 'strategy']) -> pd.DataFrame:
+    '''
+    Combines the input samples of the trials run with `measure` and `reservoir`
+    (the `valstats` column) into the size and depth of the inputs of each group.
+    '''
+    if 'valstats' not in df.columns:
+        return pd.DataFrame(columns=by + ['count', 'size_mean', 'size_max', 'depth_mean', 'depth_max'])
+
+    df = df[df['valstats'].notna()]
+    stats = pd.DataFrame(df['valstats'].tolist(), index=df.index).drop(columns=['constructors'])
+    stats = pd.concat([df[by], stats], axis=1)
+
+    # Weighted by the size of each sample.
+    stats['size_total'] = stats['size_mean'] * stats['count']
+    stats['depth_total'] = stats['depth_mean'] * stats['count']
+    stats = stats.groupby(by, as_index=False).agg(count=('count', 'sum'),
+                                                  size_total=('size_total', 'sum'),
+                                                  size_max=('size_max', 'max'),
+                                                  depth_total=('depth_total', 'sum'),
+                                                  depth_max=('depth_max', 'max'))
+    stats['size_mean'] = stats['size_total'] / stats['count']
+    stats['depth_mean'] = stats['depth_total'] / stats['count']
+    return stats[by + ['count', 'size_mean', 'size_max', 'depth_mean', 'depth_max']]
+
+
+def constructor_histogram(df: pd.DataFrame, by: list[str] = ['workload', 'strategy']) -> pd.DataFrame:
+    '''
+    Occurrences of each constructor in the input samples of each group,
+    one row per (group, constructor).
+    '''
+    if 'valstats' not in df.columns:
+        return pd.DataFrame(columns=by + ['constructor', 'occurrences'])
+
+    rows = [
+        list(key) + [constructor, n] for key, stats in zip(df[by].itertuples(index=False), df['valstats'])
+        if isinstance(stats, dict) for constructor, n in stats['constructors'].items()
+    ]
+    hist = pd.DataFrame(rows, columns=by + ['constructor', 'occurrences'])
+    return hist.groupby(by + ['constructor'], as_index=False)['occurrences'].sum()
+
+
 def overall_solved(df: pd.DataFrame,
                    agg: Literal['any', 'all'],
                    within: Optional[float] = None,
@@ -62,10 +234,142 @@ def task_average(df: pd.DataFrame, col: str) -> pd.DataFrame:
     return df[[col, std]]
 
 
+def summarize_results(results: str,
+                      cols: list[str] = ['time', 'inputs'],
+                      chunk_files: int = 256) -> pd.DataFrame:
+    '''
+    Streams the results in `results` (see `iter_results`) into one row per
+    (workload, strategy, task), so that only `chunk_files` results files are
+    in memory at a time. The summary has enough to compute `overall_solved`,
+    `task_average` and `solved_buckets` for each column in `cols`:
+
+    - `trials` and `found` (trials that found the bug);
+    - `<col>_n`, `<col>_mean` and `<col>_m2` (sum of squared deviations);
+    - `<col>_solved_min` and `<col>_solved_max`: the smallest and largest value
+      among trials that found the bug, where other trials count as infinite.
+    '''
+    partials = [summarize(df, cols) for df in iter_results(results, chunk_files)]
+    if not partials:
+        return pd.DataFrame(columns=KEYS)
+    return _merge_summaries(pd.concat(partials, ignore_index=True), cols)
+
+
+def summarize(df: pd.DataFrame, cols: list[str] = ['time', 'inputs']) -> pd.DataFrame:
+    '''
+    Same as `summarize_results`, for results already in memory (e.g. from `parse_results`).
+    '''
+    found = df['foundbug'].fillna(False).astype(bool)
+    df = df.assign(found=found)
+    aggs = {'trials': ('found', 'size'), 'found': ('found', 'sum')}
+    for col in cols:
+        values = pd.to_numeric(df[col], errors='coerce')
+        df[f'{col}_solved'] = values.where(found & values.notna(), np.inf)
+        mean = values.groupby([df[key] for key in KEYS], observed=True).transform('mean')
+        df[f'{col}_dev2'] = (values - mean)**2
+        aggs.update({
+            f'{col}_n': (col, 'count'),
+            f'{col}_mean': (col, 'mean'),
+            f'{col}_m2': (f'{col}_dev2', 'sum'),
+            f'{col}_solved_min': (f'{col}_solved', 'min'),
+            f'{col}_solved_max': (f'{col}_solved', 'max'),
+        })
+    return df.groupby(KEYS, observed=True, as_index=False).agg(**aggs)
+
+
+def _merge_summaries(df: pd.DataFrame, cols: list[str]) -> pd.DataFrame:
+    '''
+    Combines rows of the same group from different chunks (e.g. rounds of
+    `Scheduler.successive_halving` stored in separate files), merging the
+    moments with Chan et al.'s parallel algorithm.
+    '''
+    df = df.astype({key: str for key in KEYS})
+    groups = df.groupby(KEYS)
+    merged = groups.agg(trials=('trials', 'sum'), found=('found', 'sum'))
+
+    for col in cols:
+        n = groups[f'{col}_n'].transform('sum')
+        mean = (df[f'{col}_n'] * df[f'{col}_mean']).groupby([df[k] for k in KEYS]).transform('sum') / n
+        deviation = df[f'{col}_n'] * (df[f'{col}_mean'] - mean)**2
+        m2 = df[f'{col}_m2'] + deviation.fillna(0)
+
+        merged[f'{col}_n'] = groups[f'{col}_n'].sum()
+        merged[f'{col}_mean'] = mean.groupby([df[k] for k in KEYS]).first()
+        merged[f'{col}_m2'] = m2.groupby([df[k] for k in KEYS]).sum()
+        merged[f'{col}_solved_min'] = groups[f'{col}_solved_min'].min()
+        merged[f'{col}_solved_max'] = groups[f'{col}_solved_max'].max()
+
+    merged = merged.reset_index()
+    return merged.astype({key: 'category' for key in KEYS})
+
+
+def overall_solved_summary(summary: pd.DataFrame,
+                           agg: Literal['any', 'all'],
+                           within: Optional[float] = None,
+                           solved_type: str = 'time') -> pd.DataFrame:
+    '''
+    Same as `overall_solved`, from the output of `summarize_results`.
+    '''
+    if within:
+        solved = summary[f'{solved_type}_solved_{"min" if agg == "any" else "max"}'] < within
+    else:
+        solved = summary['found'] > 0 if agg == 'any' else summary['found'] == summary['trials']
+
+    df = summary[['workload', 'strategy']].assign(solved=solved, total=1)
+    return df.groupby(['workload', 'strategy'], observed=True).sum()[['solved', 'total']]
+
+
+def task_average_summary(summary: pd.DataFrame, col: str) -> pd.DataFrame:
+    '''
+    Same as `task_average`, from the output of `summarize_results`.
+    '''
+    # Only include tasks where every strategy found the bug.
+    everyone = (summary['found'] == summary['trials']).groupby(summary['task'], observed=True).all()
+    df = summary[summary['task'].isin(everyone[everyone].index)]
+
+    df = summary_average(df, col).set_index(KEYS)
+    return df[[col, col + '_std']]
+
+
+def summary_average(summary: pd.DataFrame, col: str) -> pd.DataFrame:
+    '''
+    Adds the mean and (sample) standard deviation of `col` in each group of
+    the output of `summarize_results`, as `<col>` and `<col>_std`.
+    '''
+    n = summary[f'{col}_n']
+    return summary.assign(**{
+        col: summary[f'{col}_mean'],
+        col + '_std': np.sqrt(summary[f'{col}_m2'] / (n - 1).where(n > 1)),
+    })
+
+
+def solved_buckets(summary: pd.DataFrame,
+                   limits: list[float],
+                   limit_type: str = 'time',
+                   agg: Literal['any', 'all'] = 'all') -> pd.DataFrame:
+    '''
+    Number of tasks each strategy solved within each limit, but not within the
+    previous one, plus the tasks it did not solve within any limit (`rest`),
+    as in `Plot.stacked_barchart_times`.
+    '''
+    totals = overall_solved_summary(summary, agg)['total']
+    buckets = pd.DataFrame(index=totals.index)
+
+    previous = 0
+    for within in limits:
+        solved = overall_solved_summary(summary, agg, within, limit_type)['solved']
+        buckets[within] = solved - previous
+        previous = solved
+    buckets['rest'] = totals - previous
+    return buckets
+
+
 def statistical_differences(df: pd.DataFrame,
                             col: str,
                             alpha: float = 0.05,
                             det: list[str] = []) -> tuple[pd.DataFrame, pd.DataFrame, int]:
+    # Imported here: scipy takes longer to import than the rest of the analysis.
+    import scipy.stats as sc
+
     df = df.copy()
     df = everyone_solved(df)
 
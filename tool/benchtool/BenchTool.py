@@ -1,43 +1,66 @@
-import argparse
+import codecs
+import json
+import math
 import os
-from re import I
+import resource
 import shutil as sh
+import signal
 import subprocess
 import sys
 import tempfile
+import threading
+import time
 from abc import ABC, abstractmethod
 from typing import Callable, Optional
 
-from numpy import var
-
 from benchtool.Mutant import Parser
-from benchtool.Types import (Config, Entry, LogLevel, ReplaceLevel, TrialArgs, TrialConfig, Variant)
-from benchtool.Util import ChangeDir, print_log, scandir_filter, recursive_scandir_filter
+from benchtool.Telemetry import Telemetry
+from benchtool.Types import (BuildStep, Config, Entry, LogLevel, ProcessResult, ReplaceLevel,
+                             ResourceUsage, TrialArgs, TrialConfig, Variant, Watchdog)
+from benchtool.Util import ChangeDir, OutputScanner, print_log, scandir_filter, recursive_scandir_filter
 
 
 class BenchTool(ABC):
     results: str
+    telemetry: Telemetry
     __temp: str
     _log_level: LogLevel = LogLevel.INFO
     _replace_level: ReplaceLevel = ReplaceLevel.REPLACE
+    _jobs: int = 1
+    _watchdog: Watchdog
     _config: Config
     __variant: Optional[Variant]
+    __equivalent: Optional[str]
+    __artifacts: dict[str, dict[str, str]]
+    __hashed_base: set[str]
+    __preprocessed: set[str]
 
     def __init__(self,
                  config: Config,
                  results: str,
                  log_level: LogLevel = LogLevel.INFO,
-                 replace_level: ReplaceLevel = ReplaceLevel.REPLACE):
+                 replace_level: ReplaceLevel = ReplaceLevel.REPLACE,
+                 jobs: int = 1,
+                 watchdog: Optional[Watchdog] = None,
+                 telemetry: Optional[Telemetry] = None):
         self.results = results
         self._config = config
         self._log_level = log_level
         self._replace_level = replace_level
+        self._jobs = max(1, jobs)
+        self._watchdog = watchdog if watchdog else Watchdog()
         self.__temp = tempfile.mkdtemp()
+        self.__equivalent = None
+        self.__artifacts = {}
+        self.__hashed_base = set()
+        self.__preprocessed = set()
 
         try:
             os.mkdir(results)
         except FileExistsError:
             self._log(f'Results directory {results} already exists.', LogLevel.WARNING)
+        self.telemetry = (telemetry if telemetry else
+                          Telemetry(status=os.path.join(results, 'telemetry', 'status.json')))
 
         sh.copytree(self._config.path, os.path.join(self.__temp, self._config.path))
 
@@ -45,6 +68,11 @@ class BenchTool(ABC):
         ''' Sets log level.'''
         self._log_level = log_level
 
+    @property
+    def log_level(self) -> LogLevel:
+        ''' Log level, for code driving the tool that logs along with it. '''
+        return self._log_level
+
     def all_workloads(self) -> list[Entry]:
         '''
         Assumes that all top-level directories in `config.path`
@@ -68,28 +96,177 @@ class BenchTool(ABC):
         p = Parser(self._config)
         return p.extract(p.parse(workload))
 
-    def apply_variant(self, workload: Entry, variant: Variant, no_base=False) -> Callable[[TrialConfig], None]:
+    def apply_variant(self,
+                      workload: Entry,
+                      variant: Variant,
+                      no_base=False,
+                      detect_equivalent=False) -> Callable[[TrialConfig], None]:
         '''
         Overwrites `config.impl` file for `workload` with contents
         of the provided `variant`.
 
+        With `detect_equivalent`, the artifacts built for the variant are hashed
+        (see `_artifact_hash`). A mutant whose artifacts are identical to those of
+        base is flagged and its trials are skipped; one identical to an earlier
+        mutant is flagged and reuses the results of that mutant. Flags are stored
+        in the `equivalent` subdirectory of `results`.
+
         :return: A function that can be used to run a trial.
         '''
 
         if no_base and variant.name == 'base':
             return lambda _: None
 
-        with self._change_dir(self.__temp):
-            self._log(f'Applying variant {variant}', LogLevel.DEBUG)
-            self.__apply_variant_in_impl(workload, variant)
-
-            self._log(f'Building with mutant: {variant.name}', LogLevel.INFO)
-            self._build(workload.path)
+        if detect_equivalent and variant.name != 'base' and workload.name not in self.__hashed_base:
+            # Build base once, to have something to compare mutants against
+            # (even if it cannot be hashed, e.g. because its build failed).
+            for base in self.all_variants(workload):
+                if base.name == 'base':
+                    self.__build_variant(workload, base)
+                    self.__record_artifact(workload, base)
 
+        self.__build_variant(workload, variant)
         self.__variant = variant
+        self.__equivalent = self.__record_artifact(workload, variant) if detect_equivalent else None
 
         return self.__trial
 
+    def run_all(self,
+                todo: list[tuple[Entry, Variant, TrialConfig]],
+                no_base: bool = False) -> None:
+        '''
+        Runs the trials in `todo` in order, building each variant once, before
+        its first trial. They are planned first (see `Telemetry.plan`), so that
+        the telemetry reports the jobs remaining and an ETA.
+        '''
+        self.telemetry.plan(len(todo))
+        run_trial, built = None, None
+        for workload, variant, cfg in todo:
+            if (workload.name, variant.name) != built:
+                run_trial = self.apply_variant(workload, variant, no_base=no_base)
+                built = (workload.name, variant.name)
+            run_trial(cfg)
+
+    def race(self, cfgs: list[TrialConfig], grace: float = 0.0) -> dict[str, Optional[float]]:
+        '''
+        Runs the trials in `cfgs` (e.g. one per strategy, for the same property)
+        concurrently on the current variant, each in its own process and on its
+        own core when possible. Once the first of them finds the bug, the others
+        get `grace` more seconds before they are cancelled.
+
+        Assumes that `apply_variant` was called first. Results are stored in the
+        `race` subdirectory of `results`, so that they are not mixed with the
+        results of full trials; cancelled trials are recorded with `"cancelled": true`
+        and the time they ran for. At most one entrant may be exclusive (see
+        `_exclusive`), since the others would have to wait for it.
+
+        :return: Time to failure of each strategy (by label), or `None`
+                 if it did not find the bug.
+        '''
+        if not self.__variant:
+            raise Exception('Cannot run race without variant')
+        exclusive = [cfg.label if cfg.label else cfg.strategy for cfg in cfgs if self._exclusive(cfg)]
+        if len(exclusive) > 1:
+            raise Exception(f'Cannot race {", ".join(exclusive)}: they cannot run at the same time')
+
+        # Imported here (as in `run_parallel`), since most runs do not need them.
+        import multiprocessing.connection
+
+        results = os.path.join(self.results, 'race')
+        os.makedirs(results, exist_ok=True)
+
+        context = multiprocessing.get_context('fork')
+        cpus = sorted(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else []
+        entrants = {}
+        for i, cfg in enumerate(cfgs):
+            cpu = cpus[i % len(cpus)] if cpus else None
+            entrants[cfg.label if cfg.label else cfg.strategy] = (cfg, context.Process(
+                target=self.__forked_trial, args=(cfg, results, cpu)))
+
+        start = time.monotonic()
+        for _, process in entrants.values():
+            process.start()
+
+        times: dict[str, Optional[float]] = {}
+        deadline = None
+        running = dict(entrants)
+        while running:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            multiprocessing.connection.wait([p.sentinel for _, p in running.values()], timeout)
+
+            for label, (cfg, process) in list(running.items()):
+                if process.is_alive():
+                    continue
+                process.join()
+                del running[label]
+                times[label] = self.__time_to_failure(results, cfg)
+                if times[label] is not None and deadline is None:
+                    self._log(f'{label} found the bug after {times[label]}s', LogLevel.INFO)
+                    deadline = time.monotonic() + grace
+
+            if deadline is not None and time.monotonic() >= deadline:
+                for label, (cfg, process) in running.items():
+                    # The entrant kills its runner on SIGTERM.
+                    process.terminate()
+                    process.join()
+                    times[label] = None
+                    self.__record_cancelled(results, cfg, time.monotonic() - start)
+                    self.telemetry.trial_finished(self.__experiment(cfg), skipped=True)
+                    self._log(f'Cancelled {label}', LogLevel.INFO)
+                running = {}
+
+        return times
+
+    def run_parallel(self, cfgs: list[TrialConfig], results: Optional[str] = None) -> dict[str, int]:
+        '''
+        Runs the trials in `cfgs` on the current variant, up to `jobs` at a time
+        (and exclusive ones one at a time, see `_exclusive`), each in a forked
+        process pinned to its own core when possible.
+
+        Assumes that `apply_variant` was called first. Results are stored in
+        `results` if provided, and in the usual results directory otherwise.
+
+        :return: Exit code of the process of each trial (by results file name);
+                 non-zero if the trial raised an exception.
+        '''
+        if not self.__variant:
+            raise Exception('Cannot run trials without variant')
+
+        import multiprocessing.connection
+
+        results = results if results else self.results
+        os.makedirs(results, exist_ok=True)
+
+        context = multiprocessing.get_context('fork')
+        cpus = sorted(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else []
+        pending = list(enumerate(cfgs))
+        running = {}
+        exclusive = set()
+        codes = {}
+        while pending or running:
+            while len(running) < self._jobs:
+                ready = [job for job in pending if not (exclusive and self._exclusive(job[1]))]
+                if not ready:
+                    break
+                pending.remove(ready[0])
+                i, cfg = ready[0]
+                cpu = cpus[i % len(cpus)] if cpus else None
+                process = context.Process(target=self.__forked_trial, args=(cfg, results, cpu))
+                process.start()
+                running[self.__experiment(cfg)] = process
+                if self._exclusive(cfg):
+                    exclusive.add(self.__experiment(cfg))
+
+            multiprocessing.connection.wait([p.sentinel for p in running.values()])
+            for experiment, process in list(running.items()):
+                if not process.is_alive():
+                    process.join()
+                    codes[experiment] = process.exitcode
+                    del running[experiment]
+                    exclusive.discard(experiment)
+
+        return codes
+
     def all_strategies(self, workload: Entry) -> list[Entry]:
         '''
         Assumes that all files in the `config.strategy` folder of `workload`
@@ -129,15 +306,32 @@ class BenchTool(ABC):
         '''
         pass
 
+    def _artifact_hash(self, workload_path: str) -> Optional[str]:
+        '''
+        Hash of the artifacts built for the current variant, such that variants
+        with the same hash behave identically. `None` if this is not supported.
+        '''
+        return None
+
+    def _exclusive(self, cfg: TrialConfig) -> bool:
+        '''
+        Whether the runner of `cfg` uses state of the build that another exclusive
+        runner would share (e.g. a shared memory segment), so that it cannot run
+        alongside one.
+        '''
+        return False
+
     def _log(self, msg: str, level: LogLevel):
         print_log(msg, level, self._log_level)
 
-    def _shell_command(self, cmd: list[str]) -> None:
+    def _shell_command(self, cmd: list[str]) -> int:
         '''
         Helper for running a subprocess with `subprocess`.
+
+        :return: Exit code of the subprocess.
         '''
         try:
-            subprocess.call(
+            return subprocess.call(
                 cmd,
                 stdout=sys.stdout if self._log_level == LogLevel.DEBUG else subprocess.DEVNULL,
                 stderr=sys.stderr if self._log_level == LogLevel.DEBUG else subprocess.DEVNULL)
@@ -145,6 +339,183 @@ class BenchTool(ABC):
             self._log(f'Error running {cmd}: {e}', LogLevel.ERROR)
             sys.exit(1)
 
+    def _run_process(self,
+                     cmd: list[str],
+                     timeout: Optional[float],
+                     grace: float = 0.0,
+                     env: Optional[dict[str, str]] = None,
+                     scanner: Optional[OutputScanner] = None) -> ProcessResult:
+        '''
+        Runs a trial runner under the watchdog, capturing its output
+        and its resource usage.
+
+        The runner is started in its own process group, with a wall-clock
+        limit of `timeout + grace` seconds and a proportional `RLIMIT_CPU`
+        (inherited by the processes it starts).
+        When the wall-clock limit is exceeded, the whole process group is killed
+        and the result is marked as timed out; when the CPU limit is exceeded,
+        it is marked as `cpu_limited` instead.
+
+        `grace` should be positive for runners that enforce `timeout` themselves.
+        `env` is added to the environment of the runner.
+
+        With a `scanner`, stdout is scanned as it arrives instead of being kept in
+        memory (and stderr is truncated to the same tail length); the runner is
+        killed as soon as the scanner is done, and `stdout` holds `scanner.text()`.
+        '''
+        limit = None if timeout is None else timeout + grace
+        # `prlimit` is Linux only; elsewhere, runners only have the wall-clock limit.
+        cpu = (math.ceil(limit * self._watchdog.cpu_factor)
+               if limit is not None and hasattr(resource, 'prlimit') else None)
+
+        start = time.monotonic()
+        process = subprocess.Popen(cmd,
+                                   stdout=subprocess.PIPE,
+                                   stderr=subprocess.PIPE,
+                                   text=True,
+                                   start_new_session=True,
+                                   env={
+                                       **os.environ,
+                                       **env
+                                   } if env else None)
+        if cpu is not None:
+            # Set from here rather than in `preexec_fn`, which is not safe with threads
+            # running (e.g. those of the telemetry). The kernel sends SIGXCPU at the soft
+            # limit, and SIGKILL one second later.
+            try:
+                resource.prlimit(process.pid, resource.RLIMIT_CPU, (cpu, cpu + 1))
+            except ProcessLookupError:
+                pass
+
+        expired = threading.Event()
+        timer = None
+        if limit is not None:
+
+            def expire():
+                self._log(f'Watchdog killing {cmd} after {limit}s', LogLevel.DEBUG)
+                expired.set()
+                self.__kill_group(process)
+
+            timer = threading.Timer(limit, expire)
+            timer.start()
+
+        output = {}
+        stopped = threading.Event()
+
+        def read(name, stream, scanner):
+            if scanner is None:
+                output[name] = stream.read()
+                return
+            decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+            while chunk := os.read(stream.fileno(), 1 << 16):
+                scanner.feed(decoder.decode(chunk))
+                if scanner.done and not stopped.is_set():
+                    # The result is in, so there is no need to wait for the runner to exit.
+                    stopped.set()
+                    self.__kill_group(process)
+            scanner.feed(decoder.decode(b'', final=True))
+            output[name] = scanner.text()
+
+        readers = [
+            threading.Thread(target=read, args=('stdout', process.stdout, scanner)),
+            threading.Thread(target=read,
+                             args=('stderr', process.stderr, OutputScanner([]) if scanner else None)),
+        ]
+        for reader in readers:
+            reader.start()
+
+        # Reap the runner ourselves, since `Popen.wait` does not report resource usage.
+        try:
+            _, status, rusage = os.wait4(process.pid, 0)
+        finally:
+            if timer:
+                timer.cancel()
+            # Also kill anything the runner left behind (e.g. `qc_exec`),
+            # which would otherwise keep the pipes open.
+            self.__kill_group(process)
+        walltime = time.monotonic() - start
+        process.returncode = os.waitstatus_to_exitcode(status)
+
+        for reader in readers:
+            reader.join()
+        process.stdout.close()
+        process.stderr.close()
+
+        timed_out = expired.is_set()
+        if timed_out:
+            self.telemetry.timeout()
+        # `RLIMIT_CPU` applies to each process, and the runner may be a child (e.g. of
+        # `stack exec`), so a runner that used up its CPU time may not have died by signal.
+        # (The limit is checked on clock ticks, so the time reported may be slightly lower.)
+        cpu_limited = (cpu is not None and not timed_out and not stopped.is_set() and
+                       process.returncode != 0 and
+                       (process.returncode == -signal.SIGXCPU or
+                        rusage.ru_utime + rusage.ru_stime >= cpu - 0.5))
+        if cpu_limited:
+            self._log(f'{cmd} exceeded its CPU limit of {cpu}s', LogLevel.WARNING)
+        # `ru_maxrss` is in bytes on macOS and in kilobytes elsewhere.
+        maxrss = rusage.ru_maxrss // 1024 if sys.platform == 'darwin' else rusage.ru_maxrss
+        usage = ResourceUsage(walltime=walltime,
+                              utime=rusage.ru_utime,
+                              stime=rusage.ru_stime,
+                              maxrss_kb=maxrss,
+                              nvcsw=rusage.ru_nvcsw,
+                              nivcsw=rusage.ru_nivcsw)
+
+        return ProcessResult(process.returncode, output['stdout'], output['stderr'], timed_out,
+                             usage, stopped.is_set(), cpu_limited)
+
+    def __kill_group(self, process: subprocess.Popen) -> None:
+        '''
+        Helper for killing the process group of a runner.
+        '''
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except (ProcessLookupError, PermissionError):
+            pass
+
+    def _run_build_graph(self, steps: list[BuildStep]) -> None:
+        '''
+        Runs a build graph, with up to `jobs` steps in parallel.
+        A step starts as soon as all of its dependencies have finished.
+
+        All steps run in the current working directory.
+        '''
+        from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+        pending = {step.name: step for step in steps}
+        for step in steps:
+            for dep in step.deps:
+                if dep not in pending:
+                    raise Exception(f'Unknown dependency {dep} of build step {step.name}')
+
+        done: set[str] = set()
+        with ThreadPoolExecutor(max_workers=self._jobs) as pool:
+            running = {}
+            while pending or running:
+                ready = [step for step in pending.values() if all(d in done for d in step.deps)]
+                for step in ready:
+                    del pending[step.name]
+                    running[pool.submit(self.__run_build_step, step)] = step.name
+
+                if not running:
+                    raise Exception(f'Cycle in build graph: {list(pending)}')
+
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    future.result()
+                    done.add(running.pop(future))
+
+    def __run_build_step(self, step: BuildStep) -> None:
+        '''
+        Helper for running a single build step.
+        '''
+        self._log(f'Build step {step.name}: {step.action}', LogLevel.DEBUG)
+        if callable(step.action):
+            step.action()
+        else:
+            self._shell_command(step.action)
+
     def _change_dir(self, path: str) -> ChangeDir:
         '''
         Helper for changing working directory.
@@ -157,6 +528,52 @@ class BenchTool(ABC):
         '''
         return ChangeDir(path)
 
+    def __build_variant(self, workload: Entry, variant: Variant) -> None:
+        with self._change_dir(self.__temp):
+            if workload.name not in self.__preprocessed:
+                # Preprocess the copy of the workload that is built, not the source tree.
+                self._preprocess(workload)
+                self.__preprocessed.add(workload.name)
+
+            self._log(f'Applying variant {variant}', LogLevel.DEBUG)
+            self.__apply_variant_in_impl(workload, variant)
+
+            self._log(f'Building with mutant: {variant.name}', LogLevel.INFO)
+            start = time.monotonic()
+            self._build(workload.path)
+            self.telemetry.build(time.monotonic() - start)
+
+    def __record_artifact(self, workload: Entry, variant: Variant) -> Optional[str]:
+        '''
+        Hashes the artifacts of the variant that was just built.
+
+        :return: The first variant with the same artifacts, if any.
+        '''
+        if variant.name == 'base':
+            self.__hashed_base.add(workload.name)
+        with self._change_dir(self.__temp):
+            artifact = self._artifact_hash(workload.path)
+        if artifact is None:
+            return None
+
+        artifacts = self.__artifacts.setdefault(workload.name, {})
+        equivalent = artifacts.setdefault(artifact, variant.name)
+        if equivalent == variant.name:
+            return None
+
+        self._log(f'{variant.name} is equivalent to {equivalent}', LogLevel.WARNING)
+        flags = os.path.join(self.results, 'equivalent')
+        os.makedirs(flags, exist_ok=True)
+        with open(os.path.join(flags, f'{workload.name},{variant.name}.json'), 'w') as f:
+            json.dump(
+                {
+                    'workload': workload.name,
+                    'mutant': variant.name,
+                    'equivalent': equivalent,
+                    'hash': artifact,
+                }, f)
+        return equivalent
+
     def __apply_variant_in_impl(self, workload: Entry, variant: Variant) -> None:
         '''
         Helper for applying variant.
@@ -166,7 +583,58 @@ class BenchTool(ABC):
         with open(variant.filename, 'w') as f:
             f.write(variant.body)
 
-    def __trial(self, cfg: TrialConfig) -> None:
+    def __forked_trial(self, cfg: TrialConfig, results: str, cpu: Optional[int]) -> None:
+        '''
+        Runs one trial in a forked process (see `race` and `run_parallel`).
+        '''
+        # Runners are in their own process group, so they would outlive a plain
+        # SIGTERM; raising instead lets `_run_process` kill the group on the way out.
+        def cancel(_signum, _frame):
+            raise SystemExit(1)
+
+        signal.signal(signal.SIGTERM, cancel)
+        if cpu is not None:
+            os.sched_setaffinity(0, {cpu})
+        self.__trial(cfg, results)
+
+    def __race_file(self, results: str, cfg: TrialConfig) -> str:
+        return os.path.join(results, f'{self.__experiment(cfg)}.json')
+
+    def __time_to_failure(self, results: str, cfg: TrialConfig) -> Optional[float]:
+        try:
+            with open(self.__race_file(results, cfg)) as f:
+                records = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        times = [r['time'] for r in records if r.get('foundbug')]
+        return min(times) if times else None
+
+    def __record_cancelled(self, results: str, cfg: TrialConfig, elapsed: float) -> None:
+        record = {
+            'workload': cfg.workload.name,
+            'strategy': cfg.label if cfg.label else cfg.strategy,
+            'mutant': self.__variant.name,
+            'property': cfg.property,
+            'foundbug': False,
+            'passed': None,
+            'discards': None,
+            'time': elapsed,
+            'output': '',
+            'cancelled': True,
+        }
+        with open(self.__race_file(results, cfg), 'w') as f:
+            json.dump([record], f)
+
+    def __experiment(self, cfg: TrialConfig) -> str:
+        '''
+        Name of the results file (without extension) of a trial.
+        '''
+        if cfg.file:
+            return cfg.file
+        strategy_label = cfg.label if cfg.label else cfg.strategy
+        return f'{cfg.workload.name},{strategy_label},{self.__variant.name},{cfg.property}'
+
+    def __trial(self, cfg: TrialConfig, results: Optional[str] = None) -> None:
         '''
         Generate one set of data for `workload`.
 
@@ -180,12 +648,8 @@ class BenchTool(ABC):
             raise Exception('Cannot run trial without variant')
 
         strategy_label = cfg.label if cfg.label else cfg.strategy
-
-        if not cfg.file:
-            experiment = f'{cfg.workload.name},{strategy_label},{self.__variant.name},{cfg.property}'
-        else:
-            experiment = cfg.file
-        file = os.path.join(self.results, f'{experiment}.json')
+        experiment = self.__experiment(cfg)
+        file = os.path.join(results if results else self.results, f'{experiment}.json')
 
         if os.path.isfile(file):
             match self._replace_level:
@@ -193,11 +657,38 @@ class BenchTool(ABC):
                     pass
                 case ReplaceLevel.SKIP:
                     self._log(f'Skipping {experiment}', LogLevel.WARNING)
+                    self.telemetry.trial_finished(experiment, skipped=True)
                     return
                 case ReplaceLevel.FAIL:
                     raise Exception(f'Already have data for {experiment}')
 
+        if self.__equivalent == 'base':
+            self._log(f'Skipping {experiment} (equivalent to base)', LogLevel.INFO)
+            self.telemetry.trial_finished(experiment, skipped=True)
+            return
+        if self.__equivalent and not cfg.file:
+            original = os.path.join(os.path.dirname(file),
+                                    f'{cfg.workload.name},{strategy_label},{self.__equivalent},{cfg.property}.json')
+            if os.path.isfile(original):
+                self._log(f'Reusing {original} for {experiment}', LogLevel.INFO)
+                with open(original) as f:
+                    records = json.load(f)
+                for record in records:
+                    record['mutant'] = self.__variant.name
+                    record['equivalent'] = self.__equivalent
+                with open(file, 'w') as f:
+                    json.dump(records, f)
+                self.telemetry.trial_finished(experiment, skipped=True)
+                return
+
+        replay_keys = None
+        if cfg.corpus:
+            from benchtool import Corpus
+            replay_keys = Corpus.lookup(cfg.corpus, cfg.workload.name, self.__variant.name, cfg.property,
+                                       strategy_label)
+
         self._log(f'Running {experiment}', LogLevel.INFO)
+        self.telemetry.trial_started(experiment)
         with self._change_dir(self.__temp):
             self._run_trial(
                 cfg.workload.path,
@@ -209,11 +700,48 @@ class BenchTool(ABC):
                           property=cfg.property,
                           timeout=cfg.timeout,
                           label=strategy_label,
-                          short_circuit=cfg.short_circuit))
+                          short_circuit=cfg.short_circuit,
+                          gc_stats=cfg.gc_stats,
+                          profile=cfg.profile,
+                          measure=cfg.measure,
+                          reservoir=cfg.reservoir,
+                          replay_keys=replay_keys,
+                          max_success=cfg.max_success,
+                          max_discard=cfg.max_discard,
+                          sweep=cfg.sweep))
+        self.telemetry.trial_finished(experiment)
+
+        if cfg.corpus:
+            self.__update_corpus(file, cfg.corpus, replay_keys)
+
+    def __update_corpus(self, file: str, corpus: str, replay_keys: Optional[list[str]]) -> None:
+        '''
+        Marks the trials that found the bug by replaying one of `replay_keys`,
+        and adds the counterexamples of the others to `corpus`.
+        '''
+        from benchtool import Corpus
+
+        try:
+            with open(file) as f:
+                records = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return
+
+        for record in records:
+            record['replayed'] = bool(replay_keys and record.get('foundbug')
+                                      and record.get('replaykey') in replay_keys)
+        with open(file, 'w') as f:
+            json.dump(records, f)
+
+        added = Corpus.add(corpus, [r for r in records if not r['replayed']])
+        if added:
+            self._log(f'Added {added} counterexamples to {corpus}', LogLevel.INFO)
 
     @abstractmethod
     def _preprocess(self, workload: Entry) -> None:
         '''
         Takes a workload and does the required preprocessing.
+
+        Called on the copy of the workload before its first build.
         '''
         pass
@@ -1,16 +1,37 @@
 from benchtool.BenchTool import BenchTool, Entry
-from benchtool.Types import Config, LogLevel, ReplaceLevel, TrialArgs
+from benchtool.Telemetry import Telemetry
+from benchtool.Types import BuildStep, Config, LogLevel, ReplaceLevel, TrialArgs, TrialConfig, Watchdog
+from benchtool.Util import ContentWriter, OutputScanner, content_hash, file_hash
 
 import json
 import os
 import re
-import subprocess
 import ctypes
 import platform
+from typing import Optional
 
 IMPL_DIR = 'Src'
 STRATEGIES_DIR = 'Strategies'
 RUNNERS_DIR = 'Runners'
+COMBINED_RUNNER = 'Combined'
+
+# Regions of runner output that results are parsed from: the result itself, the GC
+# statistics printed after it, and the shared memory segment of a fuzzer.
+OUTPUT_MARKERS = [("[|", "|]"), ("[?", "?]"), ("|?SHM ID: ", "?|")]
+
+# Bounds on the number of tests and discards, read by the runners at startup so that
+# they can change without recompiling (inside a Coq string, hence the doubled quotes).
+NUM_TESTS_AXIOM = 'Axiom num_tests : nat. Extract Constant num_tests => "(match Sys.getenv_opt ""ETNA_MAX_SUCCESS"" with Some n -> int_of_string n | None -> max_int)".\n'
+NUM_DISCARDS_AXIOM = 'Axiom num_discards : nat. Extract Constant num_discards => "(match Sys.getenv_opt ""ETNA_MAX_DISCARD"" with Some n -> int_of_string n | None -> max_int)".\n'
+
+# Appended to the main function of generated runners (inside a Coq string, hence the
+# doubled quotes). When `ETNA_GC_STATS` is set, prints `Gc.quick_stat` between `[?` and `?]`.
+GC_STATS_OCAML = """if Sys.getenv_opt ""ETNA_GC_STATS"" <> None then begin
+    let s = Gc.quick_stat () in
+    Printf.printf ""[?{\\""word_size\\"": %d, \\""minor_words\\"": %.0f, \\""promoted_words\\"": %.0f, \\""major_words\\"": %.0f, \\""minor_collections\\"": %d, \\""major_collections\\"": %d, \\""top_heap_words\\"": %d}?]\\n""
+      Sys.word_size s.Gc.minor_words s.Gc.promoted_words s.Gc.major_words
+      s.Gc.minor_collections s.Gc.major_collections s.Gc.top_heap_words
+  end"""
 SPEC_PATH = 'Src/Spec.v'
 
 
@@ -19,7 +40,22 @@ class Coq(BenchTool):
     def __init__(self,
                  results: str,
                  log_level: LogLevel = LogLevel.INFO,
-                 replace_level: ReplaceLevel = ReplaceLevel.REPLACE):
+                 replace_level: ReplaceLevel = ReplaceLevel.REPLACE,
+                 jobs: int = 1,
+                 combined_runner: bool = False,
+                 watchdog: Optional[Watchdog] = None,
+                 telemetry: Optional[Telemetry] = None):
+        '''
+        If `combined_runner` is set, all generators of a workload are
+        extracted and linked into a single runner, which dispatches
+        on (strategy, property) instead of one runner per strategy.
+        '''
+        self._combined_runner = combined_runner
+        # Workloads whose runners or `_CoqProject` changed since their last build.
+        self._regenerated: set[str] = set()
+        # Workloads whose last extraction failed.
+        self._failed: set[str] = set()
+        self._writers: list[ContentWriter] = []
         super().__init__(
             Config(start='(*',
                    end='*)',
@@ -28,7 +64,7 @@ class Coq(BenchTool):
                    ignore='common',
                    strategies=STRATEGIES_DIR,
                    impl_path=IMPL_DIR,
-                   spec_path=SPEC_PATH), results, log_level, replace_level)
+                   spec_path=SPEC_PATH), results, log_level, replace_level, jobs, watchdog, telemetry)
 
     def all_properties(self, workload: Entry) -> set[str]:
         spec = os.path.join(workload.path, SPEC_PATH)
@@ -39,32 +75,86 @@ class Coq(BenchTool):
             return list(dict.fromkeys(matches))
 
     def _build(self, workload_path: str):
-        strategies = self._get_generator_names(workload_path)
-        strategy_build_commands = map(lambda strategy: self._get_strategy_build_command(strategy),
-                                      strategies)
+        generators = self._get_runner_names(workload_path)
         fuzzers = self._get_fuzzer_names(workload_path)
-        fuzzer_build_commands = map(lambda fuzzer: self._get_fuzzer_build_command(fuzzer), fuzzers)
         with self._change_dir(workload_path):
             self._shell_command(['coq_makefile', '-f', '_CoqProject', '-o', 'Makefile'])
-            self._shell_command(['make', 'clean'])
-            self._shell_command(['make'])
-
-            for cmd in strategy_build_commands:
-                self._shell_command(cmd.split(" "))
-                self._log(f"Built strategy {cmd}", LogLevel.DEBUG)
-
-            for i, fuzzer_build_command in enumerate(fuzzer_build_commands):
-                self._log(f"Built fuzzer {fuzzers[i]}", LogLevel.DEBUG)
-                self._log(f"Fuzzer Command 1: {fuzzer_build_command[0]}", LogLevel.DEBUG)
-                self._log(f"Fuzzer Command 2: {fuzzer_build_command[1]}", LogLevel.DEBUG)
-                self._generate_extended_version_of_fuzzer(fuzzers[i])
-                self._shell_command(fuzzer_build_command[2].split(" "))
-                self._shell_command(fuzzer_build_command[3].split(" "))
-                self._shell_command(fuzzer_build_command[0].split(" "))
-                self._shell_command(fuzzer_build_command[1].split(" "))
+            if workload_path in self._regenerated:
+                # Otherwise `make` only rebuilds what depends on the applied variant.
+                self._shell_command(['make', 'clean'])
+                self._regenerated.discard(workload_path)
+            # `make clean` leaves the extracted OCaml behind, which would otherwise outlive
+            # a failed extraction; removing the runners' `.vo` files makes `make` extract again.
+            for f in os.listdir():
+                if f.endswith(('_test_runner.ml', '_test_runner.mli')):
+                    os.remove(f)
+            for f in os.listdir(RUNNERS_DIR):
+                if f.endswith('_test_runner.vo'):
+                    os.remove(os.path.join(RUNNERS_DIR, f))
+            if self._shell_command(['make', f'-j{self._jobs}']) != 0:
+                self._log(f'Extraction failed in {workload_path}', LogLevel.ERROR)
+                self._failed.add(workload_path)
+            else:
+                self._failed.discard(workload_path)
+            self._run_build_graph(self._get_build_steps(generators, fuzzers))
+
+    def _artifact_hash(self, workload_path: str) -> Optional[str]:
+        # The OCaml extracted for the runners determines everything built from it.
+        if workload_path in self._failed:
+            return None
+        with self._change_dir(workload_path):
+            extracted = sorted(f for f in os.listdir() if f.endswith('_test_runner.ml'))
+            if not extracted:
+                return None
+            return content_hash(''.join(f'{f} {file_hash(f)}\n' for f in extracted))
+
+    def _exclusive(self, cfg: TrialConfig) -> bool:
+        # Fuzzers all run `./main_exec ./qc_exec`, over the same shared memory segment.
+        return 'Fuzzer' in cfg.strategy
+
+    def _get_build_steps(self, generators: list[str], fuzzers: list[str]) -> list[BuildStep]:
+        steps = [
+            BuildStep(f"{strategy}.native", self._get_strategy_build_command(strategy).split(" "))
+            for strategy in generators
+        ]
+
+        # Every fuzzer links `./qc_exec` and compiles `SHM.c` into the same `SHM.o`,
+        # so the links are chained one after the other (in the original order).
+        last_link = None
+        for fuzzer in fuzzers:
+            fuzzer_build_command = self._get_fuzzer_build_command(fuzzer)
+            self._log(f"Fuzzer Command 1: {fuzzer_build_command[0]}", LogLevel.DEBUG)
+            self._log(f"Fuzzer Command 2: {fuzzer_build_command[1]}", LogLevel.DEBUG)
+            if last_link is None:
+                # `./main_exec` does not depend on the fuzzer, so it is only built once.
+                last_link = "main_exec"
+                steps.append(BuildStep(last_link, fuzzer_build_command[1].split(" ")))
+            steps += [
+                BuildStep(f"{fuzzer}.ext",
+                          lambda fuzzer=fuzzer: self._generate_extended_version_of_fuzzer(fuzzer)),
+                BuildStep(f"{fuzzer}.prefix",
+                          fuzzer_build_command[2].split(" "),
+                          deps=[f"{fuzzer}.ext"]),
+                BuildStep(f"{fuzzer}.suffix",
+                          fuzzer_build_command[3].split(" "),
+                          deps=[f"{fuzzer}.prefix"]),
+                BuildStep(f"{fuzzer}.qc_exec",
+                          fuzzer_build_command[0].split(" "),
+                          deps=[f"{fuzzer}.suffix", last_link]),
+            ]
+            last_link = f"{fuzzer}.qc_exec"
+
+        return steps
 
     def _run_trial(self, workload_path: str, params: TrialArgs):
         self._log(f"Running trial {params}", LogLevel.DEBUG)
+        if params.sweep:
+            # The generators of QuickChick strategies are fixed at extraction.
+            raise Exception('Parameter sweeps are not supported for Coq workloads')
+        if params.replay_keys:
+            # QuickChick does not report the seed of a failing test.
+            self._log('Replay is not supported for Coq workloads; generating from scratch',
+                      LogLevel.WARNING)
         if "Fuzzer" in params.strategy:
             self._run_trial_fuzzer(workload_path, params)
         else:
@@ -78,24 +168,39 @@ class Coq(BenchTool):
                 f"Running {params.workload},{params.strategy},{params.mutant},{params.property}",
                 LogLevel.INFO)
             for _ in range(params.trials):
-                try:
-                    trial_result = {
-                        "workload": params.workload,
-                        "discards": None,
-                        "foundbug": None,
-                        "strategy": params.strategy,
-                        "mutant": params.mutant,
-                        "passed": None,
-                        "property": params.property,
-                        "time": None
-                    }
-                    process = subprocess.Popen(
-                        cmd,
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.PIPE,
-                        text=True
-                    )
-                    stdout_data, stderr_data = process.communicate(timeout=params.timeout)
+                trial_result = {
+                    "workload": params.workload,
+                    "discards": None,
+                    "foundbug": None,
+                    "strategy": params.strategy,
+                    "mutant": params.mutant,
+                    "passed": None,
+                    "property": params.property,
+                    "time": None,
+                    "timeout": params.timeout
+                }
+                # The watchdog kills `qc_exec` along with `main_exec`.
+                process = self._run_process(cmd,
+                                            params.timeout,
+                                            env=self._runner_env(params),
+                                            scanner=self._output_scanner(params))
+                stdout_data, stderr_data = process.stdout, process.stderr
+                if process.stopped:
+                    # Killed right after printing its result, maybe before cleaning up.
+                    self._release_shared_memory(stdout_data)
+
+                if process.timed_out:
+                    self._log(f"Process Timed Out", LogLevel.INFO)
+                    self._release_shared_memory(stdout_data)
+                    trial_result["foundbug"] = False
+                    trial_result["discards"] = 0
+                    trial_result["passed"] = 0
+                    trial_result["time"] = params.timeout
+                    self._log(f"{params.strategy} Result: Timeout", LogLevel.INFO)
+                elif process.cpu_limited:
+                    self._release_shared_memory(stdout_data)
+                    self._record_cpu_limited(params, trial_result)
+                else:
                     start = stdout_data.find("[|")
                     end = stdout_data.find("|]")
 
@@ -121,35 +226,8 @@ class Coq(BenchTool):
                             json_result["time"]
                             [:-2]) * 0.001  # ms as string to seconds as float conversion
 
-                except subprocess.TimeoutExpired as e:
-                    print(f"Process Timed Out {process.pid}")
-                    os.system(f"pkill qc_exec")
-                    print(f"Process Output: {e}")
-                    shm_id = int(e.stdout.decode("utf-8").split("|?SHM ID: ")[1].split("?|")[0])
-                    print(f"Shared Memory ID: {shm_id}")
-                    # Libc is platform dependent, so we need to load it dynamically
-                    if platform.system() == "Darwin":
-                        libc = ctypes.CDLL("/usr/lib/libc.dylib")
-                    elif platform.system() == "Linux":
-                        libc = ctypes.CDLL("libc.so.6")
-
-                    self._log(f"Releasing Shared Memory: {libc.shmctl(int(shm_id), 0, 0)}",
-                              LogLevel.INFO)
-                    self._log(f"Released Shared Memory with ID: {shm_id}", LogLevel.INFO)
-                    trial_result["foundbug"] = False
-                    trial_result["discards"] = 0
-                    trial_result["passed"] = 0
-                    trial_result["time"] = params.timeout
-                    self._log(f"{params.strategy} Result: Timeout", LogLevel.INFO)
-
-                except subprocess.CalledProcessError as e:
-                    self._log(f"Error Running {params.strategy}:", LogLevel.ERROR)
-                    self._log(f"[{e.stdout}]", LogLevel.ERROR)
-                    self._log(f"[{e.stderr}]", LogLevel.ERROR)
-                    trial_result["foundbug"] = False
-                    trial_result["discards"] = 0
-                    trial_result["passed"] = 0
-                    trial_result["time"] = -1
+                if process.usage:
+                    trial_result.update(process.usage.to_dict())
 
                 results.append(trial_result)
                 if params.short_circuit and trial_result['time'] == params.timeout:
@@ -160,9 +238,28 @@ class Coq(BenchTool):
 
             json.dump(results, open(params.file, 'w'))
 
+    def _release_shared_memory(self, stdout_data: str):
+        # `qc_exec` was killed, so it could not release its shared memory segment.
+        if "|?SHM ID: " not in stdout_data:
+            self._log(f"No Shared Memory ID in output", LogLevel.WARNING)
+            return
+        shm_id = int(stdout_data.split("|?SHM ID: ")[1].split("?|")[0])
+        self._log(f"Shared Memory ID: {shm_id}", LogLevel.INFO)
+        # Libc is platform dependent, so we need to load it dynamically
+        if platform.system() == "Darwin":
+            libc = ctypes.CDLL("/usr/lib/libc.dylib")
+        elif platform.system() == "Linux":
+            libc = ctypes.CDLL("libc.so.6")
+
+        self._log(f"Releasing Shared Memory: {libc.shmctl(int(shm_id), 0, 0)}", LogLevel.INFO)
+        self._log(f"Released Shared Memory with ID: {shm_id}", LogLevel.INFO)
+
     def _run_trial_strategy(self, workload_path: str, params: TrialArgs):
         with self._change_dir(workload_path):
-            cmd = [f"./{params.strategy}_test_runner.native", params.property]
+            if self._combined_runner:
+                cmd = [f"./{COMBINED_RUNNER}_test_runner.native", params.strategy, params.property]
+            else:
+                cmd = [f"./{params.strategy}_test_runner.native", params.property]
             results = []
             self._log(
                 f"Running {params.workload},{params.strategy},{params.mutant},{params.property}",
@@ -176,18 +273,24 @@ class Coq(BenchTool):
                     "mutant": params.mutant,
                     "passed": None,
                     "property": params.property,
-                    "time": None
+                    "time": None,
+                    "timeout": params.timeout
                 }
-                try:
-                    process = subprocess.Popen(
-                        cmd,
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.PIPE,
-                        text=True
-                    )
-
-                    stdout_data, stderr_data = process.communicate(timeout=params.timeout)
+                process = self._run_process(cmd,
+                                            params.timeout,
+                                            env=self._runner_env(params),
+                                            scanner=self._output_scanner(params))
 
+                if process.timed_out:
+                    trial_result["foundbug"] = False
+                    trial_result["discards"] = 0
+                    trial_result["passed"] = 0
+                    trial_result["time"] = params.timeout
+                    self._log(f"{params.strategy} Result: Timeout", LogLevel.INFO)
+                elif process.cpu_limited:
+                    self._record_cpu_limited(params, trial_result)
+                else:
+                    stdout_data = process.stdout
                     start = stdout_data.find("[|")
                     end = stdout_data.find("|]")
                     result = stdout_data[start + 2:end]
@@ -201,15 +304,11 @@ class Coq(BenchTool):
                     trial_result["time"] = float(
                         json_result["time"]
                         [:-2]) * 0.001  # ms as string to seconds as float conversion
+                    if params.gc_stats:
+                        trial_result.update(self._parse_gc_stats(stdout_data))
 
-                except subprocess.TimeoutExpired:
-                    process.kill()
-
-                    trial_result["foundbug"] = False
-                    trial_result["discards"] = 0
-                    trial_result["passed"] = 0
-                    trial_result["time"] = params.timeout
-                    self._log(f"{params.strategy} Result: Timeout", LogLevel.INFO)
+                if process.usage:
+                    trial_result.update(process.usage.to_dict())
 
                 results.append(trial_result)
                 if params.short_circuit and trial_result['time'] == params.timeout:
@@ -217,6 +316,46 @@ class Coq(BenchTool):
 
             json.dump(results, open(params.file, 'w'))
 
+    def _record_cpu_limited(self, params: TrialArgs, trial_result: dict):
+        # Killed before the timeout, so the trial has no time (it is not a timeout).
+        trial_result["foundbug"] = False
+        trial_result["discards"] = 0
+        trial_result["passed"] = 0
+        trial_result["time"] = None
+        trial_result["cpu_limited"] = True
+        self._log(f"{params.strategy} Result: CPU limit", LogLevel.WARNING)
+
+    def _output_scanner(self, params: TrialArgs) -> OutputScanner:
+        # The GC statistics, if requested, are printed after the result.
+        return OutputScanner(OUTPUT_MARKERS, until="?]" if params.gc_stats else "|]")
+
+    def _runner_env(self, params: TrialArgs) -> dict[str, str]:
+        env = {}
+        if params.max_success is not None:
+            env["ETNA_MAX_SUCCESS"] = str(params.max_success)
+        if params.max_discard is not None:
+            env["ETNA_MAX_DISCARD"] = str(params.max_discard)
+        if params.gc_stats:
+            env["ETNA_GC_STATS"] = "1"
+        return env
+
+    def _parse_gc_stats(self, stdout_data: str) -> dict:
+        start = stdout_data.rfind("[?")
+        end = stdout_data.find("?]", start)
+        if start == -1 or end == -1:
+            self._log(f"No GC statistics in output", LogLevel.WARNING)
+            return {}
+        stats = json.loads(stdout_data[start + 2:end])
+        word_bytes = stats["word_size"] // 8
+        return {
+            "bytes_allocated":
+                (stats["minor_words"] + stats["major_words"] - stats["promoted_words"]) * word_bytes,
+            "gc_time": None,  # not tracked by the OCaml runtime
+            # Peak heap size, the closest `Gc.quick_stat` gets to max live bytes.
+            "max_live_bytes": stats["top_heap_words"] * word_bytes,
+            "gc_count": stats["minor_collections"] + stats["major_collections"],
+        }
+
     def _generate_extended_version_of_fuzzer(self, fuzzer: str):
         fuzzer_path = f"./{fuzzer}_test_runner.ml"
         extended_fuzzer_path = f"./{fuzzer}_test_runner_ext.ml"
@@ -261,9 +400,14 @@ class Coq(BenchTool):
                    self._get_all_strategy_names(f"{workload_path}/{STRATEGIES_DIR}")))
         return generators
 
+    def _get_runner_names(self, workload_path) -> list[str]:
+        if self._combined_runner:
+            return [COMBINED_RUNNER]
+        return self._get_generator_names(workload_path)
+
     def _get_all_strategy_names(self, strategies_path) -> list[str]:
         strategies = []
-        for strategy in os.listdir(strategies_path):
+        for strategy in sorted(os.listdir(strategies_path)):
             f = os.path.join(strategies_path, strategy)
             if os.path.isfile(f) and f.endswith(".v"):
                 strategies.append(strategy[:-2])
@@ -294,8 +438,7 @@ class Coq(BenchTool):
         strategy_import = f"From {workload_name} Require Import {strategy_name}.\n"
         library_import = "From QuickChick Require Import QuickChick.\n"
         set_warnings = 'Set Warnings "-extraction-opaque-accessed,-extraction".\n'
-        size_axiom = 'Axiom num_tests : nat. Extract Constant num_tests => "max_int".\n'
-        test_string_template = "Definition qctest_<test-name> := (fun _ : unit => print_extracted_coq_string (\"[|{\" ++ show (withTime(fun tt => (quickCheckWith (updMaxDiscard (updMaxSuccess (updAnalysis stdArgs true) num_tests) num_tests) <test-name>))) ++ \"}|]\")).\n"
+        test_string_template = "Definition qctest_<test-name> := (fun _ : unit => print_extracted_coq_string (\"[|{\" ++ show (withTime(fun tt => (quickCheckWith (updMaxDiscard (updMaxSuccess (updAnalysis stdArgs true) num_tests) num_discards) <test-name>))) ++ \"}|]\")).\n"
         test_map = f"""
 
 Parameter OCamlString : Type.
@@ -311,17 +454,19 @@ fun test_name ->
 
 
 let () =
-  Sys.argv.(1) |> qctest_map
+  Sys.argv.(1) |> qctest_map;
+  {GC_STATS_OCAML}
 ".
 
 """
         extraction_string_template = f'Extraction "{strategy_name}_test_runner.ml" <test-names> qctest_map.\n'
 
-        with open(os.path.join(runners_path, file_name), "w") as runner_file:
+        with self._runner_writer(runners_path, file_name) as runner_file:
             runner_file.write(strategy_import)
             runner_file.write(library_import)
             runner_file.write(set_warnings)
-            runner_file.write(size_axiom)
+            runner_file.write(NUM_TESTS_AXIOM)
+            runner_file.write(NUM_DISCARDS_AXIOM)
             for test in tests:
                 test_string = test_string_template.replace("<test-name>", test)
                 runner_file.write(test_string)
@@ -330,6 +475,54 @@ let () =
             extraction_string = extraction_string_template.replace("<test-names>", test_names)
             runner_file.write(extraction_string)
 
+    def _generate_test_file_qc_combined(self, runners_path: str, tests: dict[str, list[str]],
+                                        workload: Entry):
+        workload_name = workload.name
+        file_name = f"{COMBINED_RUNNER}_test_runner.v"
+        # Strategies are only required (not imported), since they all define the same names.
+        strategy_import = f"From {workload_name} Require {' '.join(tests)}.\n"
+        library_import = "From QuickChick Require Import QuickChick.\n"
+        set_warnings = 'Set Warnings "-extraction-opaque-accessed,-extraction".\n'
+        test_string_template = "Definition qctest_<strategy>_<test-name> := (fun _ : unit => print_extracted_coq_string (\"[|{\" ++ show (withTime(fun tt => (quickCheckWith (updMaxDiscard (updMaxSuccess (updAnalysis stdArgs true) num_tests) num_discards) <strategy>.<test-name>))) ++ \"}|]\")).\n"
+        pairs = [(strategy, test) for strategy, strategy_tests in tests.items() for test in strategy_tests]
+        test_map = f"""
+
+Parameter OCamlString : Type.
+Extract Constant OCamlString => "string".
+Axiom qctest_map : OCamlString -> OCamlString -> unit.
+Extract Constant qctest_map => "
+fun strategy_name test_name ->
+  let test_map = [
+    {'; '.join([f'((""{strategy}"", ""{test}""), qctest_{strategy}_{test})' for strategy, test in pairs])}
+  ] in
+  let test = List.assoc (strategy_name, test_name) test_map in
+  test ()
+
+
+let () =
+  qctest_map Sys.argv.(1) Sys.argv.(2);
+  {GC_STATS_OCAML}
+".
+
+"""
+        extraction_string_template = f'Extraction "{COMBINED_RUNNER}_test_runner.ml" <test-names> qctest_map.\n'
+
+        with self._runner_writer(runners_path, file_name) as runner_file:
+            runner_file.write(strategy_import)
+            runner_file.write(library_import)
+            runner_file.write(set_warnings)
+            runner_file.write(NUM_TESTS_AXIOM)
+            runner_file.write(NUM_DISCARDS_AXIOM)
+            for strategy, test in pairs:
+                test_string = test_string_template.replace("<strategy>", strategy).replace(
+                    "<test-name>", test)
+                runner_file.write(test_string)
+            test_names = " ".join(
+                list(map(lambda pair: f"qctest_{pair[0]}_{pair[1]}", pairs)))
+            runner_file.write(test_map)
+            extraction_string = extraction_string_template.replace("<test-names>", test_names)
+            runner_file.write(extraction_string)
+
     def _generate_test_file_fc(self, runners_path: str, fuzzer_name: str, tests: list[str],
                                workload: Entry):
         workload_name = workload.name
@@ -361,7 +554,7 @@ let () =
 """
         extraction_string_template = f'Extraction "{fuzzer_name}_test_runner.ml" <test-names> qctest_map.'
 
-        with open(os.path.join(runners_path, file_name), "w") as runner_file:
+        with self._runner_writer(runners_path, file_name) as runner_file:
             runner_file.write(strategy_import)
             runner_file.write(library_import)
             runner_file.write(set_warnings)
@@ -373,6 +566,13 @@ let () =
             extraction_string = extraction_string_template.replace("<test-names>", test_names)
             runner_file.write(extraction_string)
 
+    def _runner_writer(self, runners_path: str, file_name: str) -> ContentWriter:
+        path = os.path.join(runners_path, file_name)
+        self._log(f"Generating runner {path}", LogLevel.DEBUG)
+        writer = ContentWriter(path)
+        self._writers.append(writer)
+        return writer
+
     def _preprocess(self, workload: Entry) -> None:
         # Relevant Paths
         strategies_path = f"{workload.path}/{STRATEGIES_DIR}/"
@@ -380,13 +580,29 @@ let () =
         # Generate runner files
         generators = self._get_generator_names(workload.path)
         fuzzers = self._get_fuzzer_names(workload.path)
-        # Empty Runner Directory
-        self._shell_command(['rm', f"{runners_path}*"])
+        runners = [COMBINED_RUNNER] if self._combined_runner else generators
+        # Runners are only rewritten if their contents change, so that
+        # unchanged runners keep their timestamps and are not rebuilt.
+        os.makedirs(runners_path, exist_ok=True)
+        self._writers = []
+        removed = False
+        # Remove stale runners
+        expected = {f"{runner}_test_runner.v" for runner in runners + fuzzers}
+        for entry in os.scandir(runners_path):
+            if entry.name.endswith("_test_runner.v") and entry.name not in expected:
+                self._log(f"Removing stale runner {entry.path}", LogLevel.DEBUG)
+                os.remove(entry.path)
+                removed = True
         # Generate and Add Runners for each strategy
+        generator_tests = {}
         for strategy in generators:
             with open(os.path.join(strategies_path, f"{strategy}.v"), "r") as strategy_file:
                 content = strategy_file.read()
-                tests = self._parse_tests_qc(content)
+                generator_tests[strategy] = self._parse_tests_qc(content)
+        if self._combined_runner:
+            self._generate_test_file_qc_combined(runners_path, generator_tests, workload)
+        else:
+            for strategy, tests in generator_tests.items():
                 self._generate_test_file_qc(runners_path, strategy, tests, workload)
         # Generate and Add Runners for each fuzzer
         for fuzzer in fuzzers:
@@ -398,11 +614,14 @@ let () =
         with open(f"{workload.path}/_CoqProject", "r") as coq_project_file_reader:
             coq_project_file_contents = coq_project_file_reader.read().splitlines()
 
-        with open(f"{workload.path}/_CoqProject", "w") as coq_project_file_writer:
+        with ContentWriter(f"{workload.path}/_CoqProject") as coq_project_file_writer:
             for coq_project_file_line in coq_project_file_contents:
                 if not coq_project_file_line.startswith(
                         RUNNERS_DIR) and coq_project_file_line != "":
                     coq_project_file_writer.write(coq_project_file_line + "\n")
 
-            for strategy in generators + fuzzers:
+            for strategy in runners + fuzzers:
                 coq_project_file_writer.write(f"{RUNNERS_DIR}/{strategy}_test_runner.v\n")
+
+        if removed or coq_project_file_writer.changed or any(w.changed for w in self._writers):
+            self._regenerated.add(workload.path)
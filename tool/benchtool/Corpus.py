@@ -0,0 +1,115 @@
+'''
+Counterexamples found by trials, so later runs can check them before
+generating new inputs.
+
+The corpus is a directory with one file per (workload, mutant, property),
+holding a list of counterexamples with the strategy that found them, its
+output and, for strategies that support it, a `replay_key` to find the
+counterexample again (QuickCheck: the seed and size of the failing test;
+LeanCheck: its position in the enumeration).
+
+Trials run with `TrialConfig.corpus` replay every key stored for their strategy
+first, and add the counterexamples they find. Only Haskell QuickCheck and
+LeanCheck strategies record keys: SmallCheck cannot skip to a counterexample,
+and Coq runners report neither the counterexample nor the seed, so Coq trials
+are not stored at all. `collect` adds the
+counterexamples of an existing results directory.
+
+    python3 -m benchtool.Corpus --data=data/4.1 --corpus=data/corpus
+'''
+
+import argparse
+import json
+import os
+
+from benchtool.Util import scandir_filter
+
+
+def lookup(corpus: str, workload: str, mutant: str, property: str, strategy: str) -> list[str]:
+    '''
+    Keys are only meaningful to the strategy that recorded them (a QuickCheck seed
+    drives that strategy's generator, a LeanCheck position its enumeration).
+
+    :return: The replay keys of the counterexamples stored for `strategy`, oldest first.
+    '''
+    return [
+        e['replay_key'] for e in _load(_path(corpus, workload, mutant, property))
+        if e['strategy'] == strategy and e.get('replay_key')
+    ]
+
+
+def add(corpus: str, records: list[dict]) -> int:
+    '''
+    Stores the counterexamples of the trials in `records` that found the bug.
+
+    :return: Number of new counterexamples.
+    '''
+    found = {}
+    for r in records:
+        if not r.get('foundbug') or not (r.get('output') or r.get('replaykey')):
+            continue
+        key = (r['workload'], r['mutant'], r['property'])
+        found.setdefault(key, []).append({
+            'strategy': r['strategy'],
+            'output': r.get('output', ''),
+            'replay_key': r.get('replaykey'),
+        })
+
+    added = 0
+    for (workload, mutant, property), entries in found.items():
+        path = _path(corpus, workload, mutant, property)
+        stored = _load(path)
+        seen = {_identity(e) for e in stored}
+        for entry in entries:
+            if _identity(entry) not in seen:
+                seen.add(_identity(entry))
+                stored.append(entry)
+                added += 1
+        os.makedirs(corpus, exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump(stored, f)
+    return added
+
+
+def collect(results: str, corpus: str) -> int:
+    '''
+    Adds the counterexamples found in the results files of `results`.
+
+    :return: Number of new counterexamples.
+    '''
+    added = 0
+    for entry in scandir_filter(results, os.path.isfile):
+        if not entry.path.endswith('.json'):
+            continue
+        try:
+            with open(entry.path) as f:
+                added += add(corpus, json.load(f))
+        except json.JSONDecodeError:
+            continue
+    return added
+
+
+def _identity(entry: dict) -> tuple[str, str]:
+    # Shrunk counterexamples are usually the same, whatever the seed that found them.
+    return entry['strategy'], entry['output'] or entry['replay_key']
+
+
+def _path(corpus: str, workload: str, mutant: str, property: str) -> str:
+    return os.path.join(corpus, f'{workload},{mutant},{property}.json')
+
+
+def _load(path: str) -> list[dict]:
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return []
+
+
+if __name__ == '__main__':
+    p = argparse.ArgumentParser(description='Add the counterexamples of a results directory to a corpus.')
+    p.add_argument('--data', required=True, help='path to folder for JSON data')
+    p.add_argument('--corpus', required=True, help='path to the corpus')
+    args = p.parse_args()
+
+    print(f'Added {collect(args.data, args.corpus)} counterexamples to {args.corpus}')
@@ -0,0 +1,361 @@
+'''
+Runs an experiment on several workers, possibly on different hosts.
+
+The coordinator expands the experiment into one job per trial, and hands
+them out over TCP to workers that ask for them. Workers prefer jobs for
+the variant they have already built, send heartbeats while running a job,
+and stream the results back; the coordinator stores them in one results
+directory, with the same layout as a local run. Jobs of workers that stop
+sending heartbeats are handed out again.
+
+Usage (from the root of the repository):
+
+    python3 -m benchtool.Distributed coordinator --language=haskell --data=data/4.1 --trials=10 --timeout=65
+    python3 -m benchtool.Distributed worker --language=haskell --host=<coordinator>
+
+Messages are JSON objects, one per line. Workers send `request`, `heartbeat`
+and `result`; the coordinator answers a `request` with `job`, `wait` (jobs
+are still running elsewhere and may be handed out again) or `done`.
+'''
+
+import argparse
+import dataclasses
+import json
+import os
+import socket
+import socketserver
+import tempfile
+import threading
+import time
+from typing import Callable, Optional
+
+from benchtool.BenchTool import BenchTool
+from benchtool.Coq import Coq
+from benchtool.Haskell import Haskell
+from benchtool.Types import Entry, Job, LogLevel, TrialConfig
+from benchtool.Util import print_log
+
+PORT = 5555
+
+
+class Coordinator:
+
+    def __init__(self,
+                 jobs: list[Job],
+                 results: str,
+                 host: str = 'localhost',
+                 port: int = PORT,
+                 heartbeat_timeout: float = 30,
+                 log_level: LogLevel = LogLevel.INFO):
+        self.results = results
+        self._pending = list(jobs)
+        self._running: dict[int, tuple[Job, '_Connection']] = {}
+        self._records: dict[str, list[dict]] = {}
+        self._heartbeat_timeout = heartbeat_timeout
+        self._log_level = log_level
+        self._lock = threading.Lock()
+        self._finished = threading.Event()
+
+        os.makedirs(results, exist_ok=True)
+
+        coordinator = self
+
+        class Handler(socketserver.StreamRequestHandler):
+
+            def handle(self):
+                coordinator._serve(_Connection(self.request, self.rfile))
+
+        socketserver.ThreadingTCPServer.allow_reuse_address = True
+        self._server = socketserver.ThreadingTCPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        if not self._pending:
+            self._finished.set()
+
+    @property
+    def address(self) -> tuple[str, int]:
+        return self._server.server_address
+
+    def serve(self) -> None:
+        '''
+        Hands out jobs until every one of them has a result.
+        '''
+        server = threading.Thread(target=self._server.serve_forever, daemon=True)
+        server.start()
+        monitor = threading.Thread(target=self._monitor, daemon=True)
+        monitor.start()
+
+        self._finished.wait()
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _log(self, msg: str, level: LogLevel):
+        print_log(msg, level, self._log_level)
+
+    def _serve(self, conn: '_Connection') -> None:
+        try:
+            for message in conn:
+                conn.last_seen = time.monotonic()
+                match message['type']:
+                    case 'request':
+                        conn.send(self._assign(conn, message.get('variant')))
+                    case 'heartbeat':
+                        pass
+                    case 'result':
+                        self._complete(conn, message['id'], message['records'])
+        finally:
+            self._requeue(conn)
+
+    def _assign(self, conn: '_Connection', variant: Optional[list[str]]) -> dict:
+        with self._lock:
+            if not self._pending:
+                return {'type': 'wait'} if self._running else {'type': 'done'}
+
+            # Avoid rebuilding: prefer a job for the variant the worker has built.
+            job = next((j for j in self._pending if [j.workload, j.mutant] == variant),
+                       self._pending[0])
+            self._pending.remove(job)
+            self._running[job.id] = (job, conn)
+            return {'type': 'job', 'job': dataclasses.asdict(job)}
+
+    def _complete(self, conn: '_Connection', id: int, records: list[dict]) -> None:
+        with self._lock:
+            if id not in self._running or self._running[id][1] is not conn:
+                # Already handed out again after this worker was presumed lost.
+                return
+            job, _ = self._running.pop(id)
+
+            label = job.label if job.label else job.strategy
+            experiment = f'{job.workload},{label},{job.mutant},{job.property}'
+            stored = self._records.setdefault(experiment, [])
+            stored += records
+            with open(os.path.join(self.results, f'{experiment}.json'), 'w') as f:
+                json.dump(stored, f)
+
+            self._log(f'Finished job {id} ({experiment}, trial {job.trial})', LogLevel.DEBUG)
+            if not self._pending and not self._running:
+                self._finished.set()
+
+    def _requeue(self, conn: '_Connection') -> None:
+        with self._lock:
+            for id, (job, owner) in list(self._running.items()):
+                if owner is conn:
+                    self._log(f'Requeueing job {id}', LogLevel.WARNING)
+                    del self._running[id]
+                    self._pending.insert(0, job)
+        conn.close()
+
+    def _monitor(self) -> None:
+        while not self._finished.wait(self._heartbeat_timeout / 4):
+            now = time.monotonic()
+            with self._lock:
+                lost = {conn for _, conn in self._running.values()
+                        if now - conn.last_seen > self._heartbeat_timeout}
+            for conn in lost:
+                self._log('Lost a worker', LogLevel.WARNING)
+                self._requeue(conn)
+
+
+class Worker:
+
+    def __init__(self,
+                 tool: BenchTool,
+                 host: str = 'localhost',
+                 port: int = PORT,
+                 heartbeat: float = 5):
+        self._tool = tool
+        self._address = (host, port)
+        self._heartbeat = heartbeat
+        self._variant: Optional[list[str]] = None
+        self._run_trial: Optional[Callable[[TrialConfig], None]] = None
+
+    def run(self) -> None:
+        '''
+        Runs jobs until the coordinator has none left.
+
+        Heartbeats are sent for as long as the worker is connected, including
+        while it builds a variant. If the coordinator drops the connection anyway
+        (e.g. it presumed the worker lost), the worker reconnects; the job it was
+        running has been handed out again.
+        '''
+        connected = False
+        while True:
+            try:
+                conn = _Connection(socket.create_connection(self._address))
+            except ConnectionRefusedError:
+                if not connected:
+                    raise
+                # The coordinator stops once every job has a result.
+                return
+            connected = True
+            try:
+                if self._session(conn):
+                    return
+            except OSError:
+                pass
+            print_log('Lost the connection to the coordinator, reconnecting', LogLevel.WARNING,
+                      self._tool.log_level)
+            time.sleep(self._heartbeat)
+
+    def _session(self, conn: '_Connection') -> bool:
+        '''
+        Runs jobs over `conn`.
+
+        :return: Whether the coordinator has no jobs left.
+        '''
+        stop = threading.Event()
+
+        def beat():
+            while not stop.wait(self._heartbeat):
+                try:
+                    conn.send({'type': 'heartbeat'})
+                except OSError:
+                    return
+
+        heartbeat = threading.Thread(target=beat, daemon=True)
+        heartbeat.start()
+        try:
+            while True:
+                conn.send({'type': 'request', 'variant': self._variant})
+                reply = conn.receive()
+                if reply is None:
+                    raise ConnectionError('The coordinator closed the connection')
+                match reply['type']:
+                    case 'done':
+                        return True
+                    case 'wait':
+                        time.sleep(self._heartbeat)
+                        continue
+                    case 'job':
+                        job = Job(**reply['job'])
+
+                workload = next(w for w in self._tool.all_workloads() if w.name == job.workload)
+                if self._variant != [job.workload, job.mutant]:
+                    # Builds are cached per variant: only rebuild when it changes.
+                    mutant = next(v for v in self._tool.all_variants(workload) if v.name == job.mutant)
+                    self._run_trial = self._tool.apply_variant(workload, mutant)
+                    self._variant = [job.workload, job.mutant]
+
+                records = self._run(job, workload, self._run_trial)
+                conn.send({'type': 'result', 'id': job.id, 'records': records})
+        finally:
+            stop.set()
+            heartbeat.join()
+            conn.close()
+
+    def _run(self, job: Job, workload: Entry, run_trial: Callable[[TrialConfig], None]) -> list[dict]:
+        file = f'job{job.id}'
+        cfg = TrialConfig(workload=workload,
+                          strategy=job.strategy,
+                          property=job.property,
+                          trials=1,
+                          timeout=job.timeout,
+                          label=job.label,
+                          file=file)
+        run_trial(cfg)
+
+        path = os.path.join(self._tool.results, f'{file}.json')
+        try:
+            with open(path) as f:
+                records = json.load(f)
+            os.remove(path)
+        except (FileNotFoundError, json.JSONDecodeError):
+            records = []
+        for record in records:
+            record['trial'] = job.trial
+        return records
+
+
+class _Connection:
+    ''' A socket exchanging JSON objects, one per line. '''
+
+    def __init__(self, sock: socket.socket, rfile=None):
+        self._sock = sock
+        self._rfile = rfile if rfile else sock.makefile('rb')
+        self._lock = threading.Lock()
+        self.last_seen = time.monotonic()
+
+    def send(self, message: dict) -> None:
+        data = (json.dumps(message) + '\n').encode()
+        with self._lock:
+            self._sock.sendall(data)
+
+    def receive(self) -> Optional[dict]:
+        line = self._rfile.readline()
+        return json.loads(line) if line else None
+
+    def __iter__(self):
+        while True:
+            try:
+                message = self.receive()
+            except (OSError, ValueError):
+                return
+            if message is None:
+                return
+            yield message
+
+    def close(self) -> None:
+        try:
+            self._sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self._sock.close()
+
+
+def expand(tool: BenchTool,
+           trials: int,
+           timeout: Optional[float] = None,
+           workloads: Optional[list[str]] = None,
+           coq: bool = False) -> list[Job]:
+    '''
+    One job per trial of every strategy on every property of every mutant.
+    '''
+    jobs = []
+    for workload in tool.all_workloads():
+        if workloads and workload.name not in workloads:
+            continue
+        for variant in tool.all_variants(workload):
+            if variant.name == 'base':
+                continue
+            for strategy in tool.all_strategies(workload):
+                for property in tool.all_properties(workload):
+                    for trial in range(trials):
+                        jobs.append(
+                            Job(id=len(jobs),
+                                workload=workload.name,
+                                mutant=variant.name,
+                                strategy=strategy.name,
+                                property=f'test_{property}' if coq else property,
+                                trial=trial,
+                                timeout=timeout))
+    return jobs
+
+
+def make_tool(language: str, results: str) -> BenchTool:
+    match language:
+        case 'coq':
+            return Coq(results, log_level=LogLevel.WARNING)
+        case 'haskell':
+            return Haskell(results, log_level=LogLevel.WARNING)
+
+
+if __name__ == '__main__':
+    p = argparse.ArgumentParser(description='Run an experiment on several workers.')
+    p.add_argument('role', choices=['coordinator', 'worker'])
+    p.add_argument('--language', choices=['coq', 'haskell'], required=True)
+    p.add_argument('--host', default='localhost', help='address of the coordinator')
+    p.add_argument('--port', type=int, default=PORT)
+    p.add_argument('--data', help='path to folder for JSON data (coordinator)')
+    p.add_argument('--workloads', help='comma-separated workloads (default: all)')
+    p.add_argument('--trials', type=int, default=1)
+    p.add_argument('--timeout', type=float, help='seconds per trial')
+    args = p.parse_args()
+
+    coq = args.language == 'coq'
+    tool = make_tool(args.language, tempfile.mkdtemp(prefix='distributed'))
+    match args.role:
+        case 'coordinator':
+            workloads = args.workloads.split(',') if args.workloads else None
+            jobs = expand(tool, args.trials, args.timeout, workloads, coq)
+            Coordinator(jobs, f'{os.getcwd()}/{args.data}', '0.0.0.0', args.port).serve()
+        case 'worker':
+            Worker(tool, args.host, args.port).run()
@@ -1,8 +1,14 @@
 import os
 import re
 import json
+import subprocess
+import tempfile
+from typing import Optional
+
 from benchtool.BenchTool import BenchTool
-from benchtool.Types import Config, Entry, LogLevel, ReplaceLevel, TrialArgs
+from benchtool.Telemetry import Telemetry
+from benchtool.Types import Config, Entry, LogLevel, ReplaceLevel, TrialArgs, Watchdog
+from benchtool.Util import file_hash
 
 
 class Haskell(BenchTool):
@@ -10,7 +16,10 @@ class Haskell(BenchTool):
     def __init__(self,
                  results: str,
                  log_level: LogLevel = LogLevel.INFO,
-                 replace_level: ReplaceLevel = ReplaceLevel.REPLACE):
+                 replace_level: ReplaceLevel = ReplaceLevel.REPLACE,
+                 jobs: int = 1,
+                 watchdog: Optional[Watchdog] = None,
+                 telemetry: Optional[Telemetry] = None):
         super().__init__(
             Config(
                 start='{-',  # Haskell multi-line comment syntax
@@ -23,7 +32,10 @@ class Haskell(BenchTool):
                 spec_path='src/Spec.hs'),
             results,
             log_level,
-            replace_level)
+            replace_level,
+            jobs=jobs,
+            watchdog=watchdog,
+            telemetry=telemetry)
 
     def all_properties(self, workload: Entry) -> set[str]:
         spec = os.path.join(workload.path, self._config.spec_path)
@@ -37,21 +49,67 @@ class Haskell(BenchTool):
         with self._change_dir(workload_path):
             self._shell_command(['stack', 'build'])
 
+    def _artifact_hash(self, workload_path: str) -> Optional[str]:
+        with self._change_dir(workload_path):
+            process = subprocess.run(['stack', 'exec', '--', 'which', 'etna-workload'],
+                                     capture_output=True,
+                                     text=True)
+        if process.returncode != 0:
+            return None
+        return file_hash(process.stdout.strip())
+
     def _run_trial(self, workload_path: str, params: TrialArgs):
 
+        extras = []
+
         def reformat():
             # Get JSONs into a format that
             # makes it easier to parse later on.
             with open(params.file) as f:
                 results = [json.loads(line) for line in f]
+            # Each trial appended its own lines (none if its runner crashed).
+            for start, end, extra in extras:
+                for result in results[start:end]:
+                    result.update(extra)
             open('file.txt', 'w').close()
             json.dump(results, open(params.file, 'w'))
 
+        # With a sweep, each runner process runs every point once,
+        # so it needs the timeout of every point.
+        points = params.sweep or []
+        timeout = params.timeout * len(points) if params.timeout and points else params.timeout
+
         with self._change_dir(workload_path):
             for _ in range(params.trials):
                 # Re-run per trial to avoid caching problems.
                 p = params.to_json()
-                self._shell_command(['stack', 'exec', 'etna-workload', '--', p])
+                # One capability and no parallel GC, so that a runner uses a single core.
+                cmd = ['stack', 'exec', 'etna-workload', '--', p, '+RTS', '-N1', '-qg', '-RTS']
+                if params.gc_stats:
+                    fd, stats_file = tempfile.mkstemp(suffix='.rts')
+                    os.close(fd)
+                    cmd += ['+RTS', f'-t{stats_file}', '--machine-readable', '-RTS']
+                # The runner enforces the timeout itself (via `System.Timeout`), but that
+                # cannot interrupt non-allocating loops, so the watchdog is the backstop.
+                before = self._count_results(params.file)
+                process = self._run_process(cmd, timeout, grace=self._watchdog.grace)
+                extra = {'timeout': params.timeout}
+                if process.usage:
+                    extra.update(process.usage.to_dict())
+                if params.gc_stats:
+                    extra.update(self._read_rts_stats(stats_file))
+                self._log(process.stdout, LogLevel.DEBUG)
+                self._log(process.stderr, LogLevel.DEBUG)
+                if process.timed_out or process.cpu_limited:
+                    reason = 'Timeout' if process.timed_out else 'CPU limit'
+                    self._log(f'{params.label} Result: {reason} (killed by watchdog)',
+                              LogLevel.WARNING)
+                    written = self._count_results(params.file) - before
+                    labels = [point.label for point in points[written:]] if points else [params.label]
+                    for label in labels:
+                        self._append_killed(params, label, process.cpu_limited)
+                # The points of a sweep share the resources of their process.
+                extras.append((before, self._count_results(params.file), extra))
 
                 if params.short_circuit:
                     # Optimization: terminate as soon as a task is not solved
@@ -63,5 +121,52 @@ class Haskell(BenchTool):
 
         reformat()
 
+    def _read_rts_stats(self, path: str) -> dict:
+        # Written by the GHC runtime (`+RTS -t<file> --machine-readable`) as a list of pairs.
+        with open(path) as f:
+            contents = f.read()
+        os.remove(path)
+
+        stats = dict(re.findall(r'\("([^"]*)",\s*"([^"]*)"\)', contents))
+        if not stats:
+            # e.g. the runner was killed by the watchdog.
+            self._log(f'No RTS statistics in {path}', LogLevel.WARNING)
+            return {}
+
+        def get(key, conv):
+            return conv(stats[key]) if key in stats else None
+
+        return {
+            'bytes_allocated': get('bytes allocated', int),
+            'gc_time': get('GC_cpu_seconds', float),
+            'max_live_bytes': get('max_bytes_used', int),
+            'gc_count': get('num_GCs', int),
+        }
+
+    def _count_results(self, path: str) -> int:
+        if not os.path.isfile(path):
+            return 0
+        with open(path) as f:
+            return sum(1 for line in f if line.strip())
+
+    def _append_killed(self, params: TrialArgs, label: str, cpu_limited: bool):
+        # Same as `defaultResult` in `Etna.Lib.Trial`, for runners killed by the watchdog.
+        # A runner killed for its CPU time did not reach the timeout, so it has no time.
+        result = {
+            'workload': params.workload,
+            'strategy': label,
+            'mutant': params.mutant,
+            'property': params.property,
+            'foundbug': False,
+            'passed': None,
+            'discards': None,
+            'time': None if cpu_limited else params.timeout,
+            'output': '',
+        }
+        if cpu_limited:
+            result['cpu_limited'] = True
+        with open(params.file, 'a') as f:
+            f.write(json.dumps(result, separators=(',', ':')) + '\n')
+
     def _preprocess(self, workload: Entry) -> None:
         pass
\ No newline at end of file
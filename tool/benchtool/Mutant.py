@@ -1,6 +1,5 @@
 import functools
 import os
-from platform import node
 import re
 from functools import reduce, partial
 
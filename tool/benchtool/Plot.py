@@ -1,15 +1,19 @@
-from dataclasses import dataclass
-from PIL import ImageColor
-from benchtool.Analysis import overall_solved, task_average
+import functools
+import hashlib
+import json
+import os
+from dataclasses import dataclass, field
+from benchtool.Analysis import KEYS, overall_solved, summarize, summary_average
 import pandas as pd
 import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
-from dash import Dash, html, dcc, Input, Output
-from typing import Literal, Optional
+from typing import Callable, Literal, Optional
 
 pd.options.mode.chained_assignment = None  # default='warn'
 
+MANIFEST = '.figures.json'
+
 
 def light_gradient(rgb: tuple[int, int, int], n: int) -> list[tuple[int, int, int]]:
     top: tuple[int, int, int] = (240, 241, 241)
@@ -28,6 +32,90 @@ class Bar:
     color: str = None
 
 
+@dataclass
+class FigureSpec:
+    '''
+    A figure for `render_figures`: `build(data, **options)` makes the figure,
+    which is written to `path`. Figures are built in worker processes, so
+    `build` must be a module-level function, and `data` should be the (small)
+    aggregate the figure shows rather than every trial.
+    '''
+    path: str
+    build: Callable[..., go.Figure]
+    data: pd.DataFrame
+    options: dict = field(default_factory=dict)
+    width: int = 1600
+    height: int = 900
+    scale: float = 1
+
+    def digest(self) -> str:
+        ''' Changes whenever the rendered image would. '''
+        h = hashlib.sha256()
+        h.update(f'{self.build.__module__}.{self.build.__qualname__}'.encode())
+        h.update(json.dumps(self.options, sort_keys=True, default=repr).encode())
+        h.update(f'{self.width}x{self.height}@{self.scale}'.encode())
+        h.update(self.data.to_csv().encode())
+        return h.hexdigest()
+
+
+def render_figures(specs: list[FigureSpec], jobs: Optional[int] = None, force: bool = False) -> list[str]:
+    '''
+    Renders the figures of `specs` to images, in up to `jobs` worker processes
+    (by default, one per core). Each worker keeps its Kaleido renderer between
+    figures, so it only starts once per worker instead of once per figure.
+
+    Figures whose spec has not changed since they were last rendered are skipped
+    (unless `force`); the digests are kept in `.figures.json` next to the images.
+
+    :return: The paths of the figures that were rendered.
+    '''
+    manifests = {}
+
+    def manifest(directory: str) -> dict:
+        if directory not in manifests:
+            try:
+                with open(os.path.join(directory, MANIFEST)) as f:
+                    manifests[directory] = json.load(f)
+            except (FileNotFoundError, json.JSONDecodeError):
+                manifests[directory] = {}
+        return manifests[directory]
+
+    pending = []
+    for spec in specs:
+        directory, name = os.path.split(os.path.abspath(spec.path))
+        digest = spec.digest()
+        if not force and os.path.isfile(spec.path) and manifest(directory).get(name) == digest:
+            continue
+        pending.append((spec, directory, name, digest))
+
+    def done(directory: str, name: str, digest: str):
+        manifest(directory)[name] = digest
+        with open(os.path.join(directory, MANIFEST), 'w') as f:
+            json.dump(manifests[directory], f, indent=2, sort_keys=True)
+
+    jobs = min(jobs if jobs else os.cpu_count(), len(pending))
+    if jobs <= 1:
+        for spec, directory, name, digest in pending:
+            _render(spec)
+            done(directory, name, digest)
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            futures = {pool.submit(_render, spec): (directory, name, digest)
+                       for spec, directory, name, digest in pending}
+            for future, (directory, name, digest) in futures.items():
+                future.result()
+                done(directory, name, digest)
+
+    return [spec.path for spec, _, _, _ in pending]
+
+
+def _render(spec: FigureSpec) -> None:
+    fig = spec.build(spec.data, **spec.options)
+    fig.write_image(spec.path, width=spec.width, height=spec.height, scale=spec.scale, engine='kaleido')
+
+
 def stacked_barchart_times(
     case: str,
     df: pd.DataFrame,
@@ -40,12 +128,60 @@ def stacked_barchart_times(
     agg: Literal['any', 'all'] = 'all',
     manual_bars: list[Bar] = [],
 ):
+    spec = stacked_barchart_spec(case, df, limits, limit_type, strategies, colors, image_path, agg,
+                                 manual_bars)
+    fig = spec.build(spec.data, **spec.options)
 
+    if image_path:
+        fig.write_image(spec.path,
+                        width=spec.width,
+                        height=spec.height,
+                        scale=spec.scale,
+                        engine='kaleido')
+
+    if show:
+        fig.show()
+
+
+def stacked_barchart_spec(
+    case: str,
+    df: pd.DataFrame,
+    limits: list[float],
+    limit_type: str,
+    strategies: list[str] = None,
+    colors: list[str] = None,
+    image_path: Optional[str] = None,
+    agg: Literal['any', 'all'] = 'all',
+    manual_bars: list[Bar] = [],
+) -> FigureSpec:
+    '''
+    The figure of `stacked_barchart_times`, for `render_figures`.
+    '''
     df = df[df['workload'] == case]
 
     if not strategies:
-        strategies = df.strategy.unique()
-
+        strategies = list(df.strategy.unique())
+
+    return FigureSpec(path=f'{image_path}/{case}.png',
+                      build=stacked_barchart,
+                      data=task_buckets(df, limits, limit_type, strategies, agg),
+                      options={
+                          'limits': limits,
+                          'strategies': strategies,
+                          'colors': colors,
+                          'manual_bars': manual_bars,
+                      })
+
+
+def task_buckets(df: pd.DataFrame,
+                 limits: list[float],
+                 limit_type: str,
+                 strategies: list[str],
+                 agg: Literal['any', 'all'] = 'all') -> pd.DataFrame:
+    '''
+    Number of tasks each strategy solved within each limit but not the previous
+    one (`rest`: not within any), as rows (`strategy`, `variable`, `value`).
+    '''
     tasks = df.task.unique()
     total_tasks = len(tasks)
 
@@ -69,7 +205,17 @@ def stacked_barchart_times(
     results = results.reset_index()
 
     results = results.melt(id_vars=['strategy'], value_vars=limits + ['rest'])
+    return results
+
 
+def stacked_barchart(results: pd.DataFrame,
+                     limits: list[float],
+                     strategies: list[str],
+                     colors: list[str] = None,
+                     manual_bars: list[Bar] = []) -> go.Figure:
+    '''
+    Stacked bars of the output of `task_buckets`, one per strategy.
+    '''
     if not colors:
         colors = [
             '#000000',  # black
@@ -84,6 +230,8 @@ def stacked_barchart_times(
             '#000000',  # black
         ]
 
+    from PIL import ImageColor
+
     extrapolated_colors = list(
         map(light_gradient, map(ImageColor.getrgb, colors), [len(limits) + 1] * len(colors)))
 
@@ -147,24 +295,50 @@ def stacked_barchart_times(
                 insidetextanchor='middle',
             ))
 
-    if image_path:
-        fig.write_image(f'{image_path}/{case}.png',
-                        width=1600,
-                        height=900,
-                        scale=1,
-                        engine='kaleido')
+    return fig
 
-    if show:
-        fig.show()
 
+def dashboard(df: Optional[pd.DataFrame], summary: Optional[pd.DataFrame] = None):
+    '''
+    Aggregates the trials in `df` per (workload, strategy, task) once, so that
+    callbacks only filter the (much smaller) aggregates of one workload.
+    `summary` can be passed instead of `df`, e.g. from `Analysis.summarize_results`.
+    '''
+    from dash import Dash, html, dcc, Input, Output
+
+    if summary is None:
+        summary = summarize(df)
+    summary = summary.astype({key: str for key in KEYS})
+    summary['everyone_solved'] = summary['found'] == summary['trials']
+    for col in ['time', 'inputs']:
+        summary = summary_average(summary, col)
+    summary = summary.sort_values(KEYS)
+    workloads = {workload: dfw for workload, dfw in summary.groupby('workload')}
+    strategies = list(summary['strategy'].unique())
+
+    @functools.lru_cache(maxsize=256)
+    def figure(workload: str, col: str, yscale: str, selected: tuple[str, ...]):
+        dff = workloads.get(workload, summary.iloc[:0])
+        dff = dff[dff['strategy'].isin(selected)]
+
+        # Note: this only includes tasks that everyone solved
+        solved = dff.groupby('task')['everyone_solved'].all()
+        dff = dff[dff['task'].isin(solved[solved].index)]
+
+        return px.bar(dff[['task', 'strategy', col, col + '_std']],
+                      x='task',
+                      y=col,
+                      color='strategy',
+                      barmode='group',
+                      error_y=col + '_std',
+                      log_y=yscale == 'log')
 
-def dashboard(df: pd.DataFrame):
     app = Dash(__name__)
 
     div_style = {'width': '31%', 'float': 'left', 'display': 'inline-block', 'margin-right': '15px'}
     app.layout = html.Div([
         html.Div([
-            html.Div([dcc.Dropdown(sorted(df['workload'].unique()), 'BST', id='workload')],
+            html.Div([dcc.Dropdown(sorted(workloads), 'BST', id='workload')],
                      style=div_style),
             html.Div([
                 dcc.Dropdown(['time', 'inputs'], 'time', id='col'),
@@ -172,8 +346,7 @@ def dashboard(df: pd.DataFrame):
             ],
                      style=div_style),
             html.Div([
-                dcc.Dropdown(
-                    df['strategy'].unique(), df['strategy'].unique(), id='strategies', multi=True)
+                dcc.Dropdown(strategies, strategies, id='strategies', multi=True)
             ],
                      style={
                          'width': '31%',
@@ -191,20 +364,7 @@ def dashboard(df: pd.DataFrame):
         Input('yscale', 'value'),
         Input('strategies', 'value'),
     )
-    def update_graph(workload, col, yscale, strategies):
-        dff = df[(df['workload'] == workload) & (df['strategy'].isin(strategies))]
-
-        # Note: this only includes tasks that everyone solved
-        dff = task_average(dff, col)
-
-        dff = dff.reset_index()
-        fig = px.bar(dff,
-                     x='task',
-                     y=col,
-                     color='strategy',
-                     barmode='group',
-                     error_y=col + '_std',
-                     log_y=yscale == 'log')
-        return fig
+    def update_graph(workload, col, yscale, selected):
+        return figure(workload, col, yscale, tuple(sorted(selected or [])))
 
     return app
\ No newline at end of file
@@ -0,0 +1,102 @@
+'''
+Sanity check to run before collecting data: builds the base (correct)
+implementation of each workload once, and runs every strategy on every
+property with a short timeout, in parallel. On base, no property should
+fail and no strategy should crash.
+
+Usage (from the root of the repository):
+
+    python3 -m benchtool.Preflight --language=haskell [--workloads=BST,RBT]
+'''
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+
+from benchtool.BenchTool import BenchTool
+from benchtool.Coq import Coq
+from benchtool.Haskell import Haskell
+from benchtool.Types import LogLevel, TrialConfig
+
+
+def preflight(tool: BenchTool,
+              workloads: list[str] | None = None,
+              timeout: float = 5,
+              coq: bool = False) -> list[str]:
+    '''
+    :return: Description of every problem found.
+    '''
+    problems = []
+
+    for workload in tool.all_workloads():
+        if workloads and workload.name not in workloads:
+            continue
+
+        base = next(v for v in tool.all_variants(workload) if v.name == 'base')
+        tool.apply_variant(workload, base)
+
+        cfgs = [
+            TrialConfig(workload=workload,
+                        strategy=strategy.name,
+                        property=f'test_{property}' if coq else property,
+                        trials=1,
+                        timeout=timeout) for strategy in tool.all_strategies(workload)
+            for property in tool.all_properties(workload)
+        ]
+        # Coq fuzzers share `qc_exec` (and its shared memory), so `run_parallel`
+        # runs them one at a time.
+        results = tempfile.mkdtemp(prefix='preflight')
+        codes = tool.run_parallel(cfgs, results)
+
+        for experiment, code in sorted(codes.items()):
+            problems += _check(results, experiment, code)
+
+    return problems
+
+
+def _check(results: str, experiment: str, code: int) -> list[str]:
+    if code != 0:
+        return [f'{experiment}: crashed (exit code {code})']
+
+    try:
+        with open(os.path.join(results, f'{experiment}.json')) as f:
+            records = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return [f'{experiment}: no results']
+
+    if not records:
+        return [f'{experiment}: no results']
+    if any(r['foundbug'] is None for r in records):
+        return [f'{experiment}: could not parse the output of the runner']
+    if any(r['foundbug'] for r in records):
+        output = next(r.get('output', '') for r in records if r['foundbug'])
+        return [f'{experiment}: fails on base ({output})']
+    return []
+
+
+if __name__ == '__main__':
+    p = argparse.ArgumentParser(description='Check every strategy and property on base.')
+    p.add_argument('--language', choices=['coq', 'haskell'], required=True)
+    p.add_argument('--workloads', help='comma-separated workloads (default: all)')
+    p.add_argument('--timeout', type=float, default=5, help='seconds per trial')
+    p.add_argument('--jobs', type=int, default=os.cpu_count(), help='trials to run at once')
+    args = p.parse_args()
+
+    results = tempfile.mkdtemp(prefix='preflight')
+    match args.language:
+        case 'coq':
+            tool = Coq(results, log_level=LogLevel.WARNING, jobs=args.jobs)
+        case 'haskell':
+            tool = Haskell(results, log_level=LogLevel.WARNING, jobs=args.jobs)
+
+    problems = preflight(tool,
+                         args.workloads.split(',') if args.workloads else None,
+                         args.timeout,
+                         coq=args.language == 'coq')
+    for problem in problems:
+        print(problem)
+    if problems:
+        sys.exit(1)
+    print('Preflight passed.')
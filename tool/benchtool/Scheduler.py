@@ -0,0 +1,84 @@
+import dataclasses
+import json
+import os
+
+from benchtool.BenchTool import BenchTool
+from benchtool.Types import Entry, LogLevel, TrialConfig, Variant
+from benchtool.Util import print_log
+
+
+def successive_halving(tool: BenchTool,
+                       workload: Entry,
+                       variants: list[Variant],
+                       cfgs: list[TrialConfig],
+                       min_timeout: float,
+                       max_timeout: float,
+                       eta: float = 3) -> dict[tuple[str, str, str], float]:
+    '''
+    Runs every strategy in `cfgs` on every variant with a timeout of `min_timeout`,
+    then reruns the pairs that are still competitive with a timeout `eta` times
+    larger, until `max_timeout`.
+
+    After each round, a (strategy, task) pair stops if it found the bug in every
+    trial. It is promoted if it found the bug in some trials, or if no other
+    strategy has found the bug in every trial of the task yet; otherwise it is
+    clearly behind, and its trials stay censored at the smaller timeout.
+
+    Each round is stored in its own file (suffixed with the timeout), and every
+    record has a `timeout` field; `Analysis.final_budget` keeps the last round
+    of each pair.
+
+    :return: The timeout of the last round of each (mutant, strategy, property).
+    '''
+
+    def label(cfg: TrialConfig) -> str:
+        return cfg.label if cfg.label else cfg.strategy
+
+    reached = {}
+    # Promotion only compares strategies on the same variant, so every round of
+    # a variant runs while it is applied, and each variant is only built once.
+    for variant in variants:
+        run_trial = tool.apply_variant(workload, variant)
+        live = list(cfgs)
+        solved_properties = set()
+        timeout = min_timeout
+
+        while live:
+            print_log(f'Running {len(live)} strategies on {variant.name} with timeout {timeout}s',
+                      LogLevel.INFO, tool.log_level)
+            tool.telemetry.plan(len(live))
+            outcomes = {}
+            for cfg in live:
+                file = f'{workload.name},{label(cfg)},{variant.name},{cfg.property},{timeout:g}s'
+                run_trial(dataclasses.replace(cfg, timeout=timeout, file=file))
+                outcomes[(label(cfg), cfg.property)] = _found(tool.results, file)
+                reached[(variant.name, label(cfg), cfg.property)] = timeout
+
+            for (_, property), (found, trials) in outcomes.items():
+                if trials and found == trials:
+                    solved_properties.add(property)
+
+            def promote(cfg: TrialConfig) -> bool:
+                found, trials = outcomes[(label(cfg), cfg.property)]
+                if trials and found == trials:
+                    return False
+                return found > 0 or cfg.property not in solved_properties
+
+            if timeout >= max_timeout:
+                break
+            live = [cfg for cfg in live if promote(cfg)]
+            timeout = min(timeout * eta, max_timeout)
+
+    return reached
+
+
+def _found(results: str, file: str) -> tuple[int, int]:
+    '''
+    :return: Number of trials in `file` that found the bug, and number of trials.
+    '''
+    try:
+        with open(os.path.join(results, f'{file}.json')) as f:
+            records = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return 0, 0
+    return sum(1 for r in records if r.get('foundbug')), len(records)
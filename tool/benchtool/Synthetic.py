@@ -0,0 +1,141 @@
+'''
+A stand-in language for testing and benchmarking `BenchTool` itself,
+without Stack or Coq.
+
+Implementations are shell scripts, with mutants marked as for the other
+languages, inside `: '...'` no-op commands:
+
+    : '! '
+    BUG=${BUG}
+    : '!! insert_1 '
+    : '!
+    BUG=insert_1
+    '
+
+Building does nothing, and every trial runs `run.sh`, which sources the
+implementation and the strategy (`Strategies/<strategy>.sh`, which sets `SLEEP`
+and `FIND`), sleeps, and reports that it found the bug if `BUG` is set and the
+strategy finds bugs. `make_workload` generates such workloads at any scale.
+'''
+
+import json
+import os
+import re
+from typing import Optional
+
+from benchtool.BenchTool import BenchTool
+from benchtool.Telemetry import Telemetry
+from benchtool.Types import Config, Entry, LogLevel, ReplaceLevel, TrialArgs, Watchdog
+
+RUNNER = '''#!/bin/sh
+# Usage: run.sh <strategy> <property>
+. ./Impl.sh
+. ./Strategies/$1.sh
+sleep "$SLEEP"
+if [ -n "$BUG" ] && [ "$FIND" = 1 ]; then found=true; passed=0; else found=false; passed=1; fi
+echo "{\\"foundbug\\": $found, \\"passed\\": $passed, \\"discards\\": 0, \\"time\\": $SLEEP}"
+'''
+
+
+class Synthetic(BenchTool):
+
+    def __init__(self,
+                 results: str,
+                 path: str = 'workloads/Synthetic',
+                 log_level: LogLevel = LogLevel.INFO,
+                 replace_level: ReplaceLevel = ReplaceLevel.REPLACE,
+                 jobs: int = 1,
+                 watchdog: Optional[Watchdog] = None,
+                 telemetry: Optional[Telemetry] = None):
+        '''
+        `path` must be relative to the working directory.
+        '''
+        super().__init__(
+            Config(
+                start=": '",  # Shell no-op command with a quoted argument
+                end="'",
+                ext='.sh',
+                path=path,
+                ignore='common',
+                strategies='Strategies',
+                impl_path='.',
+                spec_path='Spec.sh'),
+            results,
+            log_level,
+            replace_level,
+            jobs=jobs,
+            watchdog=watchdog,
+            telemetry=telemetry)
+
+    def all_properties(self, workload: Entry) -> list[str]:
+        spec = os.path.join(workload.path, self._config.spec_path)
+        with open(spec) as f:
+            return list(dict.fromkeys(re.findall(r'prop_\w+', f.read())))
+
+    def _build(self, workload_path: str):
+        pass
+
+    def _preprocess(self, workload: Entry) -> None:
+        pass
+
+    def _run_trial(self, workload_path: str, params: TrialArgs):
+        with self._change_dir(workload_path):
+            results = []
+            for _ in range(params.trials):
+                trial_result = {
+                    'workload': params.workload,
+                    'strategy': params.label,
+                    'mutant': params.mutant,
+                    'property': params.property,
+                    'foundbug': False,
+                    'passed': None,
+                    'discards': None,
+                    'time': params.timeout,
+                    'output': '',
+                    'timeout': params.timeout,
+                }
+                process = self._run_process(['sh', 'run.sh', params.strategy, params.property],
+                                            params.timeout)
+                if process.cpu_limited:
+                    trial_result.update({'time': None, 'cpu_limited': True})
+                elif not process.timed_out:
+                    trial_result.update(json.loads(process.stdout))
+                if process.usage:
+                    trial_result.update(process.usage.to_dict())
+
+                results.append(trial_result)
+                if params.short_circuit and not trial_result['foundbug']:
+                    break
+
+            with open(params.file, 'w') as f:
+                json.dump(results, f)
+
+
+def make_workload(path: str,
+                  mutants: int,
+                  strategies: dict[str, tuple[float, bool]],
+                  properties: int,
+                  block: int = 10) -> None:
+    '''
+    Writes a synthetic workload to `path`, with `mutants` mutants in blocks
+    of `block`, `properties` properties, and one strategy per entry of
+    `strategies`, which maps names to (seconds per trial, whether it finds bugs).
+    '''
+    os.makedirs(os.path.join(path, 'Strategies'), exist_ok=True)
+
+    with open(os.path.join(path, 'Impl.sh'), 'w') as f:
+        f.write('#!/bin/sh\nBUG=\n')
+        for start in range(0, mutants, block):
+            f.write(": '! '\nBUG=${BUG}\n")
+            for i in range(start, min(start + block, mutants)):
+                f.write(f": '!! mutant_{i} '\n: '!\nBUG=mutant_{i}\n'\n")
+
+    with open(os.path.join(path, 'Spec.sh'), 'w') as f:
+        f.writelines(f'prop_{i}\n' for i in range(properties))
+
+    with open(os.path.join(path, 'run.sh'), 'w') as f:
+        f.write(RUNNER)
+
+    for name, (sleep, find) in strategies.items():
+        with open(os.path.join(path, 'Strategies', f'{name}.sh'), 'w') as f:
+            f.write(f'SLEEP={sleep}\nFIND={int(find)}\n')
@@ -0,0 +1,259 @@
+'''
+Live progress of a campaign: jobs (trials of one task) completed and remaining,
+time spent building and running trials, watchdog timeouts, and an ETA.
+
+A `BenchTool` reports to its `telemetry`, including from the processes forked
+by `run_parallel` and `race` (events are sent to the parent over a pipe). The
+totals are written to a status JSON file every `interval` seconds and, with a
+`port`, served in Prometheus text format at `http://<host>:<port>/metrics`
+(and as JSON at `/status`).
+
+Remaining jobs and the ETA need the number of jobs of the campaign, given with
+`plan` (e.g. by `BenchTool.run_all`). The ETA assumes the remaining
+jobs complete at the rate observed so far, builds included.
+
+    python3 -m benchtool.Telemetry data/4.1/telemetry/status.json
+'''
+
+import argparse
+import atexit
+import json
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Optional
+
+
+class Telemetry:
+
+    def __init__(self,
+                 status: Optional[str] = None,
+                 port: Optional[int] = None,
+                 host: str = 'localhost',
+                 interval: float = 5.0):
+        # `BenchTool` changes directory while it builds and runs trials.
+        self.status = os.path.abspath(status) if status else None
+        self._interval = interval
+        self._start = time.monotonic()
+        self._planned = 0
+        self._completed = 0
+        self._skipped = 0
+        self._running: dict[str, float] = {}
+        self._trial_seconds = 0.0
+        self._builds = 0
+        self._build_seconds = 0.0
+        self._timeouts = 0
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+        self._flushed = threading.Event()
+        self._server = None
+
+        # Events go through a pipe (writes of less than `PIPE_BUF` bytes are atomic),
+        # so that forked trials report to this process, in order with its own events.
+        self._read, self._write = os.pipe()
+        threading.Thread(target=self._receive, daemon=True).start()
+
+        if status or port is not None:
+            atexit.register(self.close)
+        if status:
+            os.makedirs(os.path.dirname(self.status), exist_ok=True)
+            threading.Thread(target=self._publish, daemon=True).start()
+        if port is not None:
+            self._serve(host, port)
+
+    def plan(self, jobs: int) -> None:
+        ''' Adds `jobs` to the number of jobs expected in the campaign. '''
+        self._send('plan', jobs)
+
+    def build(self, seconds: float) -> None:
+        self._send('build', seconds)
+
+    def trial_started(self, experiment: str) -> None:
+        self._send('started', experiment)
+
+    def trial_finished(self, experiment: str, skipped: bool = False) -> None:
+        '''
+        Records the end of the trials of `experiment`; `skipped` if they
+        did not run (e.g. results already exist), or were cancelled.
+        '''
+        self._send('skipped' if skipped else 'finished', experiment)
+
+    def timeout(self) -> None:
+        ''' Records a runner killed by the watchdog. '''
+        self._send('timeout', None)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._start
+            remaining = (max(0, self._planned - self._completed - self._skipped)
+                         if self._planned else None)
+            rate = self._completed / elapsed if elapsed > 0 else 0.0
+            eta = remaining / rate if remaining is not None and rate > 0 else None
+            return {
+                'updated': datetime.now().isoformat(timespec='seconds'),
+                'elapsed': elapsed,
+                'jobs': {
+                    'planned': self._planned if self._planned else None,
+                    'completed': self._completed,
+                    'skipped': self._skipped,
+                    'running': len(self._running),
+                    'remaining': remaining,
+                },
+                'running': {e: now - start for e, start in self._running.items()},
+                'builds': {
+                    'count': self._builds,
+                    'seconds': self._build_seconds,
+                },
+                'trials': {
+                    'seconds': self._trial_seconds,
+                    'mean_seconds': self._trial_seconds / self._completed if self._completed else None,
+                },
+                'timeouts': self._timeouts,
+                'jobs_per_second': rate,
+                'eta': eta,
+            }
+
+    def prometheus(self) -> str:
+        ''' The snapshot, in Prometheus text format. '''
+        s = self.snapshot()
+        metrics = [
+            ('etna_jobs_planned', 'gauge', 'Jobs expected in the campaign.', s['jobs']['planned']),
+            ('etna_jobs_completed_total', 'counter', 'Jobs whose trials ran.', s['jobs']['completed']),
+            ('etna_jobs_skipped_total', 'counter', 'Jobs skipped or cancelled.', s['jobs']['skipped']),
+            ('etna_jobs_running', 'gauge', 'Jobs running.', s['jobs']['running']),
+            ('etna_jobs_remaining', 'gauge', 'Jobs left to run.', s['jobs']['remaining']),
+            ('etna_builds_total', 'counter', 'Variants built.', s['builds']['count']),
+            ('etna_build_seconds_total', 'counter', 'Time spent building.', s['builds']['seconds']),
+            ('etna_trial_seconds_total', 'counter', 'Time spent running trials.', s['trials']['seconds']),
+            ('etna_timeouts_total', 'counter', 'Runners killed by the watchdog.', s['timeouts']),
+            ('etna_elapsed_seconds', 'gauge', 'Time since the campaign started.', s['elapsed']),
+            ('etna_jobs_per_second', 'gauge', 'Jobs completed per second so far.', s['jobs_per_second']),
+            ('etna_eta_seconds', 'gauge', 'Estimated time until the remaining jobs complete.', s['eta']),
+        ]
+        lines = []
+        for name, kind, help, value in metrics:
+            if value is None:
+                continue
+            lines += [f'# HELP {name} {help}', f'# TYPE {name} {kind}', f'{name} {value}']
+        return '\n'.join(lines) + '\n'
+
+    def write(self) -> None:
+        ''' Rewrites the status file (atomically, for readers polling it). '''
+        if not self.status:
+            return
+        temp = f'{self.status}.tmp'
+        with open(temp, 'w') as f:
+            json.dump(self.snapshot(), f, indent=2)
+        os.replace(temp, self.status)
+
+    def close(self) -> None:
+        ''' Stops publishing, after a last write of the status file. '''
+        if self._closed.is_set():
+            return
+        self._closed.set()
+        # Let the events already sent be counted.
+        self._send('flush', None)
+        self._flushed.wait(1.0)
+        self.write()
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+
+    def _send(self, kind: str, value) -> None:
+        os.write(self._write, (json.dumps([kind, value, time.monotonic()]) + '\n').encode())
+
+    def _receive(self) -> None:
+        with os.fdopen(self._read, 'rb', buffering=0) as pipe:
+            buffer = b''
+            while chunk := pipe.read(1 << 16):
+                *lines, buffer = (buffer + chunk).split(b'\n')
+                with self._lock:
+                    for line in lines:
+                        self._apply(*json.loads(line))
+
+    def _apply(self, kind: str, value, at: float) -> None:
+        match kind:
+            case 'plan':
+                self._planned += value
+            case 'build':
+                self._builds += 1
+                self._build_seconds += value
+            case 'started':
+                self._running[value] = at
+            case 'finished':
+                self._completed += 1
+                self._trial_seconds += at - self._running.pop(value, at)
+            case 'skipped':
+                self._skipped += 1
+                self._running.pop(value, None)
+            case 'timeout':
+                self._timeouts += 1
+            case 'flush':
+                self._flushed.set()
+
+    def _publish(self) -> None:
+        while not self._closed.wait(self._interval):
+            self.write()
+
+    def _serve(self, host: str, port: int) -> None:
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        telemetry = self
+
+        class Handler(BaseHTTPRequestHandler):
+
+            def do_GET(self):
+                match self.path:
+                    case '/metrics':
+                        body, kind = telemetry.prometheus(), 'text/plain; version=0.0.4'
+                    case '/status':
+                        body, kind = json.dumps(telemetry.snapshot()), 'application/json'
+                    case _:
+                        self.send_error(404)
+                        return
+                self.send_response(200)
+                self.send_header('Content-Type', kind)
+                self.end_headers()
+                self.wfile.write(body.encode())
+
+            def log_message(self, *_):
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+
+def describe(status: dict) -> str:
+    ''' One line summary of a status snapshot. '''
+    jobs = status['jobs']
+    done = jobs['completed'] + jobs['skipped']
+    progress = f'{done}/{jobs["planned"]}' if jobs['planned'] else f'{done}'
+    eta = f', ETA {_duration(status["eta"])}' if status['eta'] is not None else ''
+    return (f'{progress} jobs ({jobs["running"]} running, {jobs["skipped"]} skipped), '
+            f'{status["jobs_per_second"] * 3600:.1f} jobs/h, '
+            f'build {_duration(status["builds"]["seconds"])}, '
+            f'trials {_duration(status["trials"]["seconds"])}, '
+            f'{status["timeouts"]} timeouts{eta}')
+
+
+def _duration(seconds: float) -> str:
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f'{hours}:{minutes:02}:{seconds:02}'
+
+
+if __name__ == '__main__':
+    p = argparse.ArgumentParser(description='Show the progress of a running campaign.')
+    p.add_argument('status', help='path to the status file')
+    p.add_argument('--watch', type=float, help='reprint every this many seconds')
+    args = p.parse_args()
+
+    while True:
+        with open(args.status) as f:
+            print(f'{datetime.now().strftime("%H:%M:%S")} {describe(json.load(f))}')
+        if not args.watch:
+            break
+        time.sleep(args.watch)
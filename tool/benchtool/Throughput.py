@@ -0,0 +1,145 @@
+'''
+Generator throughput: runs every strategy on every property of the base
+(correct) implementation of each workload for a fixed number of tests,
+and records tests per second, the discard rate and (for Haskell) the
+average size of the generated inputs.
+
+Records are appended to `throughput/<workload>,<strategy>,<property>.json`
+in the results directory, with the date and commit they were measured at,
+so throughput can be tracked over time; see `Analysis.parse_throughput`.
+
+Usage (from the root of the repository):
+
+    python3 -m benchtool.Throughput --language=haskell --data=data [--workloads=BST,RBT] [--tests=10000]
+'''
+
+import argparse
+import datetime
+import json
+import os
+import subprocess
+import tempfile
+from typing import Optional
+
+from benchtool.BenchTool import BenchTool
+from benchtool.Coq import Coq
+from benchtool.Haskell import Haskell
+from benchtool.Types import LogLevel, TrialConfig
+from benchtool.Util import print_log
+
+
+def throughput(tool: BenchTool,
+               data: str,
+               workloads: list[str] | None = None,
+               tests: int = 10000,
+               trials: int = 3,
+               timeout: float = 600,
+               measure: int | None = 10,
+               coq: bool = False) -> list[dict]:
+    '''
+    Trials run one at a time, so that they do not compete for the CPU.
+    `timeout` only guards against strategies that cannot run `tests` tests;
+    their records have no throughput.
+
+    :return: The records appended to `data`.
+    '''
+    store = os.path.join(data, 'throughput')
+    os.makedirs(store, exist_ok=True)
+    results = tempfile.mkdtemp(prefix='throughput')
+    date = datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds')
+    commit = _commit()
+
+    added = []
+    for workload in tool.all_workloads():
+        if workloads and workload.name not in workloads:
+            continue
+
+        base = next(v for v in tool.all_variants(workload) if v.name == 'base')
+        run_trial = tool.apply_variant(workload, base)
+
+        for strategy in tool.all_strategies(workload):
+            for property in tool.all_properties(workload):
+                property = f'test_{property}' if coq else property
+                experiment = f'{workload.name},{strategy.name},{property}'
+                cfg = TrialConfig(workload=workload,
+                                  strategy=strategy.name,
+                                  property=property,
+                                  trials=trials,
+                                  timeout=timeout,
+                                  max_success=tests,
+                                  measure=measure,
+                                  file=os.path.join(results, experiment))
+                run_trial(cfg)
+
+                try:
+                    with open(os.path.join(results, f'{experiment}.json')) as f:
+                        records = [_rates(r) for r in json.load(f)]
+                except (FileNotFoundError, json.JSONDecodeError):
+                    print_log(f'No results for {experiment}', LogLevel.WARNING, tool.log_level)
+                    continue
+
+                for record in records:
+                    record.update({'tests': tests, 'date': date, 'commit': commit})
+                _append(os.path.join(store, f'{experiment}.json'), records)
+                added += records
+
+    return added
+
+
+def _rates(record: dict) -> dict:
+    '''
+    Adds `tests_per_sec`, `discard_rate` and `valsize` to the record of a trial.
+    They are None when the trial did not report what they are computed from.
+    '''
+    passed, discards, time = record.get('passed'), record.get('discards'), record.get('time')
+    valid = passed is not None and time is not None and time > 0
+    record['tests_per_sec'] = passed / time if valid else None
+    if passed is not None and discards is not None and passed + discards > 0:
+        record['discard_rate'] = discards / (passed + discards)
+    else:
+        record['discard_rate'] = None
+    record.setdefault('valsize', None)
+    return record
+
+
+def _append(path: str, records: list[dict]) -> None:
+    stored = []
+    if os.path.isfile(path):
+        with open(path) as f:
+            stored = json.load(f)
+    with open(path, 'w') as f:
+        json.dump(stored + records, f)
+
+
+def _commit() -> Optional[str]:
+    process = subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True)
+    return process.stdout.strip() if process.returncode == 0 else None
+
+
+if __name__ == '__main__':
+    p = argparse.ArgumentParser(description='Measure the throughput of every strategy on base.')
+    p.add_argument('--language', choices=['coq', 'haskell'], required=True)
+    p.add_argument('--data', required=True, help='path to the results directory')
+    p.add_argument('--workloads', help='comma-separated workloads (default: all)')
+    p.add_argument('--tests', type=int, default=10000, help='tests per trial')
+    p.add_argument('--trials', type=int, default=3)
+    p.add_argument('--timeout', type=float, default=600, help='seconds per trial')
+    args = p.parse_args()
+
+    results = tempfile.mkdtemp(prefix='throughput')
+    match args.language:
+        case 'coq':
+            tool = Coq(results, log_level=LogLevel.WARNING)
+        case 'haskell':
+            tool = Haskell(results, log_level=LogLevel.WARNING)
+
+    records = throughput(tool,
+                         f'{os.getcwd()}/{args.data}',
+                         args.workloads.split(',') if args.workloads else None,
+                         args.tests,
+                         args.trials,
+                         args.timeout,
+                         coq=args.language == 'coq')
+    for record in records:
+        rate = f'{record["tests_per_sec"]:.0f} tests/s' if record['tests_per_sec'] else 'no throughput'
+        print(f'{record["workload"]},{record["strategy"]},{record["property"]}: {rate}')
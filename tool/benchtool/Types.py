@@ -5,6 +5,7 @@ import json
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import IntEnum
+from typing import Callable
 
 FilePath = str
 
@@ -119,6 +120,23 @@ class Entry:
     path: FilePath
 
 
+@dataclass
+class SweepPoint:
+    '''
+    Generator parameters for one point of a sweep. Parameters that are
+    not provided keep the value chosen by the strategy.
+    '''
+
+    label: str
+    ''' Strategy label recorded in the results of this point. '''
+    size: int | None = None
+    ''' Size, for QuickCheck generators that read it (e.g. BST `Size`). '''
+    depth: int | None = None
+    ''' SmallCheck depth. '''
+    cap: int | None = None
+    ''' Number of tests (SmallCheck and LeanCheck). '''
+
+
 @dataclass
 class TrialArgs:
     file: str
@@ -130,6 +148,14 @@ class TrialArgs:
     label: str
     timeout: float | None = None
     short_circuit: bool = False
+    gc_stats: bool = False
+    profile: int | None = None
+    measure: int | None = None
+    reservoir: int | None = None
+    replay_keys: list[str] | None = None
+    max_success: int | None = None
+    max_discard: int | None = None
+    sweep: list[SweepPoint] | None = None
 
     def to_json(self) -> str:
         return json.dumps(dataclasses.asdict(self))
@@ -145,6 +171,98 @@ class TrialConfig:
     label: str | None = None  # if not provided, use same as strategy
     timeout: float | None = None  # in seconds
     short_circuit: bool = False
+    gc_stats: bool = False  # also record allocation and GC statistics of the runner
+    profile: int | None = None  # time every n-th check, to split time into generating and checking
+    measure: int | None = None  # measure the size of every n-th input, as `valsize` (Haskell only)
+    reservoir: int | None = None  # with `measure`, summarize a uniform sample of this many inputs as `valstats`
+    corpus: str | None = None  # check the counterexamples stored in this corpus first, and add new ones (see `Corpus`)
+    max_success: int | None = None  # number of tests; if not provided, run until timeout
+    max_discard: int | None = None  # number of discarded tests; if not provided, unbounded (ignored by LeanCheck)
+    sweep: list[SweepPoint] | None = None  # run each point in the same runner process (Haskell only)
+
+
+@dataclass
+class Watchdog:
+    ''' Limits enforced on every runner process spawned for a trial. '''
+
+    grace: float = 5.0
+    '''
+    Seconds added to the trial timeout for runners that enforce
+    the timeout themselves, before the watchdog kills them.
+    '''
+    cpu_factor: float = 1.0
+    '''
+    `RLIMIT_CPU` of a runner, as a multiple of its wall-clock limit. A runner
+    on one core reaches its wall-clock limit first; with the default, only a
+    runner that keeps more than one core busy is stopped by its CPU limit.
+    '''
+
+
+@dataclass
+class ResourceUsage:
+    '''
+    Resources used by a runner process (including the children
+    it waited for), as reported by `wait4`.
+    '''
+
+    walltime: float
+    ''' Seconds between spawning and reaping the process. '''
+    utime: float
+    ''' User CPU time, in seconds. '''
+    stime: float
+    ''' System CPU time, in seconds. '''
+    maxrss_kb: int
+    ''' Peak resident set size, in kilobytes. '''
+    nvcsw: int
+    ''' Voluntary context switches. '''
+    nivcsw: int
+    ''' Involuntary context switches. '''
+
+    def to_dict(self) -> dict:
+        return dataclasses.asdict(self)
+
+
+@dataclass
+class ProcessResult:
+    ''' Outcome of a runner process spawned under the watchdog. '''
+
+    returncode: int | None
+    stdout: str
+    stderr: str
+    timed_out: bool
+    ''' Whether the process was killed for exceeding its wall-clock limit. '''
+    usage: ResourceUsage | None = None
+    stopped: bool = False
+    ''' Whether the process was killed early, because its result was already in its output. '''
+    cpu_limited: bool = False
+    ''' Whether the process was killed for exceeding its CPU limit. '''
+
+
+@dataclass
+class Job:
+    ''' One trial handed out by a `Distributed.Coordinator`. '''
+
+    id: int
+    workload: str
+    mutant: str
+    strategy: str
+    property: str
+    trial: int
+    ''' Index of the trial among those of the same task. '''
+    timeout: float | None = None
+    label: str | None = None
+
+
+@dataclass
+class BuildStep:
+    ''' A single node in a build graph. '''
+
+    name: str
+    ''' Unique name, used by other steps to refer to this one. '''
+    action: list[str] | Callable[[], None]
+    ''' Command to run, or a Python callable. '''
+    deps: list[str] = dataclasses.field(default_factory=list)
+    ''' Names of steps that must finish before this one starts. '''
 
 
 class LogLevel(IntEnum):
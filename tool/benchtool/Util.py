@@ -1,6 +1,9 @@
+import collections
+import hashlib
+import io
 import os
 from datetime import datetime
-from typing import Any, Callable, TypeVar
+from typing import Any, Callable, Optional, TypeVar
 
 from benchtool.Types import Entry, LogLevel
 
@@ -49,6 +52,129 @@ class ChangeDir(object):
         return False
 
 
+class ContentWriter(io.StringIO):
+    '''
+    Buffers writes to a file and only replaces the file on exit
+    if the hash of its contents changed, so that unchanged files
+    keep their timestamps (and are not rebuilt by `make`).
+
+    Usage:
+    ```
+    with ContentWriter(path) as f:
+        f.write(...)
+    ```
+    '''
+
+    def __init__(self, path: str):
+        super().__init__()
+        self.path = path
+        self.changed = False
+
+    def __exit__(self, exc_type, _b, _c):
+        if exc_type is None:
+            contents = self.getvalue()
+            self.changed = file_hash(self.path) != content_hash(contents)
+            if self.changed:
+                with open(self.path, 'w') as f:
+                    f.write(contents)
+        return super().__exit__(exc_type, _b, _c)
+
+
+class OutputScanner:
+    '''
+    Scans the output of a runner as it arrives. Keeps every region between
+    one of the `markers` (pairs of start and end strings, e.g. the `[|` and `|]`
+    around a result), plus the last `tail` characters of the whole output for
+    error reporting, so memory stays bounded however much the runner prints.
+
+    `done` is set once a region ending with `until` is complete.
+    '''
+
+    def __init__(self, markers: list[tuple[str, str]], until: Optional[str] = None, tail: int = 1 << 16):
+        self.done = False
+        self._markers = markers
+        self._until = until
+        self._limit = tail
+        self._tail = collections.deque()
+        self._tail_size = 0
+        self._regions = []
+        self._open = None  # End marker of the region being read, if any.
+        self._region = []
+        self._region_size = 0
+        self._carry = ''  # Text that may be the beginning of a marker.
+
+    def feed(self, text: str) -> None:
+        self._keep_tail(text)
+        if not self._markers:
+            return
+        text = self._carry + text
+        self._carry = ''
+        while text:
+            if self._open is None:
+                found = [(text.find(start), start, end) for start, end in self._markers]
+                found = [f for f in found if f[0] != -1]
+                if not found:
+                    keep = max(len(start) for start, _ in self._markers) - 1
+                    self._carry = text[max(0, len(text) - keep):]
+                    return
+                i, start, self._open = min(found)
+                self._region = [start]
+                self._region_size = len(start)
+                text = text[i + len(start):]
+            else:
+                end = self._open
+                i = text.find(end)
+                if i == -1:
+                    cut = max(0, len(text) - (len(end) - 1))
+                    self._add_to_region(text[:cut])
+                    self._carry = text[cut:]
+                    return
+                self._add_to_region(text[:i + len(end)])
+                if self._open is not None:
+                    self._regions.append(''.join(self._region))
+                    self._open = None
+                    self.done = self.done or end == self._until
+                self._region = []
+                text = text[i + len(end):]
+
+    def text(self) -> str:
+        '''
+        The regions found, followed by the tail of the output.
+        '''
+        return ''.join(self._regions) + '\n' + ''.join(self._tail)[-self._limit:]
+
+    def _add_to_region(self, text: str) -> None:
+        self._region.append(text)
+        self._region_size += len(text)
+        if self._region_size > self._limit:
+            # Not a region after all (or a runaway one): give up on it.
+            self._open = None
+            self._region = []
+
+    def _keep_tail(self, text: str) -> None:
+        self._tail.append(text)
+        self._tail_size += len(text)
+        while self._tail_size - len(self._tail[0]) >= self._limit:
+            self._tail_size -= len(self._tail.popleft())
+
+
+def content_hash(contents: str | bytes) -> str:
+    if isinstance(contents, str):
+        contents = contents.encode()
+    return hashlib.sha256(contents).hexdigest()
+
+
+def file_hash(path: str) -> str | None:
+    ''' Hash of the contents of `path`, or `None` if it does not exist. '''
+    if not os.path.isfile(path):
+        return None
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
 def print_log(msg: str, msg_level: LogLevel, log_level: LogLevel):
     if msg_level >= log_level:
         time = datetime.now().strftime('%H:%M:%S')
@@ -0,0 +1,17 @@
+'''
+The orchestration core (`BenchTool`, `Haskell`, `Coq`, `Types`, ...) only
+imports the standard library, so that collection scripts and workers start
+quickly. `Analysis` and `Plot` need pandas and plotly; submodules are only
+imported when they are first used, e.g. `benchtool.Analysis` after `import benchtool`.
+'''
+
+import importlib
+
+
+def __getattr__(name: str):
+    try:
+        return importlib.import_module(f'{__name__}.{name}')
+    except ModuleNotFoundError as e:
+        if e.name != f'{__name__}.{name}':
+            raise
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}') from None
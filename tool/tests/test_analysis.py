@@ -0,0 +1,109 @@
+'''
+Checks the survival analysis and the streaming summaries of `Analysis`
+against small hand-computed examples.
+
+    python3 -m unittest discover tool/tests
+'''
+
+import json
+import os
+import tempfile
+import unittest
+
+try:
+    import pandas as pd
+    from benchtool.Analysis import (kaplan_meier, parse_results, restricted_mean_time, summarize,
+                                    summarize_results, survival_data)
+except ImportError:
+    pd = None
+
+
+def trials(*records: dict) -> 'pd.DataFrame':
+    return pd.DataFrame([{'workload': 'W', 'strategy': 'S', 'task': 'T', 'timeout': 10.0, **r} for r in records])
+
+
+@unittest.skipUnless(pd, 'needs pandas')
+class TestSurvival(unittest.TestCase):
+
+    def setUp(self):
+        # Found at 1 and 3; stopped by the CPU limit after 2s; timed out at 10.
+        self.df = trials(
+            {'foundbug': True, 'time': 1.0},
+            {'foundbug': True, 'time': 3.0},
+            {'foundbug': False, 'time': None, 'cpu_limited': True, 'walltime': 2.0},
+            {'foundbug': False, 'time': None},
+        )
+
+    def test_censoring(self):
+        df = survival_data(self.df)
+        self.assertEqual(df['duration'].tolist(), [1.0, 3.0, 2.0, 10.0])
+        self.assertEqual(df['event'].tolist(), [True, True, False, False])
+
+    def test_cpu_limited_without_walltime_is_dropped(self):
+        df = survival_data(self.df.drop(columns=['walltime']))
+        self.assertEqual(df['duration'].tolist(), [1.0, 3.0, 10.0])
+
+    def test_kaplan_meier(self):
+        km = kaplan_meier(self.df)
+        self.assertEqual(km['time'].tolist(), [1.0, 2.0, 3.0, 10.0])
+        self.assertEqual(km['at_risk'].tolist(), [4, 3, 2, 1])
+        # 3/4 after the first event, then 1/2 of the two trials left at 3.
+        self.assertEqual(km['survival'].tolist(), [0.75, 0.75, 0.375, 0.375])
+
+    def test_restricted_mean_time(self):
+        [rmst] = restricted_mean_time(self.df, tau=10)['rmst']
+        # 1 + 0.75 * (3 - 1) + 0.375 * (10 - 3)
+        self.assertAlmostEqual(rmst, 5.125)
+
+
+@unittest.skipUnless(pd, 'needs pandas')
+class TestSummary(unittest.TestCase):
+
+    def setUp(self):
+        self.results = tempfile.mkdtemp()
+        # One task split over two files (e.g. two rounds), and a second task.
+        self.write('W,S,M,P,1s.json', [(True, 1.0, 2), (False, None, 9)])
+        self.write('W,S,M,P,3s.json', [(True, 2.0, 4), (True, 6.0, 10)])
+        self.write('W,S,N,P.json', [(False, None, 5)])
+
+    def write(self, name: str, rows: list[tuple]):
+        records = [{
+            'workload': 'W',
+            'strategy': 'S',
+            'mutant': name.split(',')[2],
+            'property': 'P',
+            'foundbug': found,
+            'time': time,
+            'passed': passed,
+        } for found, time, passed in rows]
+        with open(os.path.join(self.results, name), 'w') as f:
+            json.dump(records, f)
+
+    def test_hand_computed(self):
+        summary = summarize_results(self.results, chunk_files=1).set_index('task')
+        row = summary.loc['W,M,P']
+        self.assertEqual((row['trials'], row['found']), (4, 3))
+        # Times 1, 2 and 6: mean 3, squared deviations 4 + 1 + 9.
+        self.assertEqual(row['time_n'], 3)
+        self.assertAlmostEqual(row['time_mean'], 3.0)
+        self.assertAlmostEqual(row['time_m2'], 14.0)
+        # The trial that did not find the bug counts as infinite.
+        self.assertEqual((row['time_solved_min'], row['time_solved_max']), (1.0, float('inf')))
+        # Inputs 3, 9, 5 and 11 (a trial that found the bug tried one more).
+        self.assertAlmostEqual(row['inputs_mean'], 7.0)
+        self.assertAlmostEqual(row['inputs_m2'], 40.0)
+
+        row = summary.loc['W,N,P']
+        self.assertEqual((row['trials'], row['found']), (1, 0))
+        self.assertEqual(row['time_solved_min'], float('inf'))
+
+    def test_streaming_matches_in_memory(self):
+        streamed = summarize_results(self.results, chunk_files=1).astype({'task': str}).set_index('task')
+        in_memory = summarize(parse_results(self.results)).astype({'task': str}).set_index('task')
+        for col in ['trials', 'found', 'time_n', 'time_mean', 'time_m2', 'inputs_mean', 'inputs_m2']:
+            # `W,N,P` has no times, so both have NaN for those.
+            pd.testing.assert_series_equal(streamed[col], in_memory[col], check_dtype=False)
+
+
+if __name__ == '__main__':
+    unittest.main()
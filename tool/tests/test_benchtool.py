@@ -0,0 +1,395 @@
+'''
+Runs `BenchTool` end to end on synthetic workloads (see `Synthetic`),
+which need neither Stack nor Coq.
+
+    python3 -m unittest discover tool/tests
+'''
+
+import json
+import os
+import subprocess
+import tempfile
+import threading
+import time
+import unittest
+from typing import Optional
+
+from benchtool import Corpus
+from benchtool.Scheduler import successive_halving
+from benchtool.Synthetic import Synthetic, make_workload
+from benchtool.Types import BuildStep, LogLevel, ReplaceLevel, TrialConfig, Watchdog
+from benchtool.Util import OutputScanner
+
+STRATEGIES = {
+    'Fast': (0.1, True),
+    'Slow': (5, True),
+    'Blind': (0.1, False),
+}
+
+# `same` changes nothing, and `second` sets the same bug as `first`.
+EQUIVALENT_IMPL = '''#!/bin/sh
+BUG=
+: '! '
+BUG=${BUG}
+: '!! same '
+: '!
+BUG=
+'
+: '!! first '
+: '!
+BUG=x
+'
+: '!! second '
+: '!
+BUG=x
+'
+'''
+
+
+class Exclusive(Synthetic):
+    ''' Runs `Slow` and `Blind` as exclusive, as `Coq` does for fuzzers. '''
+
+    def _exclusive(self, cfg: TrialConfig) -> bool:
+        return cfg.strategy != 'Fast'
+
+
+class Hashed(Synthetic):
+    ''' Hashes the bug set by the implementation, as if it were what gets built. '''
+
+    def _artifact_hash(self, workload_path: str) -> Optional[str]:
+        with self._change_dir(workload_path):
+            return subprocess.run(['sh', '-c', '. ./Impl.sh; echo "bug:$BUG"'],
+                                  capture_output=True,
+                                  text=True).stdout
+
+
+def alive(pid: int) -> bool:
+    # The killed process may stay a zombie until its new parent reaps it.
+    try:
+        with open(f'/proc/{pid}/stat') as f:
+            return f.read().rsplit(')', 1)[1].split()[0] != 'Z'
+    except FileNotFoundError:
+        return False
+
+
+class SyntheticTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.results = os.path.join(self.root, 'results')
+        self.workload = os.path.join(self.root, 'workloads', 'Synthetic', 'W')
+        make_workload(self.workload, mutants=2, strategies=STRATEGIES, properties=1)
+        # `Synthetic` finds its workloads relative to the working directory.
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(self.root)
+
+    def tool(self, cls=Synthetic, **kwargs) -> Synthetic:
+        return cls(self.results, log_level=LogLevel.ERROR, **kwargs)
+
+    def variant(self, tool: Synthetic, mutant: str):
+        workload = next(w for w in tool.all_workloads() if w.name == 'W')
+        return workload, next(v for v in tool.all_variants(workload) if v.name == mutant)
+
+    def apply(self, tool: Synthetic, mutant: str, **kwargs):
+        workload, variant = self.variant(tool, mutant)
+        return workload, tool.apply_variant(workload, variant, **kwargs)
+
+    def cfg(self, workload, strategy: str, **kwargs) -> TrialConfig:
+        return TrialConfig(workload=workload,
+                           strategy=strategy,
+                           property='prop_0',
+                           trials=kwargs.pop('trials', 1),
+                           timeout=kwargs.pop('timeout', 10),
+                           **kwargs)
+
+    def load(self, *path: str) -> list[dict]:
+        with open(os.path.join(self.results, *path)) as f:
+            return json.load(f)
+
+
+class TestWatchdog(SyntheticTestCase):
+
+    def test_timeout(self):
+        tool = self.tool()
+        process = tool._run_process(['sleep', '30'], 0.5)
+        self.assertTrue(process.timed_out)
+        self.assertFalse(process.cpu_limited)
+        self.assertLess(process.usage.walltime, 5)
+
+    def test_kills_the_process_group(self):
+        tool = self.tool()
+        process = tool._run_process(['sh', '-c', 'sleep 30 & echo $!; wait'], 0.5)
+        self.assertTrue(process.timed_out)
+        child = int(process.stdout)
+        deadline = time.monotonic() + 5
+        while alive(child) and time.monotonic() < deadline:
+            time.sleep(0.05)
+        self.assertFalse(alive(child))
+
+    def test_cpu_limit(self):
+        tool = self.tool(watchdog=Watchdog(cpu_factor=0.3))
+        process = tool._run_process(['sh', '-c', 'while :; do :; done'], 3)
+        self.assertTrue(process.cpu_limited)
+        self.assertFalse(process.timed_out)
+        self.assertLess(process.usage.walltime, 3)
+
+    def test_crash_is_neither(self):
+        tool = self.tool()
+        process = tool._run_process(['sh', '-c', 'exit 3'], 5)
+        self.assertEqual(process.returncode, 3)
+        self.assertFalse(process.timed_out)
+        self.assertFalse(process.cpu_limited)
+
+    def test_stops_once_the_result_is_in(self):
+        tool = self.tool()
+        scanner = OutputScanner([('[|', '|]')], until='|]')
+        process = tool._run_process(['sh', '-c', 'echo "[|done|]"; sleep 30'], 20, scanner=scanner)
+        self.assertTrue(process.stopped)
+        self.assertFalse(process.timed_out)
+        self.assertIn('[|done|]', process.stdout)
+        self.assertLess(process.usage.walltime, 10)
+
+    def test_timed_out_trial(self):
+        tool = self.tool()
+        workload, run_trial = self.apply(tool, 'mutant_0')
+        run_trial(self.cfg(workload, 'Slow', timeout=0.5))
+        [record] = self.load('W,Slow,mutant_0,prop_0.json')
+        self.assertFalse(record['foundbug'])
+        self.assertEqual(record['time'], 0.5)
+
+
+class TestOutputScanner(unittest.TestCase):
+
+    def test_regions_across_chunks(self):
+        scanner = OutputScanner([('[|', '|]')], until='|]')
+        for chunk in ['noise [', '|a', 'b|', '] more']:
+            scanner.feed(chunk)
+        self.assertTrue(scanner.done)
+        self.assertTrue(scanner.text().startswith('[|ab|]\n'))
+
+    def test_not_done_without_until(self):
+        scanner = OutputScanner([('<', '>'), ('[|', '|]')], until='|]')
+        scanner.feed('<gc> [|res')
+        self.assertFalse(scanner.done)
+        self.assertTrue(scanner.text().startswith('<gc>\n'))
+
+    def test_tail_is_bounded(self):
+        scanner = OutputScanner([], tail=10)
+        for _ in range(100):
+            scanner.feed('x' * 7)
+        self.assertEqual(scanner.text(), '\n' + 'x' * 10)
+
+
+class TestBuildGraph(SyntheticTestCase):
+
+    def test_dependencies_finish_first(self):
+        tool = self.tool(jobs=3)
+        order = []
+        lock = threading.Lock()
+
+        def step(name: str, seconds: float = 0.0):
+
+            def run():
+                time.sleep(seconds)
+                with lock:
+                    order.append(name)
+
+            return run
+
+        tool._run_build_graph([
+            BuildStep('link', step('link'), deps=['a', 'b']),
+            BuildStep('a', step('a', 0.2)),
+            BuildStep('b', step('b')),
+            BuildStep('shell', ['touch', 'built']),
+        ])
+        self.assertEqual(order, ['b', 'a', 'link'])
+        self.assertTrue(os.path.isfile('built'))
+
+    def test_unknown_dependency(self):
+        with self.assertRaises(Exception):
+            self.tool()._run_build_graph([BuildStep('a', lambda: None, deps=['missing'])])
+
+    def test_cycle(self):
+        with self.assertRaises(Exception):
+            self.tool()._run_build_graph([
+                BuildStep('a', lambda: None, deps=['b']),
+                BuildStep('b', lambda: None, deps=['a']),
+            ])
+
+
+class TestEquivalentMutants(SyntheticTestCase):
+
+    def test_skip_and_reuse(self):
+        with open(os.path.join(self.workload, 'Impl.sh'), 'w') as f:
+            f.write(EQUIVALENT_IMPL)
+        tool = self.tool(Hashed)
+        for mutant in ['same', 'first', 'second']:
+            workload, run_trial = self.apply(tool, mutant, detect_equivalent=True)
+            run_trial(self.cfg(workload, 'Fast'))
+
+        # Equivalent to base: no trials.
+        self.assertFalse(os.path.exists(os.path.join(self.results, 'W,Fast,same,prop_0.json')))
+        [first] = self.load('W,Fast,first,prop_0.json')
+        self.assertTrue(first['foundbug'])
+        self.assertNotIn('equivalent', first)
+        # Equivalent to `first`: its results, under the name of `second`.
+        [second] = self.load('W,Fast,second,prop_0.json')
+        self.assertEqual(second['mutant'], 'second')
+        self.assertEqual(second['equivalent'], 'first')
+        self.assertEqual(second['time'], first['time'])
+
+        flags = sorted(os.listdir(os.path.join(self.results, 'equivalent')))
+        self.assertEqual(flags, ['W,same.json', 'W,second.json'])
+        self.assertEqual(self.load('equivalent', 'W,same.json')['equivalent'], 'base')
+
+
+class TestRunAll(SyntheticTestCase):
+
+    def test_builds_each_variant_once(self):
+        tool = self.tool(replace_level=ReplaceLevel.SKIP)
+        todo = []
+        for mutant in ['mutant_0', 'mutant_1']:
+            workload, variant = self.variant(tool, mutant)
+            todo += [(workload, variant, self.cfg(workload, s)) for s in ['Fast', 'Blind']]
+        # Already done, so skipped.
+        os.makedirs(self.results, exist_ok=True)
+        with open(os.path.join(self.results, 'W,Blind,mutant_1,prop_0.json'), 'w') as f:
+            json.dump([], f)
+
+        tool.run_all(todo)
+        tool.telemetry.close()
+
+        status = tool.telemetry.snapshot()
+        self.assertEqual(status['builds']['count'], 2)
+        self.assertEqual(status['jobs']['planned'], 4)
+        self.assertEqual(status['jobs']['completed'], 3)
+        self.assertEqual(status['jobs']['skipped'], 1)
+        self.assertEqual(status['jobs']['remaining'], 0)
+        self.assertTrue(os.path.isfile(os.path.join(self.results, 'telemetry', 'status.json')))
+        [record] = self.load('W,Fast,mutant_1,prop_0.json')
+        self.assertTrue(record['foundbug'])
+
+
+class TestRace(SyntheticTestCase):
+
+    def test_first_to_fail_cancels_the_others(self):
+        tool = self.tool()
+        workload, _ = self.apply(tool, 'mutant_0')
+        times = tool.race([self.cfg(workload, 'Fast'), self.cfg(workload, 'Slow')])
+
+        self.assertEqual(times['Fast'], 0.1)
+        self.assertIsNone(times['Slow'])
+        [record] = self.load('race', 'W,Slow,mutant_0,prop_0.json')
+        self.assertTrue(record['cancelled'])
+        self.assertLess(record['time'], 5)
+
+    def test_rejects_exclusive_entrants(self):
+        tool = self.tool(Exclusive)
+        workload, _ = self.apply(tool, 'mutant_0')
+        with self.assertRaises(Exception):
+            tool.race([self.cfg(workload, 'Slow'), self.cfg(workload, 'Blind')])
+        # A single exclusive entrant can race the others.
+        times = tool.race([self.cfg(workload, 'Fast'), self.cfg(workload, 'Blind')])
+        self.assertEqual(times['Fast'], 0.1)
+
+
+class TestRunParallel(SyntheticTestCase):
+
+    def test_runs_every_trial(self):
+        tool = self.tool(jobs=3)
+        workload, _ = self.apply(tool, 'mutant_0')
+        codes = tool.run_parallel([self.cfg(workload, s) for s in ['Fast', 'Blind']])
+
+        self.assertEqual(codes, {'W,Fast,mutant_0,prop_0': 0, 'W,Blind,mutant_0,prop_0': 0})
+        [record] = self.load('W,Fast,mutant_0,prop_0.json')
+        self.assertTrue(record['foundbug'])
+        [record] = self.load('W,Blind,mutant_0,prop_0.json')
+        self.assertFalse(record['foundbug'])
+
+    def test_exclusive_trials_run_one_at_a_time(self):
+        tool = self.tool(Exclusive, jobs=3)
+        workload, _ = self.apply(tool, 'mutant_0')
+        cfgs = [self.cfg(workload, 'Blind', trials=3, label=f'Blind{i}') for i in range(2)]
+        start = time.monotonic()
+        tool.run_parallel(cfgs)
+        # Two runs of three 0.1s trials, one after the other.
+        self.assertGreaterEqual(time.monotonic() - start, 0.6)
+
+
+class TestSuccessiveHalving(SyntheticTestCase):
+
+    def test_promotion(self):
+        tool = self.tool()
+        workload, mutant = self.variant(tool, 'mutant_0')
+        cfgs = [self.cfg(workload, s, trials=2) for s in ['Fast', 'Blind']]
+        reached = successive_halving(tool, workload, [mutant], cfgs, min_timeout=1, max_timeout=9)
+
+        # `Fast` solved the task in every trial, so `Blind` is clearly behind.
+        self.assertEqual(reached, {('mutant_0', 'Fast', 'prop_0'): 1, ('mutant_0', 'Blind', 'prop_0'): 1})
+        self.assertEqual(self.load('W,Blind,mutant_0,prop_0,1s.json')[0]['timeout'], 1)
+
+    def test_unsolved_tasks_reach_the_ceiling(self):
+        tool = self.tool()
+        workload, mutant = self.variant(tool, 'mutant_0')
+        reached = successive_halving(tool, workload, [mutant], [self.cfg(workload, 'Blind')],
+                                     min_timeout=1,
+                                     max_timeout=9)
+
+        self.assertEqual(reached, {('mutant_0', 'Blind', 'prop_0'): 9})
+        for timeout in ['1s', '3s', '9s']:
+            self.assertTrue(os.path.isfile(os.path.join(self.results, f'W,Blind,mutant_0,prop_0,{timeout}.json')))
+
+
+class TestCorpus(SyntheticTestCase):
+
+    def record(self, strategy: str, output: str, key: Optional[str], found: bool = True) -> dict:
+        return {
+            'workload': 'W',
+            'mutant': 'mutant_0',
+            'property': 'prop_0',
+            'strategy': strategy,
+            'foundbug': found,
+            'output': output,
+            'replaykey': key,
+        }
+
+    def test_round_trip(self):
+        corpus = os.path.join(self.root, 'corpus')
+        records = [
+            self.record('Quick', '(1, 2)', '(7, 3)'),
+            self.record('Quick', '(2, 1)', '(8, 5)'),
+            self.record('Lean', '(1, 2)', '41'),
+            self.record('Quick', '', None),
+            self.record('Quick', '(3, 3)', '(9, 9)', found=False),
+        ]
+        self.assertEqual(Corpus.add(corpus, records), 3)
+        # Already stored.
+        self.assertEqual(Corpus.add(corpus, records), 0)
+
+        self.assertEqual(Corpus.lookup(corpus, 'W', 'mutant_0', 'prop_0', 'Quick'), ['(7, 3)', '(8, 5)'])
+        self.assertEqual(Corpus.lookup(corpus, 'W', 'mutant_0', 'prop_0', 'Lean'), ['41'])
+        self.assertEqual(Corpus.lookup(corpus, 'W', 'mutant_0', 'prop_0', 'Small'), [])
+        self.assertEqual(Corpus.lookup(corpus, 'W', 'mutant_1', 'prop_0', 'Quick'), [])
+
+    def test_collect(self):
+        os.makedirs(self.results)
+        with open(os.path.join(self.results, 'W,Quick,mutant_0,prop_0.json'), 'w') as f:
+            json.dump([self.record('Quick', '(1, 2)', '(7, 3)')], f)
+        with open(os.path.join(self.results, 'broken.json'), 'w') as f:
+            f.write('[')
+
+        corpus = os.path.join(self.root, 'corpus')
+        self.assertEqual(Corpus.collect(self.results, corpus), 1)
+        self.assertEqual(Corpus.lookup(corpus, 'W', 'mutant_0', 'prop_0', 'Quick'), ['(7, 3)'])
+
+    def test_trials_are_marked(self):
+        corpus = os.path.join(self.root, 'corpus')
+        tool = self.tool()
+        workload, run_trial = self.apply(tool, 'mutant_0')
+        run_trial(self.cfg(workload, 'Fast', corpus=corpus))
+        [record] = self.load('W,Fast,mutant_0,prop_0.json')
+        self.assertFalse(record['replayed'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+'''
+Builds a Coq workload and runs one of its runners; skipped without Coq and QuickChick.
+
+    python3 -m unittest discover tool/tests
+'''
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from benchtool.Coq import Coq
+from benchtool.Types import LogLevel, TrialConfig
+from benchtool.Util import ChangeDir
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+
+@unittest.skipUnless(shutil.which('coq_makefile') and 'OPAM_SWITCH_PREFIX' in os.environ,
+                     'needs Coq and QuickChick')
+class TestCoqRunner(unittest.TestCase):
+
+    def test_gc_stats(self):
+        results = tempfile.mkdtemp()
+        with ChangeDir(ROOT):
+            tool = Coq(results, log_level=LogLevel.WARNING)
+            workload = next(w for w in tool.all_workloads() if w.name == 'BST')
+            base = next(v for v in tool.all_variants(workload) if v.name == 'base')
+            run_trial = tool.apply_variant(workload, base)
+            run_trial(
+                TrialConfig(workload=workload,
+                            strategy='BespokeGenerator',
+                            property='test_prop_InsertValid',
+                            trials=1,
+                            timeout=30,
+                            gc_stats=True,
+                            max_success=100,
+                            file='gc'))
+
+        with open(os.path.join(results, 'gc.json')) as f:
+            [record] = json.load(f)
+        # Passing 100 tests on base means that the runner read `ETNA_MAX_SUCCESS`.
+        self.assertEqual(record['passed'], 100)
+        self.assertFalse(record['foundbug'])
+        for field in ['bytes_allocated', 'max_live_bytes', 'gc_count']:
+            self.assertIn(field, record)
+            self.assertGreater(record[field], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+'''
+Checks the progress reported by the telemetry of a campaign.
+
+    python3 -m unittest discover tool/tests
+'''
+
+import json
+import os
+import tempfile
+import unittest
+
+from benchtool.Telemetry import Telemetry, describe
+
+
+class TestTelemetry(unittest.TestCase):
+
+    def test_eta(self):
+        status = os.path.join(tempfile.mkdtemp(), 'telemetry', 'status.json')
+        telemetry = Telemetry(status=status, interval=60)
+        telemetry.plan(10)
+        for i in range(3):
+            telemetry.trial_started(f'job{i}')
+            telemetry.trial_finished(f'job{i}')
+        telemetry.trial_finished('job3', skipped=True)
+        # Counts the events sent so far, and writes the status file.
+        telemetry.close()
+
+        with open(status) as f:
+            snapshot = json.load(f)
+        self.assertEqual(snapshot['jobs']['planned'], 10)
+        self.assertEqual(snapshot['jobs']['completed'], 3)
+        self.assertEqual(snapshot['jobs']['skipped'], 1)
+        self.assertEqual(snapshot['jobs']['remaining'], 6)
+        self.assertIsNotNone(snapshot['eta'])
+        self.assertGreater(snapshot['eta'], 0)
+        self.assertIn('ETA', describe(snapshot))
+
+    def test_no_eta_without_plan(self):
+        telemetry = Telemetry()
+        telemetry.trial_started('job')
+        telemetry.trial_finished('job')
+        telemetry.close()
+
+        snapshot = telemetry.snapshot()
+        self.assertEqual(snapshot['jobs']['completed'], 1)
+        self.assertIsNone(snapshot['jobs']['remaining'])
+        self.assertIsNone(snapshot['eta'])
+        self.assertNotIn('ETA', describe(snapshot))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -24,14 +24,15 @@ Derive (Arbitrary, Show, Sized, Fuzzy) for Tree.
 (* ManualExtract Tree. *)
 
 (* QuickChickDebug Debug On. *)
-(*|toggle|*)Axiom num_tests : nat. Extract Constant num_tests => "max_int".
+Axiom num_tests : nat. Extract Constant num_tests => "(match Sys.getenv_opt ""ETNA_MAX_SUCCESS"" with Some n -> int_of_string n | None -> max_int)".
+Axiom num_discards : nat. Extract Constant num_discards => "(match Sys.getenv_opt ""ETNA_MAX_DISCARD"" with Some n -> int_of_string n | None -> max_int)".
 
 Definition test_prop_InsertValid (tkv: (Tree * nat * nat)) :=
   let '(t, k, v) := tkv in
   prop_InsertValid t k v.
 
 Definition test_prop_InsertValid_fuzzer :=
-  fun (u : unit) => fuzzLoopWith (updMaxDiscard (updMaxSuccess (updAnalysis stdArgs true) num_tests) num_tests) arbitrary fuzz show test_prop_InsertValid.
+  fun (u : unit) => fuzzLoopWith (updMaxDiscard (updMaxSuccess (updAnalysis stdArgs true) num_tests) num_discards) arbitrary fuzz show test_prop_InsertValid.
 
 (*! FuzzChick test_prop_InsertValid (test_prop_InsertValid_fuzzer tt). *)
 
@@ -41,7 +42,7 @@ Definition test_prop_DeleteValid (tk: Tree * nat)  :=
   prop_DeleteValid t k.
 
 Definition test_prop_DeleteValid_fuzzer :=
-  fun (u : unit) => fuzzLoopWith (updMaxDiscard (updMaxSuccess (updAnalysis stdArgs true) num_tests) num_tests) arbitrary fuzz show test_prop_DeleteValid.
+  fun (u : unit) => fuzzLoopWith (updMaxDiscard (updMaxSuccess (updAnalysis stdArgs true) num_tests) num_discards) arbitrary fuzz show test_prop_DeleteValid.
 
 (*! FuzzChick test_prop_DeleteValid (test_prop_DeleteValid_fuzzer tt). *)
 
@@ -51,7 +52,7 @@ Definition test_prop_UnionValid (t1t2: Tree * Tree)  :=
   prop_UnionValid t1 t2.
 
 Definition test_prop_UnionValid_fuzzer :=
-  fun (u : unit) => fuzzLoopWith (updMaxDiscard (updMaxSuccess (updAnalysis stdArgs true) num_tests) num_tests) arbitrary fuzz show test_prop_UnionValid.
+  fun (u : unit) => fuzzLoopWith (updMaxDiscard (updMaxSuccess (updAnalysis stdArgs true) num_tests) num_discards) arbitrary fuzz show test_prop_UnionValid.
 
 (*! FuzzChick test_prop_UnionValid (test_prop_UnionValid_fuzzer tt). *)
 
@@ -60,7 +61,7 @@ Definition test_prop_InsertPost (tkkpv: Tree * nat * nat * nat) :=
   prop_InsertPost t k k' v.
 
 Definition test_prop_InsertPost_fuzzer :=
-  fun (u : unit) => fuzzLoopWith (updMaxDiscard (updMaxSuccess (updAnalysis stdArgs true) num_tests) num_tests) arbitrary fuzz show test_prop_InsertPost.
+  fun (u : unit) => fuzzLoopWith (updMaxDiscard (updMaxSuccess (updAnalysis stdArgs true) num_tests) num_discards) arbitrary fuzz show test_prop_InsertPost.
 
 (*! FuzzChick test_prop_InsertPost (test_prop_InsertPost_fuzzer tt). *)
 
@@ -69,7 +70,7 @@ Definition test_prop_DeletePost (tkkp: Tree * nat * nat) :=
   prop_DeletePost t k k.
 
 Definition test_prop_DeletePost_fuzzer :=
-  fun (u : unit) => fuzzLoopWith (updMaxDiscard (updMaxSuccess (updAnalysis stdArgs true) num_tests) num_tests) arbitrary fuzz show test_prop_DeletePost.
+  fun (u : unit) => fuzzLoopWith (updMaxDiscard (updMaxSuccess (updAnalysis stdArgs true) num_tests) num_discards) arbitrary fuzz show test_prop_DeletePost.
 
 (*! FuzzChick test_prop_DeletePost (test_prop_DeletePost_fuzzer tt). *)
 
@@ -78,7 +79,7 @@ Definition test_prop_UnionPost (ttpk: Tree * Tree * nat)  :=
   prop_UnionPost t t' k.
 
 Definition test_prop_UnionPost_fuzzer :=
-  fun (u : unit) => fuzzLoopWith (updMaxDiscard (updMaxSuccess (updAnalysis stdArgs true) num_tests) num_tests) arbitrary fuzz show test_prop_UnionPost.
+  fun (u : unit) => fuzzLoopWith (updMaxDiscard (updMaxSuccess (updAnalysis stdArgs true) num_tests) num_discards) arbitrary fuzz show test_prop_UnionPost.
 
 (*! FuzzChick test_prop_UnionPost (test_prop_UnionPost_fuzzer tt). *)
 
@@ -87,7 +88,7 @@ Definition test_prop_InsertModel (tkv: Tree * nat * nat)  :=
   prop_InsertModel t k v.
 
 Definition test_prop_InsertModel_fuzzer :=
-  fun (u : unit) => fuzzLoopWith (updMaxDiscard (updMaxSuccess (updAnalysis stdArgs true) num_tests) num_tests) arbitrary fuzz show test_prop_InsertModel.
+  fun (u : unit) => fuzzLoopWith (updMaxDiscard (updMaxSuccess (updAnalysis stdArgs true) num_tests) num_discards) arbitrary fuzz show test_prop_InsertModel.
 
 (*! FuzzChick test_prop_InsertModel (test_prop_InsertModel_fuzzer tt). *)
 
@@ -96,7 +97,7 @@ Definition test_prop_DeleteModel (tk: Tree * nat)  :=
   prop_DeleteModel t k.
 
 Definition test_prop_DeleteModel_fuzzer :=
-  fun (u : unit) => fuzzLoopWith (updMaxDiscard (updMaxSuccess (updAnalysis stdArgs true) num_tests) num_tests) arbitrary fuzz show test_prop_DeleteModel.
+  fun (u : unit) => fuzzLoopWith (updMaxDiscard (updMaxSuccess (updAnalysis stdArgs true) num_tests) num_discards) arbitrary fuzz show test_prop_DeleteModel.
 
 (*! FuzzChick test_prop_DeleteModel (test_prop_DeleteModel_fuzzer tt). *)
 
@@ -105,7 +106,7 @@ Definition test_prop_UnionModel (ttp: Tree * Tree) :=
   prop_UnionModel t t'.
 
 Definition test_prop_UnionModel_fuzzer :=
-  fun (u : unit) => fuzzLoopWith (updMaxDiscard (updMaxSuccess (updAnalysis stdArgs true) num_tests) num_tests) arbitrary fuzz show test_prop_UnionModel.
+  fun (u : unit) => fuzzLoopWith (updMaxDiscard (updMaxSuccess (updAnalysis stdArgs true) num_tests) num_discards) arbitrary fuzz show test_prop_UnionModel.
 
 (*! FuzzChick test_prop_UnionModel (test_prop_UnionModel_fuzzer tt). *)
 
@@ -114,7 +115,7 @@ Definition test_prop_InsertInsert (tkkpvvp: Tree * nat * nat * nat * nat)   :=
   prop_InsertInsert t k k' v v.
 
 Definition test_prop_InsertInsert_fuzzer :=
-  fun (u : unit) => fuzzLoopWith (updMaxDiscard (updMaxSuccess (updAnalysis stdArgs true) num_tests) num_tests) arbitrary fuzz show test_prop_InsertInsert.
+  fun (u : unit) => fuzzLoopWith (updMaxDiscard (updMaxSuccess (updAnalysis stdArgs true) num_tests) num_discards) arbitrary fuzz show test_prop_InsertInsert.
 
 (*! FuzzChick test_prop_InsertInsert (test_prop_InsertInsert_fuzzer tt). *)
 
@@ -123,7 +124,7 @@ Definition test_prop_InsertDelete (tkkpv: Tree * nat * nat * nat)  :=
   prop_InsertDelete t k k' v.
 
 Definition test_prop_InsertDelete_fuzzer :=
-  fun (u : unit) => fuzzLoopWith (updMaxDiscard (updMaxSuccess (updAnalysis stdArgs true) num_tests) num_tests) arbitrary fuzz show test_prop_InsertDelete.
+  fun (u : unit) => fuzzLoopWith (updMaxDiscard (updMaxSuccess (updAnalysis stdArgs true) num_tests) num_discards) arbitrary fuzz show test_prop_InsertDelete.
 
 (*! FuzzChick test_prop_InsertDelete (test_prop_InsertDelete_fuzzer tt). *)
 
@@ -132,7 +133,7 @@ Definition test_prop_InsertUnion (ttpkv: Tree * Tree * nat * nat) :=
   prop_InsertUnion t t' k v.
 
 Definition test_prop_InsertUnion_fuzzer :=
-  fun (u : unit) => fuzzLoopWith (updMaxDiscard (updMaxSuccess (updAnalysis stdArgs true) num_tests) num_tests) arbitrary fuzz show test_prop_InsertUnion.
+  fun (u : unit) => fuzzLoopWith (updMaxDiscard (updMaxSuccess (updAnalysis stdArgs true) num_tests) num_discards) arbitrary fuzz show test_prop_InsertUnion.
 
 (*! FuzzChick test_prop_InsertUnion (test_prop_InsertUnion_fuzzer tt). *)
 
@@ -141,7 +142,7 @@ Definition test_prop_DeleteInsert (tkkpvp: Tree * nat * nat * nat) :=
   prop_DeleteInsert t k k' v'.
 
 Definition test_prop_DeleteInsert_fuzzer :=
-  fun (u : unit) => fuzzLoopWith (updMaxDiscard (updMaxSuccess (updAnalysis stdArgs true) num_tests) num_tests) arbitrary fuzz show test_prop_DeleteInsert.
+  fun (u : unit) => fuzzLoopWith (updMaxDiscard (updMaxSuccess (updAnalysis stdArgs true) num_tests) num_discards) arbitrary fuzz show test_prop_DeleteInsert.
 
 (*! FuzzChick test_prop_DeleteInsert (test_prop_DeleteInsert_fuzzer tt). *)
 
@@ -150,7 +151,7 @@ Definition test_prop_DeleteDelete (tkkp: Tree * nat * nat) :=
   prop_DeleteDelete t k k'.
 
 Definition test_prop_DeleteDelete_fuzzer :=
-  fun (u : unit) => fuzzLoopWith (updMaxDiscard (updMaxSuccess (updAnalysis stdArgs true) num_tests) num_tests) arbitrary fuzz show test_prop_DeleteDelete.
+  fun (u : unit) => fuzzLoopWith (updMaxDiscard (updMaxSuccess (updAnalysis stdArgs true) num_tests) num_discards) arbitrary fuzz show test_prop_DeleteDelete.
 
 (*! FuzzChick test_prop_DeleteDelete (test_prop_DeleteDelete_fuzzer tt). *)
 
@@ -159,7 +160,7 @@ Definition test_prop_DeleteUnion (ttpk: Tree * Tree * nat) :=
   prop_DeleteUnion t t' k.
 
 Definition test_prop_DeleteUnion_fuzzer :=
-  fun (u : unit) => fuzzLoopWith (updMaxDiscard (updMaxSuccess (updAnalysis stdArgs true) num_tests) num_tests) arbitrary fuzz show test_prop_DeleteUnion.
+  fun (u : unit) => fuzzLoopWith (updMaxDiscard (updMaxSuccess (updAnalysis stdArgs true) num_tests) num_discards) arbitrary fuzz show test_prop_DeleteUnion.
 
 (*! FuzzChick test_prop_DeleteUnion (test_prop_DeleteUnion_fuzzer tt). *)
 
@@ -168,7 +169,7 @@ Definition test_prop_UnionDeleteInsert (ttpkv: Tree * Tree * nat * nat) :=
   prop_UnionDeleteInsert t t' k v.
 
 Definition test_prop_UnionDeleteInsert_fuzzer :=
-  fun (u : unit) => fuzzLoopWith (updMaxDiscard (updMaxSuccess (updAnalysis stdArgs true) num_tests) num_tests) arbitrary fuzz show test_prop_UnionDeleteInsert.
+  fun (u : unit) => fuzzLoopWith (updMaxDiscard (updMaxSuccess (updAnalysis stdArgs true) num_tests) num_discards) arbitrary fuzz show test_prop_UnionDeleteInsert.
 
 (*! FuzzChick test_prop_UnionDeleteInsert (test_prop_UnionDeleteInsert_fuzzer tt). *)
 
@@ -176,7 +177,7 @@ Definition test_prop_UnionUnionIdem (t: Tree) :=
   prop_UnionUnionIdem t.
 
 Definition test_prop_UnionUnionIdem_fuzzer :=
-  fun (u : unit) => fuzzLoopWith (updMaxDiscard (updMaxSuccess (updAnalysis stdArgs true) num_tests) num_tests) arbitrary fuzz show test_prop_UnionUnionIdem.
+  fun (u : unit) => fuzzLoopWith (updMaxDiscard (updMaxSuccess (updAnalysis stdArgs true) num_tests) num_discards) arbitrary fuzz show test_prop_UnionUnionIdem.
 
 (*! FuzzChick test_prop_UnionUnionIdem (test_prop_UnionUnionIdem_fuzzer tt). *)
 
@@ -185,6 +186,6 @@ Definition test_prop_UnionUnionAssoc (t1t2t3 : Tree * Tree * Tree) :=
   prop_UnionUnionAssoc t1 t2 t3.
 
 Definition test_prop_UnionUnionAssoc_fuzzer :=
-  fun (u : unit) => fuzzLoopWith (updMaxDiscard (updMaxSuccess (updAnalysis stdArgs true) num_tests) num_tests) arbitrary fuzz show test_prop_UnionUnionAssoc.
+  fun (u : unit) => fuzzLoopWith (updMaxDiscard (updMaxSuccess (updAnalysis stdArgs true) num_tests) num_discards) arbitrary fuzz show test_prop_UnionUnionAssoc.
 
 (*! FuzzChick test_prop_UnionUnionAssoc (test_prop_UnionUnionAssoc_fuzzer tt). *)
@@ -1,8 +1,9 @@
 From IFC Require Import TypeBasedGenerator.
 From QuickChick Require Import QuickChick.
 Set Warnings "-extraction-opaque-accessed,-extraction".
-Axiom num_tests : nat. Extract Constant num_tests => "max_int".
-Definition qctest_test_propSSNI_smart := (fun _ : unit => print_extracted_coq_string ("[|{" ++ show (withTime(fun tt => (quickCheckWith (updMaxDiscard (updMaxSuccess (updAnalysis stdArgs true) num_tests) num_tests) test_propSSNI_smart))) ++ "}|]")).
+Axiom num_tests : nat. Extract Constant num_tests => "(match Sys.getenv_opt ""ETNA_MAX_SUCCESS"" with Some n -> int_of_string n | None -> max_int)".
+Axiom num_discards : nat. Extract Constant num_discards => "(match Sys.getenv_opt ""ETNA_MAX_DISCARD"" with Some n -> int_of_string n | None -> max_int)".
+Definition qctest_test_propSSNI_smart := (fun _ : unit => print_extracted_coq_string ("[|{" ++ show (withTime(fun tt => (quickCheckWith (updMaxDiscard (updMaxSuccess (updAnalysis stdArgs true) num_tests) num_discards) test_propSSNI_smart))) ++ "}|]")).
 
 
 Parameter OCamlString : Type.
@@ -18,7 +19,13 @@ fun test_name ->
 
 
 let () =
-  Sys.argv.(1) |> qctest_map
+  Sys.argv.(1) |> qctest_map;
+  if Sys.getenv_opt ""ETNA_GC_STATS"" <> None then begin
+    let s = Gc.quick_stat () in
+    Printf.printf ""[?{\""word_size\"": %d, \""minor_words\"": %.0f, \""promoted_words\"": %.0f, \""major_words\"": %.0f, \""minor_collections\"": %d, \""major_collections\"": %d, \""top_heap_words\"": %d}?]\n""
+      Sys.word_size s.Gc.minor_words s.Gc.promoted_words s.Gc.major_words
+      s.Gc.minor_collections s.Gc.major_collections s.Gc.top_heap_words
+  end
 ".
 
 Extraction "TypeBasedGenerator_test_runner.ml" qctest_test_propSSNI_smart qctest_map.
@@ -39,10 +39,11 @@ ManualExtract Variation. *)
 Definition test_propSSNI_smart (v: @Variation SState) :=
     propSSNI_smart default_table v.
 
-Axiom num_tests : nat. Extract Constant num_tests => "max_int".
+Axiom num_tests : nat. Extract Constant num_tests => "(match Sys.getenv_opt ""ETNA_MAX_SUCCESS"" with Some n -> int_of_string n | None -> max_int)".
+Axiom num_discards : nat. Extract Constant num_discards => "(match Sys.getenv_opt ""ETNA_MAX_DISCARD"" with Some n -> int_of_string n | None -> max_int)".
 
 Definition test_propSSNI_smart_fuzzer :=
-  fun (u : unit) => fuzzLoopWith (updMaxDiscard (updMaxSuccess (updAnalysis stdArgs true) num_tests) num_tests) arbitrary fuzz show test_propSSNI_smart.
+  fun (u : unit) => fuzzLoopWith (updMaxDiscard (updMaxSuccess (updAnalysis stdArgs true) num_tests) num_discards) arbitrary fuzz show test_propSSNI_smart.
 
 (*! FuzzChick test_propSSNI_smart (test_propSSNI_smart_fuzzer tt). *)
 
@@ -39,7 +39,8 @@ ManualExtract Variation. *)
 Definition test_propSSNI_smart (v: @Variation SState) :=
     propSSNI_smart default_table v.
 
-Axiom num_tests : nat. Extract Constant num_tests => "max_int".
+Axiom num_tests : nat. Extract Constant num_tests => "(match Sys.getenv_opt ""ETNA_MAX_SUCCESS"" with Some n -> int_of_string n | None -> max_int)".
+Axiom num_discards : nat. Extract Constant num_discards => "(match Sys.getenv_opt ""ETNA_MAX_DISCARD"" with Some n -> int_of_string n | None -> max_int)".
 
 Definition gen_variation_copy : G (@Variation SState) :=
   bindGen arbitrary (fun l  =>
@@ -48,7 +49,7 @@ Definition gen_variation_copy : G (@Variation SState) :=
 
   
 Definition test_propSSNI_smart_fuzzer :=
-  fun (u : unit) => fuzzLoopWith (updMaxDiscard (updMaxSuccess (updAnalysis stdArgs true) num_tests) num_tests) gen_variation_copy fuzz show test_propSSNI_smart.
+  fun (u : unit) => fuzzLoopWith (updMaxDiscard (updMaxSuccess (updAnalysis stdArgs true) num_tests) num_discards) gen_variation_copy fuzz show test_propSSNI_smart.
 
 (*! FuzzChick test_propSSNI_smart (test_propSSNI_smart_fuzzer tt). *)
 
@@ -42,7 +42,8 @@ Derive (Arbitrary, Show, Sized, Fuzzy) for Tree.
     ret (ma,mb))
 |}.
 
-(*|toggle|*)Axiom num_tests : nat. Extract Constant num_tests => "max_int".
+Axiom num_tests : nat. Extract Constant num_tests => "(match Sys.getenv_opt ""ETNA_MAX_SUCCESS"" with Some n -> int_of_string n | None -> max_int)".
+Axiom num_discards : nat. Extract Constant num_discards => "(match Sys.getenv_opt ""ETNA_MAX_DISCARD"" with Some n -> int_of_string n | None -> max_int)".
 
 (* --------------------- Tests --------------------- *)
 
@@ -51,7 +52,7 @@ Definition test_prop_InsertValid (tkv: (Tree * Z * Z)) :=
   prop_InsertValid t k v.
 
 Definition test_prop_InsertValid_fuzzer :=
-  fun (u : unit) => fuzzLoopWith (updMaxDiscard (updMaxSuccess (updAnalysis stdArgs true) num_tests) num_tests) arbitrary fuzz show test_prop_InsertValid.
+  fun (u : unit) => fuzzLoopWith (updMaxDiscard (updMaxSuccess (updAnalysis stdArgs true) num_tests) num_discards) arbitrary fuzz show test_prop_InsertValid.
 
 (*! FuzzChick test_prop_InsertValid (test_prop_InsertValid_fuzzer tt). *)
 
@@ -61,7 +62,7 @@ Definition test_prop_DeleteValid (tk: Tree * Z)  :=
   prop_DeleteValid t k.
 
 Definition test_prop_DeleteValid_fuzzer :=
-  fun (u : unit) => fuzzLoopWith (updMaxDiscard (updMaxSuccess (updAnalysis stdArgs true) num_tests) num_tests) arbitrary fuzz show test_prop_DeleteValid.
+  fun (u : unit) => fuzzLoopWith (updMaxDiscard (updMaxSuccess (updAnalysis stdArgs true) num_tests) num_discards) arbitrary fuzz show test_prop_DeleteValid.
 
 (*! FuzzChick test_prop_DeleteValid (test_prop_DeleteValid_fuzzer tt). *)
 
@@ -71,7 +72,7 @@ Definition test_prop_InsertPost (tkkpv: Tree * Z * Z * Z) :=
   prop_InsertPost t k k' v.
 
 Definition test_prop_InsertPost_fuzzer :=
-  fun (u : unit) => fuzzLoopWith (updMaxDiscard (updMaxSuccess (updAnalysis stdArgs true) num_tests) num_tests) arbitrary fuzz show test_prop_InsertPost.
+  fun (u : unit) => fuzzLoopWith (updMaxDiscard (updMaxSuccess (updAnalysis stdArgs true) num_tests) num_discards) arbitrary fuzz show test_prop_InsertPost.
 
 (*! FuzzChick test_prop_InsertPost (test_prop_InsertPost_fuzzer tt). *)
 
@@ -81,7 +82,7 @@ Definition test_prop_DeletePost (tkkp: Tree * Z * Z) :=
   prop_DeletePost t k k.
 
 Definition test_prop_DeletePost_fuzzer :=
-  fun (u : unit) => fuzzLoopWith (updMaxDiscard (updMaxSuccess (updAnalysis stdArgs true) num_tests) num_tests) arbitrary fuzz show test_prop_DeletePost.
+  fun (u : unit) => fuzzLoopWith (updMaxDiscard (updMaxSuccess (updAnalysis stdArgs true) num_tests) num_discards) arbitrary fuzz show test_prop_DeletePost.
 
 (*! FuzzChick test_prop_DeletePost (test_prop_DeletePost_fuzzer tt). *)
     
@@ -91,7 +92,7 @@ Definition test_prop_InsertModel (tkv: Tree * Z * Z)  :=
   prop_InsertModel t k v.
 
 Definition test_prop_InsertModel_fuzzer :=
-  fun (u : unit) => fuzzLoopWith (updMaxDiscard (updMaxSuccess (updAnalysis stdArgs true) num_tests) num_tests) arbitrary fuzz show test_prop_InsertModel.
+  fun (u : unit) => fuzzLoopWith (updMaxDiscard (updMaxSuccess (updAnalysis stdArgs true) num_tests) num_discards) arbitrary fuzz show test_prop_InsertModel.
 
 (*! FuzzChick test_prop_InsertModel (test_prop_InsertModel_fuzzer tt). *)
     
@@ -100,7 +101,7 @@ Definition test_prop_DeleteModel (tk: Tree * Z)  :=
   prop_DeleteModel t k.
 
 Definition test_prop_DeleteModel_fuzzer :=
-  fun (u : unit) => fuzzLoopWith (updMaxDiscard (updMaxSuccess (updAnalysis stdArgs true) num_tests) num_tests) arbitrary fuzz show test_prop_DeleteModel.
+  fun (u : unit) => fuzzLoopWith (updMaxDiscard (updMaxSuccess (updAnalysis stdArgs true) num_tests) num_discards) arbitrary fuzz show test_prop_DeleteModel.
 
 (*! FuzzChick test_prop_DeleteModel (test_prop_DeleteModel_fuzzer tt). *)
 
@@ -109,7 +110,7 @@ Definition test_prop_InsertInsert (tkkpvvp: Tree * Z * Z * Z * Z)   :=
   prop_InsertInsert t k k' v v.
 
 Definition test_prop_InsertInsert_fuzzer :=
-  fun (u : unit) => fuzzLoopWith (updMaxDiscard (updMaxSuccess (updAnalysis stdArgs true) num_tests) num_tests) arbitrary fuzz show test_prop_InsertInsert.
+  fun (u : unit) => fuzzLoopWith (updMaxDiscard (updMaxSuccess (updAnalysis stdArgs true) num_tests) num_discards) arbitrary fuzz show test_prop_InsertInsert.
 
 (*! FuzzChick test_prop_InsertInsert (test_prop_InsertInsert_fuzzer tt). *)
     
@@ -118,7 +119,7 @@ Definition test_prop_InsertDelete (tkkpv: Tree * Z * Z * Z)  :=
   prop_InsertDelete t k k' v.
 
 Definition test_prop_InsertDelete_fuzzer :=
-  fun (u : unit) => fuzzLoopWith (updMaxDiscard (updMaxSuccess (updAnalysis stdArgs true) num_tests) num_tests) arbitrary fuzz show test_prop_InsertDelete.
+  fun (u : unit) => fuzzLoopWith (updMaxDiscard (updMaxSuccess (updAnalysis stdArgs true) num_tests) num_discards) arbitrary fuzz show test_prop_InsertDelete.
 
 (*! FuzzChick test_prop_InsertDelete (test_prop_InsertDelete_fuzzer tt). *)
     
@@ -127,7 +128,7 @@ Definition test_prop_DeleteInsert (tkkpvp: Tree * Z * Z * Z) :=
   prop_DeleteInsert t k k' v'.
 
 Definition test_prop_DeleteInsert_fuzzer :=
-  fun (u : unit) => fuzzLoopWith (updMaxDiscard (updMaxSuccess (updAnalysis stdArgs true) num_tests) num_tests) arbitrary fuzz show test_prop_DeleteInsert.
+  fun (u : unit) => fuzzLoopWith (updMaxDiscard (updMaxSuccess (updAnalysis stdArgs true) num_tests) num_discards) arbitrary fuzz show test_prop_DeleteInsert.
 
 (*! FuzzChick test_prop_DeleteInsert (test_prop_DeleteInsert_fuzzer tt). *)
     
@@ -136,6 +137,6 @@ Definition test_prop_DeleteDelete (tkkp: Tree * Z * Z) :=
   prop_DeleteDelete t k k'.
 
 Definition test_prop_DeleteDelete_fuzzer :=
-  fun (u : unit) => fuzzLoopWith (updMaxDiscard (updMaxSuccess (updAnalysis stdArgs true) num_tests) num_tests) arbitrary fuzz show test_prop_DeleteDelete.
+  fun (u : unit) => fuzzLoopWith (updMaxDiscard (updMaxSuccess (updAnalysis stdArgs true) num_tests) num_discards) arbitrary fuzz show test_prop_DeleteDelete.
 
 (*! FuzzChick test_prop_DeleteDelete (test_prop_DeleteDelete_fuzzer tt). *)
@@ -21,7 +21,8 @@ Derive (Arbitrary, Fuzzy) for Expr.
 (* ManualExtract Expr.
 ManualExtract Typ. *)
 
-(*|toggle|*)Axiom num_tests : nat. Extract Constant num_tests => "max_int".
+Axiom num_tests : nat. Extract Constant num_tests => "(match Sys.getenv_opt ""ETNA_MAX_SUCCESS"" with Some n -> int_of_string n | None -> max_int)".
+Axiom num_discards : nat. Extract Constant num_discards => "(match Sys.getenv_opt ""ETNA_MAX_DISCARD"" with Some n -> int_of_string n | None -> max_int)".
 
 Definition test_prop_SinglePreserve (e: Expr) :=
     prop_SinglePreserve e.
@@ -29,7 +30,7 @@ Definition test_prop_SinglePreserve (e: Expr) :=
 
 
 Definition test_prop_SinglePreserve_fuzzer :=
-    fun (u : unit) => fuzzLoopWith (updMaxDiscard (updMaxSuccess (updAnalysis stdArgs true) num_tests) num_tests) arbitrary fuzz show test_prop_SinglePreserve.
+    fun (u : unit) => fuzzLoopWith (updMaxDiscard (updMaxSuccess (updAnalysis stdArgs true) num_tests) num_discards) arbitrary fuzz show test_prop_SinglePreserve.
     
 (*! FuzzChick test_prop_SinglePreserve (test_prop_SinglePreserve_fuzzer tt). *)
 
@@ -37,7 +38,7 @@ Definition test_prop_MultiPreserve (e: Expr) :=
     prop_MultiPreserve e.
 
 Definition test_prop_MultiPreserve_fuzzer :=
-    fun (u : unit) => fuzzLoopWith (updMaxDiscard (updMaxSuccess (updAnalysis stdArgs true) num_tests) num_tests) arbitrary fuzz show test_prop_MultiPreserve.
+    fun (u : unit) => fuzzLoopWith (updMaxDiscard (updMaxSuccess (updAnalysis stdArgs true) num_tests) num_discards) arbitrary fuzz show test_prop_MultiPreserve.
     
 (*! FuzzChick test_prop_MultiPreserve (test_prop_MultiPreserve_fuzzer tt). *)
     
@@ -6,13 +6,17 @@ module Strategy.Size where
 import Etna.Lib
 import Impl
 import Spec
+import Data.Maybe (fromMaybe)
 import Test.QuickCheck hiding (Result)
 
-n :: Int
-n = readEnv "BSTSIZE"
+-- The number of nodes: the size of the sweep point being run (see `SweepPoint`),
+-- or `BSTSIZE` outside of a sweep.
+nodes :: Gen Int
+nodes = fromMaybe (readEnv "BSTSIZE") <$> qcSweepParam pointSize
 
 instance Arbitrary BST where
   arbitrary = do
+    n <- nodes
     ks <- map Key . take n <$> shuffle [1 .. 2 * n]
     vs <- map Val <$> vectorOf n arbitrary
     return $ foldr (uncurry insert) E (zip ks vs)
@@ -26,7 +30,7 @@ instance Arbitrary BST where
         | otherwise = T l k' v r
 
 instance Arbitrary Key where
-  arbitrary = Key <$> choose (1, 2 * n)
+  arbitrary = nodes >>= \n -> Key <$> choose (1, 2 * n)
 
 instance Arbitrary Val where
   arbitrary = Val <$> arbitrary
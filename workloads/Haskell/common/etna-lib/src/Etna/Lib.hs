@@ -1,5 +1,7 @@
 module Etna.Lib
-  ( module Etna.Lib.TH,
+  ( module Etna.Lib.Measure,
+    module Etna.Lib.Profile,
+    module Etna.Lib.TH,
     module Etna.Lib.Trial,
     module Etna.Lib.Types,
     module Etna.Lib.Util,
@@ -9,6 +11,8 @@ module Etna.Lib
   )
 where
 
+import Etna.Lib.Measure
+import Etna.Lib.Profile
 import Etna.Lib.Strategy.LeanCheck
 import Etna.Lib.Strategy.QuickCheck
 import Etna.Lib.Strategy.SmallCheck
@@ -0,0 +1,127 @@
+{-# LANGUAGE RecordWildCards #-}
+
+module Etna.Lib.Measure
+  ( Meter,
+    newMeter,
+    measured,
+    withMeter,
+  )
+where
+
+import Control.Exception (evaluate)
+import Control.Monad (when)
+import Data.Char (isAlphaNum, isUpper)
+import Data.IORef (IORef, modifyIORef', newIORef, readIORef, writeIORef)
+import qualified Data.IntMap.Strict as IntMap
+import Data.List (foldl')
+import qualified Data.Map.Strict as Map
+import Etna.Lib.Types (ExpArgs (measure, reservoir), Result (..), ValStats (..))
+import Etna.Lib.Util (getExpArg)
+import System.IO.Unsafe (unsafePerformIO)
+import System.Random (randomRIO)
+
+-- Estimates the average size of the generated inputs, as the length
+-- of their `show`. Only every n-th input is measured, since showing
+-- an input costs about as much as generating it.
+--
+-- With a reservoir, the shown inputs are also sampled uniformly
+-- (Algorithm R), and summarized once the run is over.
+data Meter = Meter
+  { period :: Int,
+    capacity :: Int,
+    seen :: IORef Int,
+    sampled :: IORef Int,
+    totalSize :: IORef Integer,
+    kept :: IORef (IntMap.IntMap String)
+  }
+
+-- Returns a meter if measuring was requested in the `ExpArgs`.
+newMeter :: IO (Maybe Meter)
+newMeter = do
+  mperiod <- getExpArg measure
+  k <- maybe 0 (max 0) <$> getExpArg reservoir
+  case mperiod of
+    Nothing -> return Nothing
+    Just n -> Just <$> (Meter (max 1 n) k <$> newIORef 0 <*> newIORef 0 <*> newIORef 0 <*> newIORef IntMap.empty)
+
+-- Measures the input of a property, if it is sampled.
+measureInput :: Show a => Meter -> a -> IO ()
+measureInput Meter {..} a = do
+  n <- readIORef seen
+  writeIORef seen $! n + 1
+  when (n `mod` period == 0) $ do
+    let shown = show a
+    size <- evaluate (length shown)
+    i <- readIORef sampled
+    writeIORef sampled $! i + 1
+    modifyIORef' totalSize (+ fromIntegral size)
+    -- Keeps the i-th measured input with probability capacity / (i + 1).
+    when (capacity > 0) $
+      if i < capacity
+        then modifyIORef' kept (IntMap.insert i shown)
+        else do
+          j <- randomRIO (0, i)
+          when (j < capacity) $ modifyIORef' kept (IntMap.insert j shown)
+
+-- Wraps a property so that it measures its inputs.
+measured :: Show a => Maybe Meter -> (a -> b) -> (a -> b)
+measured Nothing f = f
+measured (Just meter) f = \a -> unsafePerformIO (measureInput meter a) `seq` f a
+{-# NOINLINE measured #-}
+
+-- Runs a strategy and fills in `valsize` and `valstats`.
+withMeter :: Maybe Meter -> IO Result -> IO Result
+withMeter Nothing run = run
+withMeter (Just Meter {..}) run = do
+  r <- run
+  s <- readIORef sampled
+  total <- readIORef totalSize
+  shown <- IntMap.elems <$> readIORef kept
+  let valsize
+        | s == 0 = Nothing
+        | otherwise = Just (fromIntegral total / fromIntegral s)
+      valstats
+        | null shown = Nothing
+        | otherwise = Just (summarize shown)
+  return r {valsize = valsize, valstats = valstats}
+
+summarize :: [String] -> ValStats
+summarize shown =
+  ValStats
+    { statsCount = length shown,
+      statsSizeMean = mean sizes,
+      statsSizeMax = maximum sizes,
+      statsDepthMean = mean depths,
+      statsDepthMax = maximum depths,
+      statsConstructors = Map.fromListWith (+) [(c, 1) | s <- shown, c <- constructors s]
+    }
+  where
+    sizes = map length shown
+    depths = map depth shown
+    mean xs = fromIntegral (sum xs) / fromIntegral (length xs)
+
+-- Nesting depth of brackets, which follows the depth of the value
+-- for derived `Show` instances.
+depth :: String -> Int
+depth = fst . foldl' step (0, 0)
+  where
+    step (d, cur) c
+      | c `elem` "([{" = (max d (cur + 1), cur + 1)
+      | c `elem` ")]}" = (d, cur - 1)
+      | otherwise = (d, cur)
+
+-- Capitalized identifiers outside of string literals.
+constructors :: String -> [String]
+constructors [] = []
+constructors s@(c : cs)
+  | isUpper c = let (name, rest) = span isIdent s in name : constructors rest
+  | isIdent c = constructors (dropWhile isIdent cs)
+  | c == '"' = constructors (skipString cs)
+  | otherwise = constructors cs
+  where
+    isIdent x = isAlphaNum x || x == '_' || x == '\''
+
+    skipString ('\\' : _ : xs) = skipString xs
+    skipString ('"' : xs) = xs
+    skipString (_ : xs) = skipString xs
+    skipString [] = []
@@ -0,0 +1,75 @@
+{-# LANGUAGE RecordWildCards #-}
+
+module Etna.Lib.Profile
+  ( Profiler,
+    newProfiler,
+    timeCheck,
+    timeCheckPure,
+    withProfile,
+  )
+where
+
+import Control.Exception (evaluate)
+import Data.IORef (IORef, modifyIORef', newIORef, readIORef, writeIORef)
+import Etna.Lib.Types (ExpArgs (profile), Result (..))
+import Etna.Lib.Util (getExpArg)
+import System.Clock (Clock (..), getTime, toNanoSecs)
+import System.IO.Unsafe (unsafePerformIO)
+
+-- Splits the time of a run into generating inputs and checking them.
+-- Only every n-th check is timed (and scaled up), so that reading
+-- the clock does not distort the results.
+data Profiler = Profiler
+  { period :: Int,
+    checks :: IORef Int,
+    sampled :: IORef Int,
+    sampledNanos :: IORef Integer
+  }
+
+-- Returns a profiler if profiling was requested in the `ExpArgs`.
+newProfiler :: IO (Maybe Profiler)
+newProfiler = do
+  mperiod <- getExpArg profile
+  case mperiod of
+    Nothing -> return Nothing
+    Just n -> Just <$> (Profiler (max 1 n) <$> newIORef 0 <*> newIORef 0 <*> newIORef 0)
+
+-- Runs a check, timing it if it is sampled.
+-- The check should force its result.
+timeCheck :: Maybe Profiler -> IO a -> IO a
+timeCheck Nothing check = check
+timeCheck (Just Profiler {..}) check = do
+  n <- readIORef checks
+  writeIORef checks $! n + 1
+  if n `mod` period /= 0
+    then check
+    else do
+      t1 <- getTime Monotonic
+      a <- check
+      t2 <- getTime Monotonic
+      modifyIORef' sampled (+ 1)
+      modifyIORef' sampledNanos (+ (toNanoSecs t2 - toNanoSecs t1))
+      return a
+
+-- For frameworks with pure properties (i.e. LeanCheck).
+timeCheckPure :: Maybe Profiler -> (a -> Bool) -> (a -> Bool)
+timeCheckPure Nothing f = f
+timeCheckPure profiler f = unsafePerformIO . timeCheck profiler . evaluate . f
+{-# NOINLINE timeCheckPure #-}
+
+-- Runs a strategy and fills in `gentime` and `checktime`.
+-- Everything that is not checking counts as generating.
+withProfile :: Maybe Profiler -> IO Result -> IO Result
+withProfile Nothing run = run
+withProfile (Just Profiler {..}) run = do
+  t1 <- getTime Monotonic
+  r <- run
+  t2 <- getTime Monotonic
+  n <- readIORef checks
+  s <- readIORef sampled
+  ns <- readIORef sampledNanos
+  let total = fromIntegral (toNanoSecs t2 - toNanoSecs t1) * 1e-9
+      check
+        | s == 0 = 0
+        | otherwise = fromIntegral ns * 1e-9 * fromIntegral n / fromIntegral s
+  return r {gentime = Just (max 0 (total - check)), checktime = Just (min total check)}
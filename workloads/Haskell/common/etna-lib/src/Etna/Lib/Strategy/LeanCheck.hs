@@ -2,12 +2,18 @@
 
 module Etna.Lib.Strategy.LeanCheck (lcRun) where
 
+import Etna.Lib.Measure
+import Etna.Lib.Profile
 import Etna.Lib.Types
+import Etna.Lib.Util (getExpArg, getSweepParam)
+import Control.Monad (when)
 import Data.Char (isDigit)
 import Data.List (find, isInfixOf)
-import Data.Maybe (fromJust)
+import Data.Maybe (fromJust, fromMaybe, isJust, listToMaybe, mapMaybe)
+import System.IO (hPutStrLn, stderr)
 import System.IO.Silently (capture_)
 import Test.LeanCheck
+import Text.Read (readMaybe)
 import Text.Regex.TDFA
 
 makeProp :: Approach -> Task a -> (a -> Bool)
@@ -20,6 +26,43 @@ makeProp Correct task =
 
 lcRun :: (Show a, Listable a) => Approach -> Int -> Strategy a
 lcRun app cap task = do
+  profiler <- newProfiler
+  meter <- newMeter
+  cap' <- fromMaybe cap <$> getExpArg max_success
+  cap'' <- fromMaybe cap' <$> getSweepParam pointCap
+  discard <- getExpArg max_discard
+  -- `checkFor` does not count discards, let alone stop after some of them.
+  when (isJust discard) $
+    hPutStrLn stderr "max_discard is not supported by LeanCheck strategies; ignoring it"
+  keys <- fromMaybe [] <$> getExpArg replay_keys
+  withMeter meter $ withProfile profiler $
+    case listToMaybe (mapMaybe (lcReplay app task) (mapMaybe readMaybe keys)) of
+      Just r -> return r
+      Nothing -> lcRun' profiler meter app cap'' task
+
+-- Checks a stored counterexample, i.e. the input at the same position
+-- of the enumeration, without checking the ones before it.
+lcReplay :: (Show a, Listable a) => Approach -> Task a -> Int -> Maybe Result
+lcReplay app task i = do
+  x <- listToMaybe (drop i list)
+  if makeProp app task x
+    then Nothing
+    else
+      Just
+        Result
+          { foundbug = True,
+            passed = 0,
+            discards = Nothing,
+            output = show x,
+            gentime = Nothing,
+            checktime = Nothing,
+            valsize = Nothing,
+            valstats = Nothing,
+            replaykey = Just (show i)
+          }
+
+lcRun' :: (Show a, Listable a) => Maybe Profiler -> Maybe Meter -> Approach -> Int -> Strategy a
+lcRun' profiler meter app cap task = do
   out <- capture_ $ checkFor cap prop
   let foundbug = "Failed" `isInfixOf` out
       passed = getNumTests out - if foundbug then 1 else 0
@@ -27,9 +70,15 @@ lcRun app cap task = do
       output = case lines out of
         (_ : o : _) -> o
         _ -> ""
+      gentime = Nothing
+      checktime = Nothing
+      valsize = Nothing
+      valstats = Nothing
+      -- The counterexample is the input after the ones that passed.
+      replaykey = if foundbug then Just (show passed) else Nothing
   return Result {..}
   where
-    prop = makeProp app task
+    prop = measured meter $ timeCheckPure profiler $ makeProp app task
 
     getNumTests :: String -> Int
     getNumTests out = read $ extractGroup out "([0-9]+) test"
@@ -10,15 +10,25 @@ module Etna.Lib.Strategy.QuickCheck
     qcMakeResult,
     qcRunArb,
     qcRunArb',
+    qcSweepParam,
     backtrack,
   )
 where
 
+import Control.Exception (evaluate)
+import Data.IORef
+import Data.Maybe (fromMaybe, mapMaybe)
+import Etna.Lib.Measure
+import Etna.Lib.Profile
 import Etna.Lib.Types
-import Etna.Lib.Util (maxCap)
+import Etna.Lib.Util (getExpArg, getSweepParam, maxCap)
 import System.IO.Silently (capture)
+import System.IO.Unsafe (unsafePerformIO)
+import Text.Read (readMaybe)
 import Test.QuickCheck hiding (Result)
+import Test.QuickCheck.Gen (Gen (MkGen))
 import qualified Test.QuickCheck as QC
+import qualified Test.QuickCheck.Property as QCP
 
 -- To use QuickCheck, can just implement an Arbitrary instance
 -- and call (qcRunArb qcDefaults [approach]), where approach
@@ -46,15 +56,83 @@ qcMakeResult ioresult = do
           Failure {failingTestCase = [ex]} -> (True, ex)
           NoExpectedFailure {} -> (True, "")
           r -> (False, "")
+      -- Replaying the seed and size of the failing test generates it again.
+      replaykey = case result of
+        Failure {usedSeed = seed, usedSize = size} -> Just $ show (seed, size)
+        _ -> Nothing
       discards = Just $ numDiscarded result
       passed = numTests result - (if foundbug then 1 else 0)
+      gentime = Nothing
+      checktime = Nothing
+      valsize = Nothing
+      valstats = Nothing
   return Result {..}
 
 qcRunArb :: (Show a, Arbitrary a) => Args -> Approach -> Strategy a
 qcRunArb args app = qcRunArb' args . qcMakeProp app
 
 qcRunArb' :: (Show a, Arbitrary a) => Args -> (a -> Property) -> IO Result
-qcRunArb' args prop = qcMakeResult $ quickCheckWithResult args prop
+qcRunArb' args prop = do
+  profiler <- newProfiler
+  meter <- newMeter
+  args' <- withBounds args
+  discard <- getExpArg max_discard
+  let run args'' = do
+        capped <- capDiscards discard
+        qcMakeResult $ quickCheckWithResult args'' (capped $ property $ timeProp profiler . measured meter prop)
+  keys <- fromMaybe [] <$> getExpArg replay_keys
+  -- Check the stored counterexamples first, then generate as usual.
+  let replayAll [] = run args'
+      replayAll (r : rs) = do
+        replayed <- run args' {replay = Just r, maxSuccess = 1}
+        if foundbug replayed then return replayed else replayAll rs
+  withMeter meter $
+    withProfile profiler $
+      replayAll (mapMaybe readMaybe keys)
+
+-- Overrides the number of tests and discards with the bounds in the `ExpArgs`.
+-- QuickCheck bounds discards by a ratio, so round it up; `capDiscards`
+-- enforces the bound itself.
+withBounds :: Args -> IO Args
+withBounds args = do
+  success <- getExpArg max_success
+  discard <- getExpArg max_discard
+  let args' = maybe args (\n -> args {maxSuccess = n}) success
+      ratio d = max 1 ((d + maxSuccess args' - 1) `div` max 1 (maxSuccess args'))
+  return $ maybe args' (\d -> args' {maxDiscardRatio = ratio d}) discard
+
+-- A parameter of the sweep point being run, for generators that take it
+-- (e.g. a size for part of the input); read again every time it is generated.
+qcSweepParam :: (SweepPoint -> Maybe a) -> Gen (Maybe a)
+qcSweepParam f = MkGen $ \_ n -> unsafePerformIO (n `seq` getSweepParam f)
+{-# NOINLINE qcSweepParam #-}
+
+-- Gives up after `limit` discarded tests, by aborting on the last one.
+capDiscards :: Maybe Int -> IO (Property -> Property)
+capDiscards Nothing = return id
+capDiscards (Just limit) = do
+  count <- newIORef (0 :: Int)
+  let cap (QCP.MkProp rose) = QCP.MkProp $
+        QCP.IORose $ do
+          QCP.MkRose res ts <- QCP.reduceRose rose
+          case QCP.ok res of
+            Nothing -> do
+              n <- atomicModifyIORef' count (\n -> (n + 1, n + 1))
+              return $ QCP.MkRose res {QCP.abort = QCP.abort res || n >= limit} ts
+            _ -> return $ QCP.MkRose res ts
+  return $ \(QCP.MkProperty gen) -> QCP.MkProperty (cap <$> gen)
+
+-- Times the evaluation of a property (but not the generation of its inputs).
+timeProp :: Maybe Profiler -> Property -> Property
+timeProp Nothing prop = prop
+timeProp profiler (QCP.MkProperty gen) = QCP.MkProperty (time <$> gen)
+  where
+    time (QCP.MkProp rose) = QCP.MkProp $
+      QCP.IORose $
+        timeCheck profiler $ do
+          rose'@(QCP.MkRose res _) <- QCP.reduceRose rose
+          mapM_ evaluate (QCP.ok res)
+          return rose'
 
 ---------
 
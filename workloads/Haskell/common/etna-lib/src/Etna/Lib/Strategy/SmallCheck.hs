@@ -6,10 +6,14 @@
 
 module Etna.Lib.Strategy.SmallCheck (scDefaults, scRun) where
 
+import Control.Exception (Exception, evaluate, throwIO, try)
+import Control.Monad (when)
 import Data.IORef
-import Data.Maybe (isJust)
+import Data.Maybe (fromMaybe, isJust)
+import Etna.Lib.Measure
+import Etna.Lib.Profile
 import Etna.Lib.Types
-import Etna.Lib.Util (maxCap)
+import Etna.Lib.Util (getExpArg, getSweepParam, maxCap)
 import Test.SmallCheck
 import Test.SmallCheck.Drivers
 import Test.SmallCheck.Series
@@ -19,30 +23,61 @@ type Args = (Depth, Cap)
 scDefaults :: Args
 scDefaults = (maxCap, maxCap)
 
-makeProp :: Approach -> Task a -> (a -> Property IO)
-makeProp Naive task =
+makeProp :: Maybe Profiler -> Approach -> Task a -> (a -> Property IO)
+makeProp Nothing Naive task =
   -- Filter based on precondition.
   test . uncurry (==>) . task
-makeProp Correct task =
+makeProp Nothing Correct task =
   -- Only evaluate postcondition.
   test . snd . task
+makeProp profiler Naive task = \a ->
+  let (pre, post) = task a
+   in timed pre ==> timed post
+  where
+    timed = monadic . timeCheck profiler . evaluate
+makeProp profiler Correct task =
+  monadic . timeCheck profiler . evaluate . snd . task
 
 scRun :: (Show a, Serial IO a) => Approach -> Args -> Strategy a
 scRun app (depth, cap) task = do
+  profiler <- newProfiler
+  meter <- newMeter
+  cap' <- fromMaybe cap <$> getExpArg max_success
+  discard <- getExpArg max_discard
+  depth' <- fromMaybe depth <$> getSweepParam pointDepth
+  cap'' <- fromMaybe cap' <$> getSweepParam pointCap
+  withMeter meter $ withProfile profiler $ scRun' profiler meter app (depth', cap'') discard task
+
+-- Thrown by the hook to stop after `max_discard` discarded tests.
+data DiscardLimit = DiscardLimit deriving (Show)
+
+instance Exception DiscardLimit
+
+scRun' :: (Show a, Serial IO a) => Maybe Profiler -> Maybe Meter -> Approach -> Args -> Maybe Int -> Strategy a
+scRun' profiler meter app (depth, cap) discard task = do
   good <- newIORef 0
   bad <- newIORef 0
-  final <- smallCheckWithHook depth (update good bad) prop
+  final <- try $ smallCheckWithHook depth (update good bad) prop
 
   let (foundbug, output) = case final of
-        Nothing -> (False, "")
-        Just (CounterExample (ex : _) _) -> (True, ex)
-        Just _ -> (True, "")
+        Left DiscardLimit -> (False, "")
+        Right Nothing -> (False, "")
+        Right (Just (CounterExample (ex : _) _)) -> (True, ex)
+        Right (Just _) -> (True, "")
   passed <- (\i -> i - if foundbug then 1 else 0) <$> readIORef good
   discards <- Just <$> readIORef bad
+  let gentime = Nothing
+      checktime = Nothing
+      valsize = Nothing
+      valstats = Nothing
+      replaykey = Nothing -- monadic series cannot skip to a counterexample
   return Result {..}
   where
-    prop = over (limit cap series) (makeProp app task)
+    prop = over (limit cap series) (measured meter $ makeProp profiler app task)
 
     update good bad = \case
       GoodTest -> modifyIORef good (+ 1)
-      BadTest -> modifyIORef bad (+ 1)
\ No newline at end of file
+      BadTest -> do
+        modifyIORef bad (+ 1)
+        n <- readIORef bad
+        when (maybe False (n >=) discard) $ throwIO DiscardLimit
\ No newline at end of file
@@ -3,7 +3,8 @@
 
 module Etna.Lib.TH (mkStrategies, mkMain) where
 
-import Etna.Lib.Types (ExpArgs (..), Result)
+import Control.Monad (forM_)
+import Etna.Lib.Types (ExpArgs (..), Result, SweepPoint (..))
 import Language.Haskell.TH
 
 mkStrategies :: Q Exp -> [Name] -> Q [Dec]
@@ -29,10 +30,23 @@ mkMain ims ips = do
     main :: IO ()
     main = do
       args <- getArgs
-      let ExpArgs file trials workload strategy mutant prop label timeout =
-            parseExpArgs (head args)
-          test = fromJust $ lookup (strategy, prop) mmap
-      run file trials (workload, label, mutant, prop) timeout test
+      let expArgs = parseExpArgs (head args)
+          test = fromJust $ lookup (strategy expArgs, property expArgs) mmap
+      setExpArgs expArgs
+      let runAs l =
+            run
+              (file expArgs)
+              (trials expArgs)
+              (workload expArgs, l, mutant expArgs, property expArgs)
+              (timeout expArgs)
+              test
+      case sweep expArgs of
+        Nothing -> runAs (label expArgs)
+        Just points ->
+          -- One result per point, sharing the process (and its heap).
+          forM_ points $ \point -> do
+            setSweepPoint point
+            runAs (pointLabel point)
 
     mmap :: [((String, String), IO Result)]
     mmap = $(listE (map mkPair mps))
@@ -29,7 +29,12 @@ data FullResult = FullResult
     passed :: Maybe Int,
     discards :: Maybe Int,
     time :: Double,
-    output :: String
+    output :: String,
+    gentime :: Maybe Double,
+    checktime :: Maybe Double,
+    valsize :: Maybe Double,
+    valstats :: Maybe B.ValStats,
+    replaykey :: Maybe String
   }
   deriving (Generic)
 
@@ -61,6 +66,11 @@ runOne (workload, strategy, mutant, property) mtimeout test = do
           passed = Nothing,
           discards = Nothing,
           output = "",
+          gentime = Nothing,
+          checktime = Nothing,
+          valsize = Nothing,
+          valstats = Nothing,
+          replaykey = Nothing,
           ..
         }
 
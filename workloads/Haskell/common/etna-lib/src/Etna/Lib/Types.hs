@@ -2,18 +2,39 @@
 
 module Etna.Lib.Types where
 
-import Data.Aeson (FromJSON)
+import Data.Aeson (FromJSON (..), Options (..), ToJSON (..), camelTo2, defaultOptions, genericParseJSON, genericToJSON)
+import Data.Char (toLower)
 import Data.Functor
+import Data.Map.Strict (Map)
 import GHC.Generics
 
 data Result = Result
   { foundbug :: Bool,
     passed :: Int,
     discards :: Maybe Int,
-    output :: String
+    output :: String,
+    gentime :: Maybe Double, -- estimated time spent generating inputs (when profiling)
+    checktime :: Maybe Double, -- estimated time spent checking properties (when profiling)
+    valsize :: Maybe Double, -- average length of the shown inputs (when measuring)
+    valstats :: Maybe ValStats, -- summary of a sample of the inputs (when measuring with a reservoir)
+    replaykey :: Maybe String -- how the strategy can find the counterexample again (see `replay_keys`)
   }
   deriving (Show)
 
+-- Summary of a reservoir sample of the inputs of a run, from their `show`.
+data ValStats = ValStats
+  { statsCount :: Int, -- inputs in the sample
+    statsSizeMean :: Double,
+    statsSizeMax :: Int,
+    statsDepthMean :: Double, -- nesting depth of brackets
+    statsDepthMax :: Int,
+    statsConstructors :: Map String Int -- occurrences of each constructor in the sample
+  }
+  deriving (Generic, Show)
+
+instance ToJSON ValStats where
+  toJSON = genericToJSON defaultOptions {fieldLabelModifier = camelTo2 '_' . drop (length "stats")}
+
 type Cap = Int
 
 type PropPair = (Bool, Bool) -- (precondition, postcondition)
@@ -37,8 +58,28 @@ data ExpArgs = ExpArgs
     mutant :: String,
     property :: String,
     label :: String,
-    timeout :: Maybe Double
+    timeout :: Maybe Double,
+    profile :: Maybe Int, -- time every n-th check to split time into generating and checking
+    measure :: Maybe Int, -- measure the size of every n-th input
+    reservoir :: Maybe Int, -- keep a uniform sample of this many measured inputs
+    replay_keys :: Maybe [String], -- check these stored counterexamples before generating
+    max_success :: Maybe Int, -- bound on the number of tests, overriding the strategy's own
+    max_discard :: Maybe Int, -- bound on the number of discarded tests (ignored by LeanCheck)
+    sweep :: Maybe [SweepPoint] -- run once per point, in the same process
+  }
+  deriving (Generic, Show)
+
+instance FromJSON ExpArgs
+
+-- Generator parameters for one point of a sweep.
+-- Parameters that are not provided keep the value chosen by the strategy.
+data SweepPoint = SweepPoint
+  { pointLabel :: String, -- strategy label recorded in the results
+    pointSize :: Maybe Int, -- size, for QuickCheck generators that read it (see `qcSweepParam`)
+    pointDepth :: Maybe Int, -- SmallCheck depth
+    pointCap :: Maybe Int -- number of tests (SmallCheck and LeanCheck)
   }
   deriving (Generic, Show)
 
-instance FromJSON ExpArgs
\ No newline at end of file
+instance FromJSON SweepPoint where
+  parseJSON = genericParseJSON defaultOptions {fieldLabelModifier = map toLower . drop (length "point")}
\ No newline at end of file
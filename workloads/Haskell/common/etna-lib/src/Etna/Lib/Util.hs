@@ -5,15 +5,20 @@ module Etna.Lib.Util
   ( maxCap,
     readEnv,
     parseExpArgs,
+    setExpArgs,
+    getExpArg,
+    setSweepPoint,
+    getSweepParam,
     allProps,
     mapExample,
     mapExample',
   )
 where
 
-import Etna.Lib.Types (ExpArgs, Result (..))
+import Etna.Lib.Types (ExpArgs, Result (..), SweepPoint)
 import Data.Aeson (decode)
 import Data.Char (isAlphaNum, isSpace)
+import Data.IORef (IORef, newIORef, readIORef, writeIORef)
 import Data.List (elemIndex, isPrefixOf, nub)
 import Data.String (fromString)
 import GHC.IO (unsafePerformIO)
@@ -32,6 +37,29 @@ parseExpArgs s = case decode . fromString $ s of
   Nothing -> error $ "Could not parse " ++ s
   Just a -> a
 
+-- Arguments of the current run, so that strategies can read
+-- runtime options without changing their types.
+currentArgs :: IORef (Maybe ExpArgs)
+currentArgs = unsafePerformIO $ newIORef Nothing
+{-# NOINLINE currentArgs #-}
+
+setExpArgs :: ExpArgs -> IO ()
+setExpArgs = writeIORef currentArgs . Just
+
+getExpArg :: (ExpArgs -> Maybe a) -> IO (Maybe a)
+getExpArg f = (>>= f) <$> readIORef currentArgs
+
+-- Point of the sweep being run, if any.
+currentPoint :: IORef (Maybe SweepPoint)
+currentPoint = unsafePerformIO $ newIORef Nothing
+{-# NOINLINE currentPoint #-}
+
+setSweepPoint :: SweepPoint -> IO ()
+setSweepPoint = writeIORef currentPoint . Just
+
+getSweepParam :: (SweepPoint -> Maybe a) -> IO (Maybe a)
+getSweepParam f = (>>= f) <$> readIORef currentPoint
+
 -- Closely adapted from Test.QuickCheck.All
 allProps :: String -> IO [String]
 allProps file = do